@@ -0,0 +1,57 @@
+## Import time benchmark for MDgen
+## Imports the light entry points in fresh interpreters and fails if any of them takes longer than the budget
+## or pulls in one of the heavy dependencies, which should only be imported when they are actually used
+## Usage: python benchmarks/import_time.py [budget in ms]
+
+import os
+import re
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Statement to run -> the modules that must not be imported by it
+TARGETS = {
+    "from MDgen.base import ReadMe": ["numpy", "matplotlib", "github", "MDgen.chart.piechart", "MDgen.profile.git_colors"],
+    "import MDgen": ["numpy", "matplotlib", "github", "MDgen.base", "MDgen.profile"],
+    "from MDgen.chart import ColorInfo, ChartInfo": ["numpy", "matplotlib", "github"],
+    "import MDgen.profile": ["numpy", "matplotlib", "github", "MDgen.profile.git_colors"],
+}
+
+DEFAULT_BUDGET_MS = 30
+RUNS = 5
+
+def measure(statement: str) -> tuple[float, set[str]]:
+    """Returns the cumulative import time of the MDgen modules in ms (best of several runs) and the set of modules imported"""
+    env = dict(os.environ, PYTHONPATH = SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    best = float("inf")
+    modules: set[str] = set()
+    for _ in range(RUNS):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env = env, capture_output = True, text = True, check = True)
+        total = 0
+        modules = set()
+        for line in result.stderr.splitlines():
+            m = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+            if m is None:
+                continue
+            modules.add(m.group(4))
+            # Top level imports have no indentation, so their cumulative times add up to the total
+            if m.group(3) == " " and m.group(4).startswith("MDgen"):
+                total += int(m.group(2))
+        best = min(best, total / 1000)
+    return best, modules
+
+def run(budget_ms: float) -> bool:
+    ok = True
+    for statement, forbidden in TARGETS.items():
+        ms, modules = measure(statement)
+        leaked = [m for m in forbidden if m in modules]
+        passed = ms <= budget_ms and not leaked
+        ok = ok and passed
+        print(f"{'ok  ' if passed else 'FAIL'} {ms:8.2f} ms  {statement}" + (f"  (imported {', '.join(leaked)})" if leaked else ""))
+    return ok
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    print(f"Import time budget: {budget} ms")
+    sys.exit(0 if run(budget) else 1)
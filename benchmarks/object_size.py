@@ -0,0 +1,39 @@
+## Memory benchmark for the chart and language info classes
+## Makes many objects of each class and prints the average number of bytes each one takes
+## Usage: python benchmarks/object_size.py [number of objects]
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from MDgen.chart.colorinfo import ColorInfo
+from MDgen.chart.chartinfo import ChartInfo
+from MDgen.profile.git_language_info import GitLanguageInfo
+
+def measure(make, n: int) -> float:
+    """Returns the average number of bytes allocated per object made by make(i)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [make(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Do not count the list holding the objects
+    return (after - before - sys.getsizeof(objs)) / n
+
+def run(n: int):
+    # The strings and extension lists are shared between objects just like they are when read from the color table
+    names = [f"Language {i % 500}" for i in range(500)]
+    colors = [f"#{i % 500:06x}" for i in range(500)]
+    exts = [[".a", ".b", ".c"] for _ in range(500)]
+    cases = {
+        "ColorInfo": lambda i: ColorInfo(colors[i % 500], names[i % 500]),
+        "ChartInfo": lambda i: ChartInfo(float(i), ColorInfo(colors[i % 500], names[i % 500])),
+        "GitLanguageInfo": lambda i: GitLanguageInfo(colors[i % 500], names[i % 500], exts[i % 500], "programming", i),
+    }
+    for name, make in cases.items():
+        print(f"{name:16} {measure(make, n):8.1f} bytes per object")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
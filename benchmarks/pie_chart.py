@@ -0,0 +1,40 @@
+## Rendering benchmark for PieChart
+## Makes charts with more and more slices and prints how long the slice geometry and the whole chart take (best of several runs)
+## Usage: python benchmarks/pie_chart.py [largest number of slices]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from MDgen.chart.colorinfo import ColorInfo
+from MDgen.chart.chartinfo import ChartInfo
+from MDgen.chart.piechart import PieChart
+
+RUNS = 5
+
+def best(f) -> float:
+    """Returns the shortest time of f() in ms"""
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def run(largest: int):
+    rng = random.Random(0)
+    n = 10
+    print(f"{'slices':>8} {'paths (ms)':>12} {'content (ms)':>14}")
+    while n <= largest:
+        entries = [ChartInfo(rng.random(), ColorInfo(f"#{rng.randrange(1 << 24):06x}", f"Entry {i}")) for i in range(n)]
+        chart = PieChart(200, entries)
+        paths = best(lambda: chart.getPaths(100, 100))
+        content = best(lambda: "".join(chart.render_chunks()))
+        print(f"{n:>8} {paths:>12.2f} {content:>14.2f}")
+        n *= 10
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
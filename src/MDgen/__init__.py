@@ -1,3 +1,28 @@
-from MDgen.base import ReadMe, Tagged, Point, Image, Hyperlink, CurrentDate, CurrentTime
-from MDgen.util import copy
-from MDgen.chart import ColorInfo, ChartInfo, PieChart
\ No newline at end of file
+## Everything is imported lazily on first use so that importing MDgen stays cheap
+from typing import TYPE_CHECKING
+from MDgen.util import lazy_attributes
+
+__all__ = ["ReadMe", "Tagged", "Point", "Image", "Hyperlink", "CurrentDate", "CurrentTime", "copy", "ColorInfo", "ChartInfo", "PieChart", "ChartTable", "RenderCache", "RENDER_CACHE"]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ReadMe": "MDgen.base",
+    "Tagged": "MDgen.base",
+    "Point": "MDgen.base",
+    "Image": "MDgen.base",
+    "Hyperlink": "MDgen.base",
+    "CurrentDate": "MDgen.base",
+    "CurrentTime": "MDgen.base",
+    "copy": "MDgen.util",
+    "ColorInfo": "MDgen.chart.colorinfo",
+    "ChartInfo": "MDgen.chart.chartinfo",
+    "PieChart": "MDgen.chart.piechart",
+    "ChartTable": "MDgen.chart.chart_table",
+    "RenderCache": "MDgen.render_cache",
+    "RENDER_CACHE": "MDgen.render_cache",
+})
+
+if TYPE_CHECKING:
+    from MDgen.base import ReadMe, Tagged, Point, Image, Hyperlink, CurrentDate, CurrentTime
+    from MDgen.util import copy
+    from MDgen.chart import ColorInfo, ChartInfo, PieChart, ChartTable
+    from MDgen.render_cache import RenderCache, RENDER_CACHE
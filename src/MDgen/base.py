@@ -3,103 +3,321 @@
 ## This class contains the "add" mutator method (which allows method chaining)
 ## and contains the "export" method. These two methods allow for customization of
 ## the markdown file like arranging subfiles
+## Added contents are kept as a tree of nodes and only rendered when the content is asked for.
+## Every node caches its own output (also when it is streamed into its parent or a file), and mutating a node marks it
+## and all of its parents dirty, so only the changed parts are rendered again
+## Nodes render themselves as a stream of string chunks, so a document is written out while it is rendered
+## On top of that, shared nodes (Tagged, Hyperlink, Image and PieChart) keep their output in the process wide RENDER_CACHE
+## under a key made from their inputs, so identical nodes in different documents are only rendered once
 
 from __future__ import annotations
 import os
-import matplotlib.pyplot as plt
-import numpy as np
-from typing import Any, Generator, Optional
+import weakref
+from typing import IO, Any, Generator, Hashable, Iterable, Iterator, Optional
 from abc import ABC, abstractmethod as virtual
 from datetime import datetime
 
-from MDgen.util import rm
+from MDgen.util import write_if_changed
+from MDgen.render_cache import RENDER_CACHE, make_key
 
 class ReadMe:
-    """This wrapper class generates the read me file"""    
+    """This wrapper class generates the read me file"""
+    ## Set this to False on nodes whose output changes without being mutated (like the current time)
+    ## These nodes and all their parents are rendered again every time instead of being cached
+    static: bool = True
+    ## Set this to True on nodes that show up the same in many documents (like icons and links) to keep their output
+    ## in the process wide RENDER_CACHE. The other nodes only cache their output for themselves
+    shared: bool = False
+    
+    ## Documents can have tens of thousands of nodes, so the nodes are slotted. Subclasses without __slots__ still get a __dict__
+    __slots__ = ("_children", "_cache", "_key", "_parents", "_dynamic", "__weakref__")
+    
     def __init__(self, content = ""):
+        self._cache: str | None = None
+        self._key: bytes | None = None
+        ## A weak reference to the one parent almost every node has, or a WeakSet once a node is added to a second parent
+        self._parents: weakref.ref[ReadMe] | weakref.WeakSet[ReadMe] | None = None
+        self._dynamic = False
         self._content = content
     
+    ## Any assignment to a public attribute (like Hyperlink.url) changes the output, so drop the cache
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+    
+    @property
+    def _content(self) -> str:
+        """The inner content of this node, which is its own text followed by everything added to it"""
+        return "".join(self._iter_content())
+    
+    def _iter_content(self) -> Iterator[str]:
+        for c in self._children:
+            if isinstance(c, str):
+                yield c
+            else:
+                yield from c.iter_chunks()
+    
+    @_content.setter
+    def _content(self, value: str):
+        self._children: list[ReadMe | str] = [value]
+        self._dynamic = not self.static
+        self.invalidate()
+    
     def add(self, *contents: ReadMe, newline: bool = False):
         """Add contents to read me. If the newline variable is set to true, then add a newline character between every readme content"""
-        for c in contents:
-            if isinstance(c, ReadMe):
-                self._content += c.content
-            if newline:
-                self._content += "\n"
+        return self.extend(contents, newline = newline)
+    
+    def extend(self, contents: Iterable[ReadMe], newline: bool = False):
+        """Same as add, but takes an iterable (for example a generator) of read me contents instead"""
+        children = self._children
+        try:
+            for c in contents:
+                if isinstance(c, ReadMe):
+                    c._attach(self)
+                    children.append(c)
+                if newline:
+                    children.append("\n")
+        finally:
+            # Whatever was added before an error is kept, so the cache has to go either way
+            self.invalidate()
         return self
     
+    def _attach(self, parent: ReadMe):
+        parents = self._parents
+        if parents is None:
+            self._parents = weakref.ref(parent)
+        elif isinstance(parents, weakref.ref):
+            first = parents()
+            if first is None:
+                self._parents = weakref.ref(parent)
+            elif first is not parent:
+                self._parents = weakref.WeakSet((first, parent))
+        else:
+            parents.add(parent)
+        if self._dynamic:
+            parent._mark_dynamic()
+    
+    def _mark_dynamic(self):
+        if self._dynamic:
+            return
+        self._dynamic = True
+        for p in self._iter_parents():
+            p._mark_dynamic()
+    
+    def _iter_parents(self) -> Iterable[ReadMe]:
+        parents = self._parents
+        if parents is None:
+            return ()
+        if isinstance(parents, weakref.ref):
+            p = parents()
+            return () if p is None else (p,)
+        return parents
+    
+    def invalidate(self):
+        """Marks this node and everything containing it as dirty. Call this after mutating a node in place,
+        for example after appending to a list attribute"""
+        # Keep going even if this node has no cache, since a parent can come from the shared cache without its children being rendered
+        self._cache = None
+        self._key = None
+        for p in self._iter_parents():
+            p.invalidate()
+    
+    def render_chunks(self) -> Iterator[str]:
+        """Renders this node from scratch as a stream of string chunks. Subclasses should override this
+        instead of content so the output can be cached and streamed"""
+        yield from self._iter_content()
+    
+    def cache_key(self) -> Hashable | None:
+        """Key of this node's output, made of everything the output depends on, so two nodes with the same key always
+        render the same text. It is used for shared nodes, and for the keys of the shared nodes containing this one
+        None keeps the node (and everything containing it) out of the shared cache
+        A subclass that overrides render_chunks is left out unless it also overrides this"""
+        if type(self).render_chunks is not ReadMe.render_chunks:
+            return None
+        return self._children_key(type(self))
+    
+    def _children_key(self, *fields: Hashable) -> Hashable | None:
+        keys: list[Hashable] = list(fields)
+        for c in self._children:
+            if isinstance(c, str):
+                keys.append(c)
+            else:
+                k = c._get_key()
+                if k is None:
+                    return None
+                keys.append(k)
+        return tuple(keys)
+    
+    def _get_key(self) -> bytes | None:
+        if self._key is not None:
+            return self._key
+        if self._dynamic or type(self).content is not ReadMe.content:
+            return None
+        key = self.cache_key()
+        if key is None:
+            return None
+        # The key is kept as a digest until the node changes, the parents put it in their own keys
+        self._key = make_key(key)
+        return self._key
+    
+    def _shared(self, key: bytes | None) -> str | None:
+        # Looks up the output of an identical node rendered before, and keeps it as this node's cache
+        if key is None:
+            return None
+        text = RENDER_CACHE.get(key)
+        if text is not None:
+            self._cache = text
+        return text
+    
+    def _store(self, key: bytes | None, text: str):
+        self._cache = text
+        if key is not None:
+            RENDER_CACHE.put(key, text)
+    
+    def iter_chunks(self) -> Iterator[str]:
+        """Yields the content piece by piece. Cached nodes yield their cached output, otherwise the node is
+        rendered on the fly without joining the chunks together"""
+        if type(self).content is not ReadMe.content:
+            # Older subclasses override content instead of render_chunks, their output is whatever it returns
+            yield self.content
+            return
+        if self._cache is not None:
+            yield self._cache
+            return
+        key = self._get_key() if self.shared else None
+        text = self._shared(key)
+        if text is not None:
+            yield text
+            return
+        if self._dynamic:
+            yield from self.render_chunks()
+            return
+        # Keep the chunks on the side to cache them once the whole node went through. If the stream is not read to
+        # the end, nothing is cached
+        chunks: list[str] = []
+        for chunk in self.render_chunks():
+            yield chunk
+            chunks.append(chunk)
+        self._store(key, "".join(chunks))
+    
+    def write_to(self, f: IO[str]):
+        """Writes the content into a file object chunk by chunk"""
+        for chunk in self.iter_chunks():
+            f.write(chunk)
+    
     @property
     def content(self) -> str:
-        return self._content
+        if self._cache is not None:
+            return self._cache
+        key = self._get_key() if self.shared else None
+        content = self._shared(key)
+        if content is not None:
+            return content
+        content = "".join(self.render_chunks())
+        if not self._dynamic:
+            self._store(key, content)
+        return content
     
     ## Overload for convenience in print statements
     def __repr__(self):
         return self.content    
 
-    def export(self, path: str):
-        # Delete the existing read me file
-        rm(path)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(self.content)
+    def export(self, path: str) -> bool:
+        """Writes the read me into path. The file is replaced atomically and left untouched if the content did not change.
+        Returns whether the file is written"""
+        return write_if_changed(path, self.iter_chunks)
             
     def __copy__(self) -> ReadMe:
         return ReadMe(self._content)
 
 class Tagged(ReadMe):
+    __slots__ = ("tag", "info")
+    shared = True
     def __init__(self, content: str, tag: str, info: str):
-        self._content = content
+        super().__init__(content)
         self.tag = tag
         self.info = info 
         
-    @property
-    def content(self):
-        return f'<{self.tag} {self.info}>{self._content}</{self.tag}>'
+    def render_chunks(self):
+        yield f'<{self.tag} {self.info}>'
+        yield from self._iter_content()
+        yield f'</{self.tag}>'
+    
+    def cache_key(self):
+        if type(self).render_chunks is not Tagged.render_chunks:
+            return None
+        return self._children_key(type(self), self.tag, self.info)
     
     def __copy__(self):
         return Tagged(self.content, self.tag, self.info)
    
 class Point(ReadMe):
-    @property
-    def content(self):
-        return f"- {self._content}"
+    __slots__ = ()
+    def render_chunks(self):
+        yield "- "
+        yield from self._iter_content()
+    
+    def cache_key(self):
+        if type(self).render_chunks is not Point.render_chunks:
+            return None
+        return self._children_key(type(self))
     
 class Hyperlink(ReadMe):
+    __slots__ = ("text", "url")
+    shared = True
     def __init__(self, text: str, url: str):
+        super().__init__()
         self.text = text
         self.url = url
     
-    @property
-    def content(self):
-        return f"[{self.text}]({self.url})"
+    def render_chunks(self):
+        yield f"[{self.text}]({self.url})"
+    
+    def cache_key(self):
+        if type(self).render_chunks is not Hyperlink.render_chunks:
+            return None
+        return (type(self), self.text, self.url)
     
     def __copy__(self):
         return Hyperlink(self.text, self.url)
     
 class Image(ReadMe):
+    __slots__ = ("imageurl", "linkurl", "alttext")
+    shared = True
     def __init__(self, linkurl: str, imageurl: str, alttext: Optional[str] = None):
+        super().__init__()
         self.imageurl = imageurl
         self.linkurl = linkurl
         self.alttext = alttext if alttext else linkurl
     
-    @property
-    def content(self):
-        return f'<a href="{self.linkurl}" target="blank"><img align="center" src="{self.imageurl}" alt="{self.alttext}" height="30" width="40" /></a>'
+    def render_chunks(self):
+        yield f'<a href="{self.linkurl}" target="blank"><img align="center" src="{self.imageurl}" alt="{self.alttext}" height="30" width="40" /></a>'
+    
+    def cache_key(self):
+        if type(self).render_chunks is not Image.render_chunks:
+            return None
+        return (type(self), self.linkurl, self.imageurl, self.alttext)
 
     def __copy__(self):
         return Image(self.linkurl, self.imageurl, self.alttext)
 
 class CurrentDate(ReadMe):
+    __slots__ = ()
+    static = False
+    
     def __init__(self):
-        pass
+        super().__init__()
         
-    @property
-    def content(self) -> str:
-        return datetime.now().strftime("%d/%m/%Y")
+    def render_chunks(self):
+        yield datetime.now().strftime("%d/%m/%Y")
 
 class CurrentTime(ReadMe):
+    __slots__ = ()
+    static = False
+    
     def __init__(self):
-        pass
+        super().__init__()
         
-    @property
-    def content(self) -> str:
-        return datetime.now().strftime("%H:%M:%S")
+    def render_chunks(self):
+        yield datetime.now().strftime("%H:%M:%S")
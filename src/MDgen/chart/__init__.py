@@ -1,3 +1,17 @@
-from MDgen.chart.chartinfo import ChartInfo
-from MDgen.chart.colorinfo import ColorInfo
-from MDgen.chart.piechart import PieChart
\ No newline at end of file
+from typing import TYPE_CHECKING
+from MDgen.util import lazy_attributes
+
+__all__ = ["ChartInfo", "ColorInfo", "PieChart", "ChartTable"]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ChartInfo": "MDgen.chart.chartinfo",
+    "ColorInfo": "MDgen.chart.colorinfo",
+    "PieChart": "MDgen.chart.piechart",
+    "ChartTable": "MDgen.chart.chart_table",
+})
+
+if TYPE_CHECKING:
+    from MDgen.chart.chartinfo import ChartInfo
+    from MDgen.chart.colorinfo import ColorInfo
+    from MDgen.chart.piechart import PieChart
+    from MDgen.chart.chart_table import ChartTable
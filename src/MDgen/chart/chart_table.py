@@ -0,0 +1,135 @@
+### This module contains the columnar input of the charts
+### Instead of one ChartInfo and one ColorInfo per entry, a ChartTable keeps an array of amounts next to a list of colors
+### and a list of names, so big charts can be made (and bucketed) without making an object per entry
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from MDgen.chart.chartinfo import ChartInfo
+from MDgen.chart.colorinfo import ColorInfo, parse_hex
+
+class ChartTable:
+    __slots__ = ("amounts", "colors", "names")
+    def __init__(self, amounts: Sequence[float] | np.ndarray, colors: Sequence[str], names: Sequence[str]):
+        """The entries of a chart as three columns of the same length: the amounts, the hex codes of the colors, and the names
+        The colors have to be #RGB or #RRGGBB like for ColorInfo, anything else raises a ValueError"""
+        self.amounts = np.asarray(amounts, dtype = np.float64)
+        self.colors = list(colors)
+        self.names = list(names)
+        if not len(self.amounts) == len(self.colors) == len(self.names):
+            raise ValueError(f"The columns have different lengths: {len(self.amounts)} amounts, {len(self.colors)} colors and {len(self.names)} names")
+        # Checked here instead of when the chart is drawn. Charts use few distinct colors, so each one is only parsed once
+        for color in set(self.colors):
+            parse_hex(color)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[ChartInfo]) -> ChartTable:
+        entries = entries if isinstance(entries, Sequence) else list(entries)
+        amounts = np.fromiter((v.amount for v in entries), dtype = np.float64, count = len(entries))
+        return cls(amounts, [v.color.color for v in entries], [v.color.name for v in entries])
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[float, str, str]]) -> ChartTable:
+        """Makes the table from (amount, color, name) rows, which can come from a generator"""
+        amounts: list[float] = []
+        colors: list[str] = []
+        names: list[str] = []
+        for amount, color, name in rows:
+            amounts.append(amount)
+            colors.append(color)
+            names.append(name)
+        return cls(amounts, colors, names)
+
+    @classmethod
+    def from_mapping(cls, amounts: Mapping[str, float], colors: Mapping[str, str | ColorInfo] | Callable[[str], str | ColorInfo | None]) -> ChartTable:
+        """Makes the table from a mapping of names to amounts (like GitUser.total_languages). colors gives the color of
+        each name, as a hex code or a ColorInfo (so git_colors.COLORS can be used directly). Names without a color are left out"""
+        get = colors.get if isinstance(colors, Mapping) else colors
+        table_amounts: list[float] = []
+        table_colors: list[str] = []
+        names: list[str] = []
+        for name, amount in amounts.items():
+            color = get(name)
+            if color is None:
+                continue
+            table_amounts.append(amount)
+            table_colors.append(color if isinstance(color, str) else color.color)
+            names.append(name)
+        return cls(table_amounts, table_colors, names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def total(self) -> float:
+        # Added up one by one like sum() does, so the chart comes out the same as when it is made from ChartInfos
+        return sum(self.amounts.tolist())
+
+    def take(self, indices: np.ndarray) -> ChartTable:
+        """The rows at the given indices, in that order"""
+        idx = indices.tolist()
+        return ChartTable(self.amounts[indices], [self.colors[i] for i in idx], [self.names[i] for i in idx])
+
+    def to_entries(self) -> list[ChartInfo]:
+        return [ChartInfo(a, ColorInfo(c, n)) for a, c, n in zip(self.amounts.tolist(), self.colors, self.names)]
+
+    def select(self, total: float, max_slices: int | None = None, min_ratio: float = 0., keep: np.ndarray | None = None, others: ColorInfo | None = None) -> ChartTable:
+        """Sorts the rows from the biggest to the smallest (equal rows keep their order) and puts the ones that are not
+        kept into a last "Others" row, which is only added if something went into it
+        keep is a boolean mask of the rows to keep, min_ratio drops the rows smaller than that fraction of the total, and
+        max_slices keeps only the biggest rows so that there are at most that many rows, "Others" included
+        Raises a ValueError if max_slices is less than 1 or min_ratio is not between 0 and 1"""
+        if max_slices is not None and max_slices < 1:
+            raise ValueError(f"max_slices has to be at least 1, not {max_slices}")
+        if not 0 <= min_ratio <= 1:
+            raise ValueError(f"min_ratio has to be between 0 and 1, not {min_ratio}")
+        amounts = self.amounts
+        other_sum = 0.
+        dropped = False
+        idx = np.arange(len(amounts))
+        if keep is not None or min_ratio > 0:
+            mask = np.ones(len(amounts), dtype = bool) if keep is None else np.array(keep, dtype = bool)
+            if min_ratio > 0:
+                mask &= amounts >= min_ratio * total
+            other_sum += sum(amounts[~mask].tolist())
+            dropped = not mask.all()
+            idx = np.flatnonzero(mask)
+
+        kept = amounts[idx]
+        # If "Others" is already drawn, it takes up one of the slices
+        limit = max_slices - 1 if max_slices is not None and dropped and other_sum > 0 else max_slices
+        if limit is not None and len(idx) > limit:
+            top = largest(kept, max_slices - 1)
+            rest = np.ones(len(kept), dtype = bool)
+            rest[top] = False
+            other_sum += sum(kept[rest].tolist())
+            dropped = True
+            idx = idx[top]
+        else:
+            idx = idx[np.argsort(-kept, kind = "stable")]
+
+        table = self.take(idx)
+        if dropped and other_sum > 0:
+            others = others or ColorInfo("#DEDEDE", "Others")
+            table.amounts = np.append(table.amounts, other_sum)
+            table.colors.append(others.color)
+            table.names.append(others.name)
+        return table
+
+    def __repr__(self):
+        return f"ChartTable({len(self)} rows)"
+
+def largest(amounts: np.ndarray, k: int) -> np.ndarray:
+    """The indices of the k biggest amounts from the biggest to the smallest, in linear time with a partition
+    Like sorted, equal amounts keep their order, and the first ones are taken when only some of them fit"""
+    n = len(amounts)
+    if k <= 0:
+        return np.zeros(0, dtype = np.intp)
+    if k >= n:
+        return np.argsort(-amounts, kind = "stable")
+    kth = np.partition(amounts, n - k)[n - k]
+    greater = np.flatnonzero(amounts > kth)
+    equal = np.flatnonzero(amounts == kth)[:k - len(greater)]
+    top = np.concatenate((greater, equal))
+    return top[np.argsort(-amounts[top], kind = "stable")]
@@ -1,28 +1,111 @@
 from __future__ import annotations
+import sys
 import random
+from functools import lru_cache
+from typing import Sequence
+
+@lru_cache(maxsize = 4096)
+def parse_hex(color: str) -> int:
+    """Parses a hex code like "#FF0000" or its short form "#F00" into a 24 bit integer 0xRRGGBB
+    Raises a ValueError for anything else. The same colors come up again and again, so the results are cached"""
+    digits = color[1:]
+    # int would also take things like "+f" or "1_0", so check the digits first
+    if color[:1] != "#" or len(digits) not in (3, 6) or not all(d in "0123456789abcdefABCDEF" for d in digits):
+        raise ValueError(f"{color!r} is not a #RGB or #RRGGBB color")
+    if len(digits) == 3:
+        digits = "".join(d * 2 for d in digits)
+    return int(digits, base = 16)
+
+def rgb_luminance(rgb: int) -> float:
+    """Perceived brightness of a packed color, from 0 to 255"""
+    return 0.299 * (rgb >> 16) + 0.587 * ((rgb >> 8) & 0xFF) + 0.114 * (rgb & 0xFF)
+
+@lru_cache(maxsize = 4096)
+def luminance(color: str) -> float:
+    return rgb_luminance(parse_hex(color))
+
+def is_dark(color: str, threshold: float = 0.65) -> bool:
+    """Whether text on top of the color (a hex code like "#FF0000") should be white rather than black"""
+    return luminance(color) <= threshold * 255
 
 class ColorInfo:
     """Color is the hex code of the color, name is the entry in the chart with said color
-    For example, ColorInfo("#FF0000", "Hiya!") will give you an entry in the chart, with red plots and name 'Hiya!'"""
+    For example, ColorInfo("#FF0000", "Hiya!") will give you an entry in the chart, with red plots and name 'Hiya!'
+    The color can be given as #RRGGBB or #RGB, anything else raises a ValueError. It is parsed once into rgb (0xRRGGBB)"""
+    __slots__ = ("_color", "name", "_rgb", "_luminance")
     def __init__(self, color: str, name: str):
         self.color = color
-        self.name = name
+        # The same colors and names show up in many charts, so intern them to keep one copy of each string around
+        self.name = sys.intern(name)
+    
+    @property
+    def color(self) -> str:
+        return self._color
     
+    @color.setter
+    def color(self, color: str):
+        # Parsed before anything is set, so an invalid color leaves the old one in place
+        self._rgb = parse_hex(color)
+        self._color = sys.intern(color)
+        self._luminance: float | None = None
+    
+    @property
+    def rgb(self) -> int:
+        """The color packed as 0xRRGGBB, set color to change it"""
+        return self._rgb
+
     @classmethod
     def random(cls, name: str, *, lower_bound: int = 0, upper_bound: int = 255) -> ColorInfo:
         """Generate a random color for testing purposes
         lower bound and upper bound are bounds for the color values to prevent generating colors that are too bright or too dim"""
-        r = str(hex(random.randint(lower_bound, upper_bound)))[2:]
-        g = str(hex(random.randint(lower_bound, upper_bound)))[2:]
-        b = str(hex(random.randint(lower_bound, upper_bound)))[2:]
-        color = f"#{r}{g}{b}"
+        r = random.randint(lower_bound, upper_bound)
+        g = random.randint(lower_bound, upper_bound)
+        b = random.randint(lower_bound, upper_bound)
+        color = f"#{r:02x}{g:02x}{b:02x}"
         return cls(color, name)
-    
+
+    @classmethod
+    def random_batch(cls, n: int, seed: int | None = None, *, names: Sequence[str] | None = None, lower_bound: int = 0, upper_bound: int = 255) -> list[ColorInfo]:
+        """Generate n random colors at once, the same ones for the same seed. The names are "Color 0", "Color 1"... unless given
+        Same bounds as random"""
+        import numpy as np
+        if names is not None and len(names) != n:
+            raise ValueError(f"Got {len(names)} names for {n} colors")
+        rng = np.random.default_rng(seed)
+        channels = rng.integers(lower_bound, upper_bound, size = (3, n), endpoint = True, dtype = np.int64)
+        packed = ((channels[0] << 16) | (channels[1] << 8) | channels[2]).tolist()
+        colors = []
+        for i, rgb in enumerate(packed):
+            # Made from the packed value, so there is nothing to parse or validate
+            c = object.__new__(cls)
+            c._rgb = rgb
+            c._color = f"#{rgb:06x}"
+            c.name = sys.intern(names[i] if names is not None else f"Color {i}")
+            c._luminance = None
+            colors.append(c)
+        return colors
+
+    @property
+    def red(self) -> int:
+        return self.rgb >> 16
+
+    @property
+    def green(self) -> int:
+        return (self.rgb >> 8) & 0xFF
+
+    @property
+    def blue(self) -> int:
+        return self.rgb & 0xFF
+
+    @property
+    def luminance(self) -> float:
+        """Perceived brightness of the color, from 0 to 255"""
+        if self._luminance is None:
+            self._luminance = rgb_luminance(self.rgb)
+        return self._luminance
+
     def isDark(self, threshold: float = 0.65):
-        r = int(self.color[1:3], base = 16)
-        g = int(self.color[3:5], base = 16)
-        b = int(self.color[5:7], base = 16)
-        return 0.299 * r + 0.587 * g + 0.114 * b <= threshold * 255
-    
+        return self.luminance <= threshold * 255
+
     def __copy__(self):
         return ColorInfo(self.color, self.name)
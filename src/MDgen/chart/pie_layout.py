@@ -0,0 +1,72 @@
+### This module computes where the slices of a pie chart go, for all the slices at once with numpy
+from __future__ import annotations
+from typing import Iterator, Sequence
+
+import numpy as np
+
+# Taken off the end of every slice so adjacent slices of similar colors overlap a bit and there are no dark borders between them
+OVERLAP = 0.005
+
+# A slice this big is drawn as three overlapping arcs covering 0 - 40%, 30 - 70% and 60 - 100% of it, since an svg arc
+# of more than half a circle would be drawn the wrong way around with the flags we use
+SPLIT_RATIO = 0.49
+SPLIT_POINTS = (0.3, 0.4, 0.6, 0.7)
+
+class PieLayout:
+    __slots__ = ("ratios", "starts", "ends", "split", "_sin", "_cos", "_split_sin", "_split_cos")
+    def __init__(self, amounts: Sequence[float] | np.ndarray, total: float):
+        """The angles of the slices of a pie chart, going clockwise from the top. Every slice starts where the last one
+        ended (minus the overlap) and the last slice always closes the circle
+        The points are kept on the unit circle, points() moves and scales them for a chart"""
+        self.ratios = np.asarray(amounts, dtype = np.float64) / total
+        angles = 2 * np.pi * self.ratios
+        n = len(angles)
+
+        # The start of each slice is the sum of the angles of the slices before it
+        self.starts = np.zeros(n)
+        if n > 1:
+            np.cumsum(angles[:-1] - OVERLAP, out = self.starts[1:])
+        self.ends = self.starts + angles
+        if n:
+            self.ends[-1] = 0.
+        self.split = self.ratios >= SPLIT_RATIO
+
+        # Sines and cosines of the start and end of every slice, plus the points inside the split slices (there are at most two of them)
+        bounds = np.stack((self.starts, self.ends), axis = 1)
+        self._sin = np.sin(bounds)
+        self._cos = np.cos(bounds)
+        inner = self.starts[self.split, None] + np.multiply.outer(angles[self.split], SPLIT_POINTS)
+        self._split_sin = np.sin(inner)
+        self._split_cos = np.cos(inner)
+
+    def __len__(self) -> int:
+        return len(self.ratios)
+
+    def points(self, mid_x: float, mid_y: float, radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """The x and y coordinates of the start and end of every slice for a chart centered on (mid_x, mid_y)"""
+        return mid_x + radius * self._sin, mid_y - radius * self._cos
+
+    def split_points(self, mid_x: float, mid_y: float, radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """The x and y coordinates of the points at SPLIT_POINTS inside every split slice"""
+        return mid_x + radius * self._split_sin, mid_y - radius * self._split_cos
+
+    def iter_paths(self, colors: Sequence[str], mid_x: float, mid_y: float, radius: float) -> Iterator[str]:
+        """Yields the svg paths of the slices, filled with the given colors"""
+        xs, ys = self.points(mid_x, mid_y, radius)
+        # Python floats print the same way as before and are faster to format than numpy ones
+        x0, x1 = xs.T.tolist()
+        y0, y1 = ys.T.tolist()
+        sx, sy = (a.tolist() for a in self.split_points(mid_x, mid_y, radius))
+        split = np.flatnonzero(self.split).tolist()
+        center = f"M{mid_x},{mid_y}"
+        arc = f"A{mid_x},{mid_y},0,0,1"
+        for i, color in enumerate(colors):
+            if split and split[0] == i:
+                split.pop(0)
+                x, y = sx.pop(0), sy.pop(0)
+                # 0 - 40%, 30 - 70%, 60 - 100%
+                yield f'<path d="{center} L{x0[i]},{y0[i]} {arc},{x[1]},{y[1]} Z" fill="{color}"></path>'
+                yield f'<path d="{center} L{x[0]},{y[0]} {arc},{x[3]},{y[3]} Z" fill="{color}"></path>'
+                yield f'<path d="{center} L{x[2]},{y[2]} {arc},{x1[i]},{y1[i]} Z" fill="{color}"></path>'
+            else:
+                yield f'<path d="{center} L{x0[i]},{y0[i]} {arc},{x1[i]},{y1[i]} Z" fill="{color}"></path>'
@@ -1,139 +1,166 @@
 from abc import ABC, abstractmethod as virtual
 from math import sin, cos
 import random
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Sequence
+
+import numpy as np
 
 from MDgen.base import ReadMe
 from MDgen.chart.chartinfo import ChartInfo
-from MDgen.chart.colorinfo import ColorInfo
-from MDgen.util import copy
-
-PI = 3.1415926
+from MDgen.chart.colorinfo import ColorInfo, is_dark
+from MDgen.chart.chart_table import ChartTable
+from MDgen.chart.pie_layout import PieLayout
+from MDgen.util import write_if_changed
 
 class PieChart(ReadMe):
-    def __init__(self, chart_size: int, entries: list[ChartInfo], use_columns: bool = True, ignore_key: Callable[[ChartInfo, float], bool] | None = None): # type: ignore
+    shared = True
+    _entries: list[ChartInfo] | None = None
+    _layout: PieLayout | None = None
+    
+    def __init__(self, chart_size: int, entries: Iterable[ChartInfo] | ChartTable, use_columns: bool = True, ignore_key: Callable[[ChartInfo, float], bool] | None = None, max_slices: int | None = None, min_ratio: float = 0.): # type: ignore
         """Generates a pie chart in the markdown file. If use_columns is set to true, then legends are put in columns
         chart_size = Size of the chart on the html
-        entries: List of Chart info entries to generate the chart
+        entries: List of Chart info entries to generate the chart, or a ChartTable with the same data in columns, which is
+            faster for big charts since no object is made per entry
         use_columns: if set to true, then the legends are put on the side. Otherwise the legends are put at the bottom
         ignore_key: A callable function that ignore some entries and sweep them into the "Others" category. The lambda takes in
             the chart info c and the overall percentage f, returns a boolean on whether to make the entry represent in others. Default (None)
-            is to not ignore any entries."""
+            is to not ignore any entries.
+        max_slices: Draw at most this many slices, "Others" included. The biggest entries are kept and the rest go into "Others"
+        min_ratio: Entries smaller than this fraction of the total (for example 0.01 for 1%) go into "Others"
+        The "Others" slice is only drawn if something went into it"""
+        super().__init__()
         self.size = chart_size
         self.col = use_columns
         
-        if ignore_key is None:
-            ignore_key: Callable[[ChartInfo, float], bool] = lambda c, f: False
+        self.table = self.make_table(entries, ignore_key, max_slices, min_ratio)
         
-        self.sum_total = sum(v.amount for v in entries)
-            
-        self.entries = self.make_entries(entries, ignore_key)
+        # The slices are laid out once on the unit circle here, and only scaled when the chart is drawn at some size
+        self._layout = PieLayout(self.table.amounts, self.sum_total)
+    
+    def __setattr__(self, name: str, value):
+        object.__setattr__(self, name, value)
+        if name in ("table", "sum_total"):
+            # Lay the slices out again if they change, but not if only the size or the legend does
+            self._layout = None
+            if name == "table":
+                self._entries = None
+        if not name.startswith("_"):
+            ReadMe.invalidate(self)
+    
+    def invalidate(self):
+        """Also lays the slices out again, call this after changing the entries in place"""
+        if self._entries is not None:
+            self.entries = self._entries
+        self._layout = None
+        super().invalidate()
+    
+    @property
+    def entries(self) -> list[ChartInfo]:
+        """The slices as ChartInfos, from the biggest to the smallest. They are only made when asked for, the chart itself uses self.table"""
+        if self._entries is None:
+            self._entries = self.table.to_entries()
+        return self._entries
+    
+    @entries.setter
+    def entries(self, entries: list[ChartInfo]):
+        """The entries are taken as they are (not sorted or bucketed again), and the total is added up from them"""
+        self.table = ChartTable.from_entries(entries)
+        self.sum_total = self.table.total()
+        self._entries = entries
+    
+    def make_table(self, entries: Iterable[ChartInfo] | ChartTable, ignore_key: Callable[[ChartInfo, float], bool] | None = None, max_slices: int | None = None, min_ratio: float = 0.) -> ChartTable:
+        """Sets the total and returns the sorted slices, with the small ones swept into "Others" """
+        if not isinstance(entries, (ChartTable, Sequence)):
+            # A generator can only be read once, and ignore_key needs the entries again after the table is made
+            entries = list(entries)
+        table = entries if isinstance(entries, ChartTable) else ChartTable.from_entries(entries)
+        self.sum_total = table.total()
         
-
-    def make_entries(self, entries: list[ChartInfo], ignore_key: Callable[[ChartInfo, float], bool]):
         # We basically need to call ignore key here otherwise stuff down there will mess up
-        ent: list[ChartInfo] = []
-        other_sum = 0.
-        for i, v in enumerate(entries):
-            ratio = v.amount / self.sum_total
-            if ignore_key(v, ratio):
-                other_sum += v.amount
-            else:
-                ent.append(copy(v))
+        keep = None
+        if ignore_key is not None:
+            infos = table.to_entries() if isinstance(entries, ChartTable) else entries
+            keep = np.fromiter((not ignore_key(v, v.amount / self.sum_total) for v in infos), dtype = bool, count = len(table))
         
-        ent.sort(key = lambda x: x.amount, reverse = True)
-        ent.append(ChartInfo(other_sum, ColorInfo("#DEDEDE", "Others")))
-        return ent
+        return table.select(self.sum_total, max_slices, min_ratio, keep)
+    
+    def make_entries(self, entries: list[ChartInfo], ignore_key: Callable[[ChartInfo, float], bool] | None = None, max_slices: int | None = None, min_ratio: float = 0.) -> list[ChartInfo]:
+        return self.make_table(entries, ignore_key, max_slices, min_ratio).to_entries()
     
     def get_angles(self, a: float, mid_x: float, mid_y: float) -> tuple[float, float]:
         return mid_x + self.size//2 * sin(a), mid_y - self.size//2 * cos(a)
     
-    def getPaths(self, mid_x: float, mid_y: float) -> tuple[list[str], int]:
-        # Second loop to draw the chart
-        paths = []
-        
-        last_angle = 0.
+    def getLayout(self) -> PieLayout:
+        """The angles of all the slices on the unit circle, shared by every size and format the chart is drawn in"""
+        if self._layout is None:
+            self._layout = PieLayout(self.table.amounts, self.sum_total)
+        return self._layout
+    
+    def getPaths(self, mid_x: float, mid_y: float, size: int | None = None) -> tuple[list[str], int]:
+        size = self.size if size is None else size
+        paths = list(self.getLayout().iter_paths(self.table.colors, mid_x, mid_y, size//2))
         
         # Keep track of the longest length to calculate the legend width
-        longest_word_len = 0
-        
-        for i, v in enumerate(self.entries):
-            ratio = v.amount / self.sum_total
-            angle = 2 * PI * ratio
-            
-            # Calculate the new angles
-            if i == len(self.entries) - 1:
-                new_x, new_y = self.get_angles(0, mid_x, mid_y)
-            else:
-                new_x, new_y = self.get_angles(last_angle + angle, mid_x, mid_y)
-            
-            last_x, last_y = self.get_angles(last_angle, mid_x, mid_y)
-            
-            # There is a bug where if the ratio is larger than 0.5 in the pie chart
-            # Then the path might be something unexpected.
-            # To fix this we perform linear interpolation, to cover the distances:
-            # 0 - 40%, 30 - 70%, 60 - 100%
-            if ratio >= 0.49:
-                f30_x, f30_y = self.get_angles(last_angle + 0.3 * angle, mid_x, mid_y)
-                f40_x, f40_y = self.get_angles(last_angle + 0.4 * angle, mid_x, mid_y)
-                f60_x, f60_y = self.get_angles(last_angle + 0.6 * angle, mid_x, mid_y)
-                f70_x, f70_y = self.get_angles(last_angle + 0.7 * angle, mid_x, mid_y)
-                paths += [
-                    f'<path d="M{mid_x},{mid_y} L{last_x},{last_y} A{mid_x},{mid_y},0,0,1,{f40_x},{f40_y} Z" fill="{v.color.color}"></path>',
-                    f'<path d="M{mid_x},{mid_y} L{f30_x},{f30_y} A{mid_x},{mid_y},0,0,1,{f70_x},{f70_y} Z" fill="{v.color.color}"></path>',
-                    f'<path d="M{mid_x},{mid_y} L{f60_x},{f60_y} A{mid_x},{mid_y},0,0,1,{new_x},{new_y} Z" fill="{v.color.color}"></path>'
-                ]
-            else:
-                paths.append(
-                    f'<path d="M{mid_x},{mid_y} L{last_x},{last_y} A{mid_x},{mid_y},0,0,1,{new_x},{new_y} Z" fill="{v.color.color}"></path>'
-                )
-            
-            # To minimize black borders for adjacent similar colors
-            last_angle += angle - 0.005
-            
-            longest_word_len = max(longest_word_len, len(v.color.name))
+        longest_word_len = max(map(len, self.table.names), default = 0)
         
         return paths, longest_word_len
 
-    def getChart(self, paths: list[str]):
+    def getChart(self, paths: list[str], size: int | None = None):
+        return "".join(self.iterChart(paths, size))
+    
+    def iterChart(self, paths: list[str], size: int | None = None) -> Iterator[str]:
         # Use an HTML table to display the pie chart along with the legend
-        chart = f'<div id="shape">\n\t<svg height="{self.size}" width="{self.size}">\n'
-        chart += "\n".join([f"\t\t{p}" for p in paths])
-        chart += '\n\t</svg>\n</div>'
-        return chart
+        size = self.size if size is None else size
+        yield f'<div id="shape">\n\t<svg height="{size}" width="{size}">\n'
+        for i, p in enumerate(paths):
+            yield f"\t\t{p}" if i == 0 else f"\n\t\t{p}"
+        yield '\n\t</svg>\n</div>'
     
     def getVerticalLegend(self) -> list[str]:
-        legends = [f'<p><span style="background-color: {v.color.color};">&nbsp; &nbsp;</span> {v.color.name}: {round(v.amount / self.sum_total * 100, 2)}%</p>' for v in self.entries]
+        t = self.table
+        legends = [f'<p><span style="background-color: {color};">&nbsp; &nbsp;</span> {name}: {round(amount / self.sum_total * 100, 2)}%</p>' for amount, color, name in zip(t.amounts.tolist(), t.colors, t.names)]
         return legends
     
     def getSVGLegends(self) -> list[str]:
         legends = []
-        for v in self.entries:
-            bgColor = v.color.color
-            textColor = "#ffffff" if v.color.isDark() else "#000000"
-            l = f'<p><span style="background-color: {bgColor}; color: {textColor}">{v.color.name}</span>: {round(v.amount / self.sum_total * 100, 2)}%</p>'
+        t = self.table
+        for amount, bgColor, name in zip(t.amounts.tolist(), t.colors, t.names):
+            textColor = "#ffffff" if is_dark(bgColor) else "#000000"
+            l = f'<p><span style="background-color: {bgColor}; color: {textColor}">{name}</span>: {round(amount / self.sum_total * 100, 2)}%</p>'
             legends.append(l)
         return legends
     
     def getHorizontalLegend(self, entriesPerRow: int, padding: int) -> list[str]:
         legends = []
         currRow = ""
-        for i, v in enumerate(self.entries):
-            ratio = v.amount / self.sum_total
-            mock_text = f"    {v.color.name}: {round(ratio * 100, 2)}%"
-            currRow += f'<span style="background-color: {v.color.color};">&nbsp; &nbsp;</span> {v.color.name}: {round(ratio * 100, 2)}%'
+        t = self.table
+        for i, (amount, color, name) in enumerate(zip(t.amounts.tolist(), t.colors, t.names)):
+            ratio = amount / self.sum_total
+            mock_text = f"    {name}: {round(ratio * 100, 2)}%"
+            currRow += f'<span style="background-color: {color};">&nbsp; &nbsp;</span> {name}: {round(ratio * 100, 2)}%'
             currRow += "&nbsp; " * (padding - len(mock_text))
-            if i % entriesPerRow == entriesPerRow - 1 or i == len(self.entries) - 1:
+            if i % entriesPerRow == entriesPerRow - 1 or i == len(t) - 1:
                 legends.append(f'<p>{currRow}</p>')
                 currRow = ""
         return legends
     
-    @property
-    def content(self):
+    def cache_key(self):
+        if type(self).render_chunks is not PieChart.render_chunks:
+            return None
+        t = self.table
+        return (type(self), self.size, self.col, self.sum_total, t.amounts.tobytes(), t.colors, t.names)
+    
+    def render_chunks(self):
         """Content may not work on some SVG (for example GitHub ones). A compromise is to export the graph
         as an svg and then include the image in your Read Me. Use PieChart.exportAsSVG(filepath) for that."""
-        paths, longest_word_length = self.getPaths(self.size // 2, self.size // 2)
-        chart = self.getChart(paths)
+        yield from self.iterHTML()
+    
+    def iterHTML(self, size: int | None = None, paths: tuple[list[str], int] | None = None) -> Iterator[str]:
+        """Yields the chart and its legend as html, drawn at size (the chart size by default)
+        paths is what getPaths gives for that size, if it was already computed"""
+        size = self.size if size is None else size
+        paths, longest_word_length = paths or self.getPaths(size // 2, size // 2, size)
         
         if self.col:
             legend = self.getVerticalLegend()
@@ -143,12 +170,14 @@ class PieChart(ReadMe):
             chart_width = 100
             legend_width = 20 * longest_word_length + 100
             
-            table = f"""\
+            yield f"""\
 <table style="height: {height}px; width: {chart_width + legend_width}px; border-collapse: collapse; border-style: hidden;" border="1">
 <tbody>
 <tr style="height: {height}px;">
     <td style="width: {chart_width}px; height: {height}px;">
-{chart}
+"""
+            yield from self.iterChart(paths, size)
+            yield f"""
     </td>
     <td style="width: {legend_width}px; height: {height}px;">
 {legend}
@@ -158,40 +187,54 @@ class PieChart(ReadMe):
 </table>"""
         else:
             legend = self.getHorizontalLegend(3, longest_word_length + 10)
-            table = f"{chart}\n{legend}"""
-        
-        return table
+            yield from self.iterChart(paths, size)
+            yield f"\n{legend}"
     
-    def exportAsSVG(self, relativePath: str, hyperlink: str = "") -> ReadMe:
-        class SVGReadMe(ReadMe):
-            pass
-        svgReadMe = SVGReadMe(f"![{hyperlink}]({relativePath})")
-        
-        # Create the svg object
-        paths, longest_word = self.getPaths(self.size//2, self.size//2)
-        path = "\n".join(f"\t{p}" for p in paths)
+    def iterSVG(self, size: int | None = None, paths: tuple[list[str], int] | None = None) -> Iterator[str]:
+        """Yields the chart as a standalone svg file piece by piece, drawn at size (the chart size by default)
+        paths is what getPaths gives for that size, if it was already computed"""
+        size = self.size if size is None else size
+        paths, longest_word = paths or self.getPaths(size//2, size//2, size)
         
-        legends = self.getSVGLegends()
-        legend = "\n".join(f"\t\t{p}" for p in legends)
+        width = size + 25 * longest_word
+        height = max(35 * len(self.table), size)
+        svgHeightOffset = max((height - size) / 2, 0)
         
-        width = self.size + 25 * longest_word
-        height = max(35 * len(self.entries), self.size)
-        svgHeightOffset = max((height - self.size) / 2, 0)
-        
-        svg = f"""\
+        yield f"""\
 <svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
-<svg x="0" y="{svgHeightOffset}" height="{self.size}" width="{self.size}">
-{path}
+<svg x="0" y="{svgHeightOffset}" height="{size}" width="{size}">
+"""
+        for p in paths:
+            yield f"\t{p}\n"
+        yield f"""\
 </svg>
-<foreignObject x="{self.size + 30}" y="0" width="{width - self.size}" height="{height}">
+<foreignObject x="{size + 30}" y="0" width="{width - size}" height="{height}">
     <div xmlns="http://www.w3.org/1999/xhtml">
-{legend}
+"""
+        for l in self.getSVGLegends():
+            yield f"\t\t{l}\n"
+        yield """\
     </div>
 </foreignObject>
 </svg>
 """
-        with open(relativePath, 'w') as f:
-            f.write(svg)
+    
+    def renderSizes(self, sizes: Iterable[int]) -> dict[int, tuple[str, str]]:
+        """Draws the chart at every size, for example (150, 300) for 1x and 2x. Returns the html and the standalone svg
+        for each size. The slices are only laid out once, and the paths of each size are shared by both formats"""
+        result = {}
+        for size in sizes:
+            paths = self.getPaths(size//2, size//2, size)
+            result[size] = ("".join(self.iterHTML(size, paths)), "".join(self.iterSVG(size, paths)))
+        return result
+    
+    def exportAsSVG(self, relativePath: str, hyperlink: str = "", size: int | None = None) -> ReadMe:
+        class SVGReadMe(ReadMe):
+            pass
+        svgReadMe = SVGReadMe(f"![{hyperlink}]({relativePath})")
+        
+        # Write the svg object chunk by chunk, skipping the write if the file is already up to date
+        write_if_changed(relativePath, lambda: self.iterSVG(size))
         
         return svgReadMe
         
@@ -1,41 +1,136 @@
 # Source: https://github.com/ozh/github-colors/blob/master/colors.json
+from __future__ import annotations
+import os
+import sys
+import json
+import hashlib
 import yaml
-import re
 
-from MDgen.util import rm
+# The libyaml loader is several times faster, use it when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def run():
-    with open("./../languages.yml", 'r') as f:
-        dic: dict[str, dict] = yaml.safe_load(f)
-    
-    colorinfos = ""
+# Paths are relative to this file, so the script can be run from any directory
+HERE = os.path.dirname(os.path.abspath(__file__))
+YAML_PATH = os.path.join(HERE, "..", "languages.yml")
+COLORS_PATH = os.path.join(HERE, "..", "git_colors.json")
+INDEX_PATH = os.path.join(HERE, "..", "language_index.json")
+
+COLUMNS = ("name", "color", "type", "language_id", "extensions", "aliases", "filenames", "interpreters", "group")
+
+# Columns that are lists, which are left empty for the languages that do not have them
+LIST_COLUMNS = ("extensions", "aliases", "filenames", "interpreters")
+
+# Change this when the output changes, so the files are made again even if languages.yml did not change
+FORMAT_VERSION = 2
+
+# The most likely language for some ambiguous extensions, where the order below would pick a rarer language
+PREFERRED = {
+    ".rs": "Rust",
+    ".m": "Objective-C",
+    ".d": "D",
+    ".v": "Verilog",
+    ".yaml": "YAML",
+}
+
+def make_colors(dic: dict[str, dict]) -> dict[str, list]:
+    # Store the table column by column so that git_colors.py can load it in one go
+    # and only make the GitLanguageInfo objects that are actually used
+    columns: dict[str, list] = {c: [] for c in COLUMNS}
     
     for k, v in dic.items():
         try:
-            colorinfos += f"""\
-    "{k}": GitLanguageInfo(
-        color = "{v['color']}", 
-        language_type = "{v['type']}", 
-        language_id = {v['language_id']},
-        name = "{k}",
-        extension = {v['extensions']}
-    ),
-"""
+            row = (k, v['color'], v['type'], v['language_id'], v['extensions'])
         except KeyError:
             continue
+        row += tuple(v.get(c, []) for c in LIST_COLUMNS[1:]) + (v.get('group'),)
+        for c, x in zip(COLUMNS, row):
+            columns[c].append(x)
+    
+    return columns
+
+def make_index(dic: dict[str, dict]) -> dict[str, dict]:
+    # Reverse index from extensions, file names, interpreters and aliases to the languages using them
+    # Every key maps to a list of languages since keys can be ambiguous, for example .h is used by C, C++ and Objective-C
+    extensions: dict[str, list[str]] = {}
+    filenames: dict[str, list[str]] = {}
+    interpreters: dict[str, list[str]] = {}
+    aliases: dict[str, list[str]] = {}
+    types: dict[str, str] = {}
+    
+    def add(index: dict[str, list[str]], key: str, name: str):
+        names = index.setdefault(key, [])
+        if name not in names:
+            names.append(name)
     
-    rm("../git_colors.py")
+    # Languages go in front of the lists for their primary (first) extension, so they are preferred when the extension is ambiguous
+    # If several languages have the same primary extension, the ones with more extensions, file names and interpreters
+    # (which tend to be the more common languages) go first, unless PREFERRED says otherwise
+    # Extensions are matched case insensitively
+    def popularity(k: str) -> int:
+        v = dic[k]
+        return len(v.get('extensions', [])) + len(v.get('filenames', [])) + len(v.get('interpreters', []))
+    
+    for k in sorted(dic, key = lambda k: -popularity(k)):
+        if dic[k].get('extensions'):
+            add(extensions, dic[k]['extensions'][0].lower(), k)
+    
+    for k, v in dic.items():
+        types[k] = v.get('type')
+        for e in v.get('extensions', []):
+            add(extensions, e.lower(), k)
+        for f in v.get('filenames', []):
+            add(filenames, f, k)
+        for i in v.get('interpreters', []):
+            add(interpreters, i, k)
+        add(aliases, k.lower(), k)
+        for a in v.get('aliases', []):
+            add(aliases, a.lower(), k)
+    
+    for e, k in PREFERRED.items():
+        extensions[e].remove(k)
+        extensions[e].insert(0, k)
+    
+    return {
+        "types": types,
+        "extensions": extensions,
+        "filenames": filenames,
+        "interpreters": interpreters,
+        "aliases": aliases
+    }
+
+def dump(obj: dict, path: str):
+    with open(path, 'w', encoding = 'utf-8') as f:
+        json.dump(obj, f, ensure_ascii = False, separators = (',', ':'))
+
+def source_hash(data: bytes) -> str:
+    # The output depends on the YAML file and on this script, so both go into the hash
+    return f"{FORMAT_VERSION}:{hashlib.sha256(data).hexdigest()}"
+
+def stored_hash(path: str) -> str | None:
+    try:
+        with open(path, 'r', encoding = 'utf-8') as f:
+            return json.load(f).get("source")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def run(yaml_path: str = YAML_PATH, force: bool = False) -> bool:
+    """Makes git_colors.json and language_index.json from languages.yml
+    Nothing is done if both files were already made from the same languages.yml, unless force is true
+    Returns true if the files were made"""
+    with open(yaml_path, 'rb') as f:
+        data = f.read()
+    source = source_hash(data)
+    if not force and all(stored_hash(p) == source for p in (COLORS_PATH, INDEX_PATH)):
+        return False
     
-    with open("../git_colors.py", 'w') as f:
-        f.write("## This file contains all the colors of github-supported languages\n")
-        f.write("## Auto generated by ./make_colors.py ##\n")
-        f.write("## YAML file obtained at https://github.com/github/linguist/blob/master/lib/linguist/languages.yml ##\n")
-        f.write("\n")
-        f.write("from MDgen.profile.git_language_info import GitLanguageInfo\n")
-        f.write("\n")
-        f.write("COLORS = {\n")
-        f.write(colorinfos)
-        f.write("}")
+    dic: dict[str, dict] = yaml.load(data, Loader = Loader)
+    comment = "Auto generated by ./Generate git colors/make_colors.py from https://github.com/github/linguist/blob/master/lib/linguist/languages.yml"
+    dump({"comment": comment, "source": source, "languages": make_colors(dic)}, COLORS_PATH)
+    dump({"comment": comment, "source": source, **make_index(dic)}, INDEX_PATH)
+    return True
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    # Usage: python make_colors.py [path/to/languages.yml] [--force]
+    args = [a for a in sys.argv[1:] if a != "--force"]
+    made = run(args[0] if args else YAML_PATH, "--force" in sys.argv[1:])
+    print("Generated the language files" if made else "languages.yml did not change, nothing to do")
@@ -1,3 +1,29 @@
-from MDgen.profile.git_tools_image import dev
-from MDgen.profile.gituser import GitUser
-from MDgen.profile.git_piechart import GitPieChart
+## The github client and the language color table are only imported when first used
+from typing import TYPE_CHECKING
+from MDgen.util import lazy_attributes
+
+__all__ = ["dev", "GitUser", "GitPieChart", "LocalUser", "ResponseCache", "AsyncGitUser", "RateLimitScheduler", "ProfileJob", "run_batch", "GitSnapshot"]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "dev": "MDgen.profile.git_tools_image",
+    "GitUser": "MDgen.profile.gituser",
+    "GitPieChart": "MDgen.profile.git_piechart",
+    "LocalUser": "MDgen.profile.local_user",
+    "ResponseCache": "MDgen.profile.response_cache",
+    "AsyncGitUser": "MDgen.profile.async_gituser",
+    "RateLimitScheduler": "MDgen.profile.rate_limit",
+    "ProfileJob": "MDgen.profile.batch",
+    "run_batch": "MDgen.profile.batch",
+    "GitSnapshot": "MDgen.profile.snapshot",
+})
+
+if TYPE_CHECKING:
+    from MDgen.profile.git_tools_image import dev
+    from MDgen.profile.gituser import GitUser
+    from MDgen.profile.git_piechart import GitPieChart
+    from MDgen.profile.local_user import LocalUser
+    from MDgen.profile.response_cache import ResponseCache
+    from MDgen.profile.async_gituser import AsyncGitUser
+    from MDgen.profile.rate_limit import RateLimitScheduler
+    from MDgen.profile.batch import ProfileJob, run_batch
+    from MDgen.profile.snapshot import GitSnapshot
@@ -0,0 +1,120 @@
+### This module contains the asyncio version of GitUser, for generating profiles inside an event loop
+### It needs aiohttp (pip install aiohttp)
+from __future__ import annotations
+import json
+import asyncio
+from typing import Any
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError("AsyncGitUser needs aiohttp, install it with 'pip install aiohttp'") from e
+
+from MDgen.profile.github_api import DEFAULT_BASE_URL, GitHubError, api_headers, lower_headers, next_page_url
+from MDgen.profile.gituser import Repository, sum_languages
+from MDgen.profile.rate_limit import RateLimitScheduler, scheduler_for
+
+class AsyncGitUser:
+    def __init__(self, auth_token: str | None, max_concurrency: int = 8, base_url: str = DEFAULT_BASE_URL, session: aiohttp.ClientSession | None = None, timeout: float = 30, scheduler: RateLimitScheduler | None = None):
+        """Asyncio version of GitUser. Nothing is fetched until fetch() is awaited, or use 'await AsyncGitUser.create(auth_token)'
+        Requests go through an aiohttp session, which keeps connections alive and reuses them. Pass a session to share its
+        connection pool between many users, otherwise a session is opened for each fetch and closed afterwards
+        At most max_concurrency requests are in flight at the same time. A failed language request only leaves out that
+        repository, and its error is kept in self.errors
+        Like GitUser, requests wait for the rate limit instead of failing, and a RateLimitScheduler can be passed to use a pool of tokens
+        (with auth_token set to None)"""
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.headers = api_headers()
+        self.scheduler = scheduler_for(auth_token, scheduler)
+        self._session = session
+        
+        self.fetched = False
+        self.repos: list[Repository] = []
+        self.errors: dict[str, Exception] = {}
+        self.repo_languages: dict[str, dict[str, int]] = {}
+        self.total_languages: dict[str, int] = {}
+        self.total_bytes = 0
+    
+    @classmethod
+    async def create(cls, auth_token: str, **kwargs) -> AsyncGitUser:
+        """Makes the user and fetches everything. Takes the same keyword arguments as the constructor"""
+        return await cls(auth_token, **kwargs).fetch()
+    
+    async def _get(self, session: aiohttp.ClientSession, url: str) -> tuple[Any, dict[str, str]]:
+        retries = 0
+        while True:
+            # Wait for the rate limit without blocking the event loop
+            token, wait = self.scheduler.try_acquire()
+            if token is None:
+                await asyncio.sleep(wait)
+                continue
+            headers = {**self.headers, "Authorization": f"token {token}"} if token else self.headers
+            async with session.get(url, headers = headers) as response:
+                body = await response.read()
+                response_headers = lower_headers(response.headers)
+            if response.status < 400:
+                self.scheduler.update(token, response.status, response_headers)
+                return json.loads(body) if body else None, response_headers
+            try:
+                message = json.loads(body).get("message", response.reason)
+            except ValueError:
+                message = response.reason
+            if self.scheduler.update(token, response.status, response_headers, message or "") and retries < self.scheduler.max_retries:
+                retries += 1
+                continue
+            raise GitHubError(response.status, url, message or "")
+    
+    async def _get_languages(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, languages_url: str) -> dict[str, int] | Exception:
+        async with semaphore:
+            try:
+                return (await self._get(session, languages_url))[0]
+            except (GitHubError, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                return e
+    
+    async def fetch(self) -> AsyncGitUser:
+        """Fetches the repositories and their languages. Returns self so it can be chained"""
+        session = self._session
+        if session is None:
+            session = aiohttp.ClientSession(
+                connector = aiohttp.TCPConnector(limit = self.max_concurrency),
+                timeout = aiohttp.ClientTimeout(total = self.timeout)
+            )
+        try:
+            # Like GitUser, only small Repository records are kept from the pages, and the languages of a page are
+            # fetched while the next page is downloaded
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            repos: list[Repository] = []
+            tasks: list[asyncio.Task] = []
+            url: str | None = f"{self.base_url}/user/repos?per_page=100"
+            try:
+                while url is not None:
+                    page, headers = await self._get(session, url)
+                    for raw in page:
+                        repos.append(Repository.from_rest(raw))
+                        tasks.append(asyncio.ensure_future(self._get_languages(session, semaphore, raw["languages_url"])))
+                    url = next_page_url(headers)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            
+            # gather gives back the results in the order of the repos, so the totals come out the same however the requests finish
+            results = await asyncio.gather(*tasks)
+        finally:
+            if self._session is None:
+                await session.close()
+        
+        self.repos = repos
+        self.errors = {}
+        self.repo_languages = {}
+        for repo, result in zip(repos, results):
+            if isinstance(result, Exception):
+                self.errors[repo.full_name] = result
+            else:
+                repo.languages = result
+                self.repo_languages[repo.full_name] = result
+        self.total_languages, self.total_bytes = sum_languages(self.repo_languages.values())
+        self.fetched = True
+        return self
@@ -0,0 +1,242 @@
+### This module generates the profiles of many users at once
+### The work goes through three stages connected by bounded queues, so only a limited number of users are held in memory:
+###     fetch:  the languages of each user are fetched by a pool of threads (this is waiting on the network)
+###     render: the read mes are rendered by a pool of processes (this is CPU bound)
+###     export: the files are written by a single thread, skipping the ones that did not change
+from __future__ import annotations
+import os
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from MDgen.profile.github_api import DEFAULT_BASE_URL
+from MDgen.profile.gituser import GitUser
+from MDgen.util import process_context, write_if_changed
+
+if TYPE_CHECKING:
+    from MDgen.profile.rate_limit import RateLimitScheduler
+    from MDgen.profile.response_cache import ResponseCache
+
+class ProfileJob:
+    __slots__ = ("output_path", "auth_token", "username")
+    def __init__(self, output_path: str, auth_token: str | None = None, username: str | None = None):
+        """One profile to make. The repositories are those of the user logged in with auth_token, or the public repositories
+        of username if it is given. A job with an auth_token uses that token alone, the other jobs use the tokens of the batch's scheduler"""
+        self.output_path = output_path
+        self.auth_token = auth_token
+        self.username = username
+
+    @property
+    def name(self) -> str:
+        return self.username or self.output_path
+
+    def __repr__(self):
+        return f"ProfileJob({self.name!r})"
+
+class StageStats:
+    __slots__ = ("name", "done", "failed", "busy", "started", "finished")
+    def __init__(self, name: str):
+        self.name = name
+        self.done = 0
+        self.failed = 0
+        # Seconds spent working on items, added up over all the workers of the stage
+        self.busy = 0.
+        self.started: float | None = None
+        self.finished: float | None = None
+
+    def record(self, start: float, ok: bool = True):
+        end = time.perf_counter()
+        if self.started is None:
+            self.started = start
+        self.finished = end
+        self.busy += end - start
+        if ok:
+            self.done += 1
+        else:
+            self.failed += 1
+
+    @property
+    def throughput(self) -> float:
+        """Items finished per second, from the first item started to the last one finished"""
+        if self.started is None or self.finished is None or self.finished <= self.started:
+            return 0.
+        return self.done / (self.finished - self.started)
+
+    def __repr__(self):
+        return f"{self.name}: {self.done} done, {self.failed} failed, {self.throughput:.2f}/s, {self.busy:.2f}s busy"
+
+class BatchResult:
+    def __init__(self):
+        self.stats = {name: StageStats(name) for name in ("fetch", "render", "export")}
+        # Errors by job name, from whichever stage the job failed in
+        self.errors: dict[str, Exception] = {}
+        # Paths of the files that were written, the others already had the same content
+        self.written: list[str] = []
+
+    def __repr__(self):
+        return "\n".join(repr(s) for s in self.stats.values())
+
+def render_languages(name: str, languages: dict[str, int], chart_size: int = 150, use_columns: bool = False) -> str:
+    """The default render function of run_batch, which makes the language pie chart of the user"""
+    from MDgen.profile.git_piechart import GitPieChart
+    return GitPieChart(languages, chart_size, use_columns).content
+
+# Marks the end of the items in a queue
+_DONE = object()
+
+def run_batch(
+    jobs: Iterable[ProfileJob],
+    render: Callable[..., str] = render_languages,
+    render_kwargs: dict[str, Any] | None = None,
+    fetch_workers: int = 8,
+    repo_workers: int = 4,
+    render_processes: int | None = None,
+    queue_size: int = 32,
+    base_url: str = DEFAULT_BASE_URL,
+    cache: ResponseCache | None = None,
+    scheduler: RateLimitScheduler | None = None,
+    use_graphql: bool = False
+) -> BatchResult:
+    """Makes the profiles of many users. For every job, the languages of the user are fetched with a GitUser, rendered with
+    render(name, total_languages, **render_kwargs) in a separate process, and written to the job's output path
+    render has to be a module level function so it can be sent to the other processes. The processes are started fresh
+    (not forked from this one, whose threads could hold locks), so a script calling run_batch needs an 'if __name__ == "__main__"' guard
+    fetch_workers users are fetched at the same time, each with repo_workers threads for the languages of its repositories
+    At most queue_size users wait between two stages, and jobs can be a generator, so memory stays the same however many jobs there are
+    A failed job does not stop the batch, its error is kept in the result together with the statistics of every stage
+    If a whole stage fails (like jobs raising an error while it is read), the other stages still finish what they were given,
+    and the error is raised once they are done"""
+    result = BatchResult()
+    render_kwargs = render_kwargs or {}
+    to_render: queue.Queue = queue.Queue(maxsize = queue_size)
+    to_export: queue.Queue = queue.Queue(maxsize = queue_size)
+    lock = threading.Lock()
+    failures: list[Exception] = []
+
+    def fail(job: ProfileJob, e: Exception):
+        with lock:
+            result.errors[job.name] = e
+
+    def drain(q: queue.Queue):
+        # A stage that failed keeps emptying its queue, so the stage before it is never stuck on a full queue
+        while q.get() is not _DONE:
+            pass
+
+    def fetch(job: ProfileJob) -> tuple[ProfileJob, dict[str, int]] | None:
+        start = time.perf_counter()
+        try:
+            # A token has to log in as its own user, so it gets a scheduler of its own instead of the shared one
+            job_scheduler = None if job.auth_token else scheduler
+            user = GitUser(job.auth_token, repo_workers, base_url, cache = cache, use_graphql = use_graphql, scheduler = job_scheduler, username = job.username)
+            languages = user.total_languages
+        except Exception as e:
+            fail(job, e)
+            with lock:
+                result.stats["fetch"].record(start, ok = False)
+            return None
+        with lock:
+            result.stats["fetch"].record(start)
+        return job, languages
+
+    def fetch_stage():
+        # Only keep a few fetches in flight so a huge generator of jobs is not read all at once
+        in_flight: deque[Future] = deque()
+
+        def forward():
+            item = in_flight.popleft().result()
+            if item is not None:
+                to_render.put(item)
+
+        try:
+            with ThreadPoolExecutor(max_workers = fetch_workers) as pool:
+                try:
+                    for job in jobs:
+                        in_flight.append(pool.submit(fetch, job))
+                        while len(in_flight) >= fetch_workers or (in_flight and in_flight[0].done()):
+                            forward()
+                finally:
+                    # Pass on the users fetched so far, even if reading the jobs failed
+                    while in_flight:
+                        forward()
+        except Exception as e:
+            failures.append(e)
+        finally:
+            to_render.put(_DONE)
+
+    def render_stage(pool: ProcessPoolExecutor, processes: int):
+        in_flight: deque[tuple[ProfileJob, Future, float]] = deque()
+
+        def collect():
+            job, future, start = in_flight.popleft()
+            try:
+                content = future.result()
+            except Exception as e:
+                fail(job, e)
+                result.stats["render"].record(start, ok = False)
+                return
+            result.stats["render"].record(start)
+            to_export.put((job, content))
+
+        received_all = False
+        try:
+            while (item := to_render.get()) is not _DONE:
+                job, languages = item
+                start = time.perf_counter()
+                try:
+                    future = pool.submit(render, job.name, languages, **render_kwargs)
+                except Exception as e:
+                    fail(job, e)
+                    result.stats["render"].record(start, ok = False)
+                    continue
+                in_flight.append((job, future, start))
+                # Keep every process busy with one more item waiting, and pass the results on in order
+                while len(in_flight) > 2 * processes or (in_flight and in_flight[0][1].done()):
+                    collect()
+            received_all = True
+            while in_flight:
+                collect()
+        except Exception as e:
+            failures.append(e)
+            if not received_all:
+                drain(to_render)
+        finally:
+            to_export.put(_DONE)
+
+    def export_stage():
+        try:
+            while (item := to_export.get()) is not _DONE:
+                job, content = item
+                start = time.perf_counter()
+                try:
+                    directory = os.path.dirname(job.output_path)
+                    if directory:
+                        os.makedirs(directory, exist_ok = True)
+                    if write_if_changed(job.output_path, lambda: [content]):
+                        result.written.append(job.output_path)
+                except Exception as e:
+                    fail(job, e)
+                    result.stats["export"].record(start, ok = False)
+                    continue
+                result.stats["export"].record(start)
+        except Exception as e:
+            failures.append(e)
+            drain(to_export)
+
+    processes = render_processes or os.cpu_count() or 1
+    # The pool starts its processes lazily while the fetch threads are running, so they must not be forked
+    with ProcessPoolExecutor(max_workers = processes, mp_context = process_context()) as pool:
+        threads = [
+            threading.Thread(target = fetch_stage, name = "MDgen-fetch"),
+            threading.Thread(target = render_stage, args = (pool, processes), name = "MDgen-render"),
+            threading.Thread(target = export_stage, name = "MDgen-export"),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    if failures:
+        raise failures[0]
+    return result
@@ -1,3655 +1,68 @@
 ## This file contains all the colors of github-supported languages
-## Auto generated by ./make_colors.py ##
+## The table itself is stored column by column in git_colors.json, auto generated by ./Generate git colors/make_colors.py ##
 ## YAML file obtained at https://github.com/github/linguist/blob/master/lib/linguist/languages.yml ##
 
+from __future__ import annotations
+import os
+import json
+import threading
+from collections.abc import Mapping
+from typing import Any, Iterator
+
 from MDgen.profile.git_language_info import GitLanguageInfo
 
-COLORS = {
-    "1C Enterprise": GitLanguageInfo(
-        color = "#814CCC", 
-        language_type = "programming", 
-        language_id = 0,
-        name = "1C Enterprise",
-        extension = ['.bsl', '.os']
-    ),
-    "2-Dimensional Array": GitLanguageInfo(
-        color = "#38761D", 
-        language_type = "data", 
-        language_id = 387204628,
-        name = "2-Dimensional Array",
-        extension = ['.2da']
-    ),
-    "4D": GitLanguageInfo(
-        color = "#004289", 
-        language_type = "programming", 
-        language_id = 577529595,
-        name = "4D",
-        extension = ['.4dm']
-    ),
-    "ABAP": GitLanguageInfo(
-        color = "#E8274B", 
-        language_type = "programming", 
-        language_id = 1,
-        name = "ABAP",
-        extension = ['.abap']
-    ),
-    "ABAP CDS": GitLanguageInfo(
-        color = "#555e25", 
-        language_type = "programming", 
-        language_id = 452681853,
-        name = "ABAP CDS",
-        extension = ['.asddls']
-    ),
-    "AGS Script": GitLanguageInfo(
-        color = "#B9D9FF", 
-        language_type = "programming", 
-        language_id = 2,
-        name = "AGS Script",
-        extension = ['.asc', '.ash']
-    ),
-    "AIDL": GitLanguageInfo(
-        color = "#34EB6B", 
-        language_type = "programming", 
-        language_id = 451700185,
-        name = "AIDL",
-        extension = ['.aidl']
-    ),
-    "AL": GitLanguageInfo(
-        color = "#3AA2B5", 
-        language_type = "programming", 
-        language_id = 658971832,
-        name = "AL",
-        extension = ['.al']
-    ),
-    "AMPL": GitLanguageInfo(
-        color = "#E6EFBB", 
-        language_type = "programming", 
-        language_id = 3,
-        name = "AMPL",
-        extension = ['.ampl', '.mod']
-    ),
-    "ANTLR": GitLanguageInfo(
-        color = "#9DC3FF", 
-        language_type = "programming", 
-        language_id = 4,
-        name = "ANTLR",
-        extension = ['.g4']
-    ),
-    "API Blueprint": GitLanguageInfo(
-        color = "#2ACCA8", 
-        language_type = "markup", 
-        language_id = 5,
-        name = "API Blueprint",
-        extension = ['.apib']
-    ),
-    "APL": GitLanguageInfo(
-        color = "#5A8164", 
-        language_type = "programming", 
-        language_id = 6,
-        name = "APL",
-        extension = ['.apl', '.dyalog']
-    ),
-    "ASP.NET": GitLanguageInfo(
-        color = "#9400ff", 
-        language_type = "programming", 
-        language_id = 564186416,
-        name = "ASP.NET",
-        extension = ['.asax', '.ascx', '.ashx', '.asmx', '.aspx', '.axd']
-    ),
-    "ATS": GitLanguageInfo(
-        color = "#1ac620", 
-        language_type = "programming", 
-        language_id = 9,
-        name = "ATS",
-        extension = ['.dats', '.hats', '.sats']
-    ),
-    "ActionScript": GitLanguageInfo(
-        color = "#882B0F", 
-        language_type = "programming", 
-        language_id = 10,
-        name = "ActionScript",
-        extension = ['.as']
-    ),
-    "Ada": GitLanguageInfo(
-        color = "#02f88c", 
-        language_type = "programming", 
-        language_id = 11,
-        name = "Ada",
-        extension = ['.adb', '.ada', '.ads']
-    ),
-    "Adblock Filter List": GitLanguageInfo(
-        color = "#800000", 
-        language_type = "data", 
-        language_id = 884614762,
-        name = "Adblock Filter List",
-        extension = ['.txt']
-    ),
-    "Adobe Font Metrics": GitLanguageInfo(
-        color = "#fa0f00", 
-        language_type = "data", 
-        language_id = 147198098,
-        name = "Adobe Font Metrics",
-        extension = ['.afm']
-    ),
-    "Agda": GitLanguageInfo(
-        color = "#315665", 
-        language_type = "programming", 
-        language_id = 12,
-        name = "Agda",
-        extension = ['.agda']
-    ),
-    "Alloy": GitLanguageInfo(
-        color = "#64C800", 
-        language_type = "programming", 
-        language_id = 13,
-        name = "Alloy",
-        extension = ['.als']
-    ),
-    "Altium Designer": GitLanguageInfo(
-        color = "#A89663", 
-        language_type = "data", 
-        language_id = 187772328,
-        name = "Altium Designer",
-        extension = ['.OutJob', '.PcbDoc', '.PrjPCB', '.SchDoc']
-    ),
-    "AngelScript": GitLanguageInfo(
-        color = "#C7D7DC", 
-        language_type = "programming", 
-        language_id = 389477596,
-        name = "AngelScript",
-        extension = ['.as', '.angelscript']
-    ),
-    "Antlers": GitLanguageInfo(
-        color = "#ff269e", 
-        language_type = "markup", 
-        language_id = 1067292663,
-        name = "Antlers",
-        extension = ['.antlers.html', '.antlers.php', '.antlers.xml']
-    ),
-    "ApacheConf": GitLanguageInfo(
-        color = "#d12127", 
-        language_type = "data", 
-        language_id = 16,
-        name = "ApacheConf",
-        extension = ['.apacheconf', '.vhost']
-    ),
-    "Apex": GitLanguageInfo(
-        color = "#1797c0", 
-        language_type = "programming", 
-        language_id = 17,
-        name = "Apex",
-        extension = ['.cls']
-    ),
-    "Apollo Guidance Computer": GitLanguageInfo(
-        color = "#0B3D91", 
-        language_type = "programming", 
-        language_id = 18,
-        name = "Apollo Guidance Computer",
-        extension = ['.agc']
-    ),
-    "AppleScript": GitLanguageInfo(
-        color = "#101F1F", 
-        language_type = "programming", 
-        language_id = 19,
-        name = "AppleScript",
-        extension = ['.applescript', '.scpt']
-    ),
-    "Arc": GitLanguageInfo(
-        color = "#aa2afe", 
-        language_type = "programming", 
-        language_id = 20,
-        name = "Arc",
-        extension = ['.arc']
-    ),
-    "AsciiDoc": GitLanguageInfo(
-        color = "#73a0c5", 
-        language_type = "prose", 
-        language_id = 22,
-        name = "AsciiDoc",
-        extension = ['.asciidoc', '.adoc', '.asc']
-    ),
-    "AspectJ": GitLanguageInfo(
-        color = "#a957b0", 
-        language_type = "programming", 
-        language_id = 23,
-        name = "AspectJ",
-        extension = ['.aj']
-    ),
-    "Assembly": GitLanguageInfo(
-        color = "#6E4C13", 
-        language_type = "programming", 
-        language_id = 24,
-        name = "Assembly",
-        extension = ['.asm', '.a51', '.i', '.inc', '.nas', '.nasm']
-    ),
-    "Astro": GitLanguageInfo(
-        color = "#ff5a03", 
-        language_type = "markup", 
-        language_id = 578209015,
-        name = "Astro",
-        extension = ['.astro']
-    ),
-    "Asymptote": GitLanguageInfo(
-        color = "#ff0000", 
-        language_type = "programming", 
-        language_id = 591605007,
-        name = "Asymptote",
-        extension = ['.asy']
-    ),
-    "Augeas": GitLanguageInfo(
-        color = "#9CC134", 
-        language_type = "programming", 
-        language_id = 25,
-        name = "Augeas",
-        extension = ['.aug']
-    ),
-    "AutoHotkey": GitLanguageInfo(
-        color = "#6594b9", 
-        language_type = "programming", 
-        language_id = 26,
-        name = "AutoHotkey",
-        extension = ['.ahk', '.ahkl']
-    ),
-    "AutoIt": GitLanguageInfo(
-        color = "#1C3552", 
-        language_type = "programming", 
-        language_id = 27,
-        name = "AutoIt",
-        extension = ['.au3']
-    ),
-    "Avro IDL": GitLanguageInfo(
-        color = "#0040FF", 
-        language_type = "data", 
-        language_id = 785497837,
-        name = "Avro IDL",
-        extension = ['.avdl']
-    ),
-    "Awk": GitLanguageInfo(
-        color = "#c30e9b", 
-        language_type = "programming", 
-        language_id = 28,
-        name = "Awk",
-        extension = ['.awk', '.auk', '.gawk', '.mawk', '.nawk']
-    ),
-    "BASIC": GitLanguageInfo(
-        color = "#ff0000", 
-        language_type = "programming", 
-        language_id = 28923963,
-        name = "BASIC",
-        extension = ['.bas']
-    ),
-    "Ballerina": GitLanguageInfo(
-        color = "#FF5000", 
-        language_type = "programming", 
-        language_id = 720859680,
-        name = "Ballerina",
-        extension = ['.bal']
-    ),
-    "Batchfile": GitLanguageInfo(
-        color = "#C1F12E", 
-        language_type = "programming", 
-        language_id = 29,
-        name = "Batchfile",
-        extension = ['.bat', '.cmd']
-    ),
-    "Beef": GitLanguageInfo(
-        color = "#a52f4e", 
-        language_type = "programming", 
-        language_id = 545626333,
-        name = "Beef",
-        extension = ['.bf']
-    ),
-    "Berry": GitLanguageInfo(
-        color = "#15A13C", 
-        language_type = "programming", 
-        language_id = 121855308,
-        name = "Berry",
-        extension = ['.be']
-    ),
-    "BibTeX": GitLanguageInfo(
-        color = "#778899", 
-        language_type = "markup", 
-        language_id = 982188347,
-        name = "BibTeX",
-        extension = ['.bib', '.bibtex']
-    ),
-    "Bicep": GitLanguageInfo(
-        color = "#519aba", 
-        language_type = "programming", 
-        language_id = 321200902,
-        name = "Bicep",
-        extension = ['.bicep']
-    ),
-    "Bikeshed": GitLanguageInfo(
-        color = "#5562ac", 
-        language_type = "markup", 
-        language_id = 1055528081,
-        name = "Bikeshed",
-        extension = ['.bs']
-    ),
-    "Bison": GitLanguageInfo(
-        color = "#6A463F", 
-        language_type = "programming", 
-        language_id = 31,
-        name = "Bison",
-        extension = ['.bison']
-    ),
-    "BitBake": GitLanguageInfo(
-        color = "#00bce4", 
-        language_type = "programming", 
-        language_id = 32,
-        name = "BitBake",
-        extension = ['.bb']
-    ),
-    "Blade": GitLanguageInfo(
-        color = "#f7523f", 
-        language_type = "markup", 
-        language_id = 33,
-        name = "Blade",
-        extension = ['.blade', '.blade.php']
-    ),
-    "BlitzBasic": GitLanguageInfo(
-        color = "#00FFAE", 
-        language_type = "programming", 
-        language_id = 34,
-        name = "BlitzBasic",
-        extension = ['.bb', '.decls']
-    ),
-    "BlitzMax": GitLanguageInfo(
-        color = "#cd6400", 
-        language_type = "programming", 
-        language_id = 35,
-        name = "BlitzMax",
-        extension = ['.bmx']
-    ),
-    "Bluespec": GitLanguageInfo(
-        color = "#12223c", 
-        language_type = "programming", 
-        language_id = 36,
-        name = "Bluespec",
-        extension = ['.bsv']
-    ),
-    "Boo": GitLanguageInfo(
-        color = "#d4bec1", 
-        language_type = "programming", 
-        language_id = 37,
-        name = "Boo",
-        extension = ['.boo']
-    ),
-    "Boogie": GitLanguageInfo(
-        color = "#c80fa0", 
-        language_type = "programming", 
-        language_id = 955017407,
-        name = "Boogie",
-        extension = ['.bpl']
-    ),
-    "Brainfuck": GitLanguageInfo(
-        color = "#2F2530", 
-        language_type = "programming", 
-        language_id = 38,
-        name = "Brainfuck",
-        extension = ['.b', '.bf']
-    ),
-    "BrighterScript": GitLanguageInfo(
-        color = "#66AABB", 
-        language_type = "programming", 
-        language_id = 943571030,
-        name = "BrighterScript",
-        extension = ['.bs']
-    ),
-    "Brightscript": GitLanguageInfo(
-        color = "#662D91", 
-        language_type = "programming", 
-        language_id = 39,
-        name = "Brightscript",
-        extension = ['.brs']
-    ),
-    "C": GitLanguageInfo(
-        color = "#555555", 
-        language_type = "programming", 
-        language_id = 41,
-        name = "C",
-        extension = ['.c', '.cats', '.h', '.idc']
-    ),
-    "C#": GitLanguageInfo(
-        color = "#178600", 
-        language_type = "programming", 
-        language_id = 42,
-        name = "C#",
-        extension = ['.cs', '.cake', '.csx', '.linq']
-    ),
-    "C++": GitLanguageInfo(
-        color = "#f34b7d", 
-        language_type = "programming", 
-        language_id = 43,
-        name = "C++",
-        extension = ['.cpp', '.c++', '.cc', '.cp', '.cxx', '.h', '.h++', '.hh', '.hpp', '.hxx', '.inc', '.inl', '.ino', '.ipp', '.ixx', '.re', '.tcc', '.tpp']
-    ),
-    "CAP CDS": GitLanguageInfo(
-        color = "#0092d1", 
-        language_type = "programming", 
-        language_id = 390788699,
-        name = "CAP CDS",
-        extension = ['.cds']
-    ),
-    "CLIPS": GitLanguageInfo(
-        color = "#00A300", 
-        language_type = "programming", 
-        language_id = 46,
-        name = "CLIPS",
-        extension = ['.clp']
-    ),
-    "CMake": GitLanguageInfo(
-        color = "#DA3434", 
-        language_type = "programming", 
-        language_id = 47,
-        name = "CMake",
-        extension = ['.cmake', '.cmake.in']
-    ),
-    "COLLADA": GitLanguageInfo(
-        color = "#F1A42B", 
-        language_type = "data", 
-        language_id = 49,
-        name = "COLLADA",
-        extension = ['.dae']
-    ),
-    "CSON": GitLanguageInfo(
-        color = "#244776", 
-        language_type = "data", 
-        language_id = 424,
-        name = "CSON",
-        extension = ['.cson']
-    ),
-    "CSS": GitLanguageInfo(
-        color = "#563d7c", 
-        language_type = "markup", 
-        language_id = 50,
-        name = "CSS",
-        extension = ['.css']
-    ),
-    "CSV": GitLanguageInfo(
-        color = "#237346", 
-        language_type = "data", 
-        language_id = 51,
-        name = "CSV",
-        extension = ['.csv']
-    ),
-    "CUE": GitLanguageInfo(
-        color = "#5886E1", 
-        language_type = "programming", 
-        language_id = 356063509,
-        name = "CUE",
-        extension = ['.cue']
-    ),
-    "CWeb": GitLanguageInfo(
-        color = "#00007a", 
-        language_type = "programming", 
-        language_id = 657332628,
-        name = "CWeb",
-        extension = ['.w']
-    ),
-    "Cabal Config": GitLanguageInfo(
-        color = "#483465", 
-        language_type = "data", 
-        language_id = 677095381,
-        name = "Cabal Config",
-        extension = ['.cabal']
-    ),
-    "Cadence": GitLanguageInfo(
-        color = "#00ef8b", 
-        language_type = "programming", 
-        language_id = 270184138,
-        name = "Cadence",
-        extension = ['.cdc']
-    ),
-    "Cairo": GitLanguageInfo(
-        color = "#ff4a48", 
-        language_type = "programming", 
-        language_id = 620599567,
-        name = "Cairo",
-        extension = ['.cairo']
-    ),
-    "CameLIGO": GitLanguageInfo(
-        color = "#3be133", 
-        language_type = "programming", 
-        language_id = 829207807,
-        name = "CameLIGO",
-        extension = ['.mligo']
-    ),
-    "Cap'n Proto": GitLanguageInfo(
-        color = "#c42727", 
-        language_type = "programming", 
-        language_id = 52,
-        name = "Cap'n Proto",
-        extension = ['.capnp']
-    ),
-    "Ceylon": GitLanguageInfo(
-        color = "#dfa535", 
-        language_type = "programming", 
-        language_id = 54,
-        name = "Ceylon",
-        extension = ['.ceylon']
-    ),
-    "Chapel": GitLanguageInfo(
-        color = "#8dc63f", 
-        language_type = "programming", 
-        language_id = 55,
-        name = "Chapel",
-        extension = ['.chpl']
-    ),
-    "ChucK": GitLanguageInfo(
-        color = "#3f8000", 
-        language_type = "programming", 
-        language_id = 57,
-        name = "ChucK",
-        extension = ['.ck']
-    ),
-    "Cirru": GitLanguageInfo(
-        color = "#ccccff", 
-        language_type = "programming", 
-        language_id = 58,
-        name = "Cirru",
-        extension = ['.cirru']
-    ),
-    "Clarion": GitLanguageInfo(
-        color = "#db901e", 
-        language_type = "programming", 
-        language_id = 59,
-        name = "Clarion",
-        extension = ['.clw']
-    ),
-    "Clarity": GitLanguageInfo(
-        color = "#5546ff", 
-        language_type = "programming", 
-        language_id = 91493841,
-        name = "Clarity",
-        extension = ['.clar']
-    ),
-    "Classic ASP": GitLanguageInfo(
-        color = "#6a40fd", 
-        language_type = "programming", 
-        language_id = 8,
-        name = "Classic ASP",
-        extension = ['.asp']
-    ),
-    "Clean": GitLanguageInfo(
-        color = "#3F85AF", 
-        language_type = "programming", 
-        language_id = 60,
-        name = "Clean",
-        extension = ['.icl', '.dcl']
-    ),
-    "Click": GitLanguageInfo(
-        color = "#E4E6F3", 
-        language_type = "programming", 
-        language_id = 61,
-        name = "Click",
-        extension = ['.click']
-    ),
-    "Clojure": GitLanguageInfo(
-        color = "#db5855", 
-        language_type = "programming", 
-        language_id = 62,
-        name = "Clojure",
-        extension = ['.clj', '.bb', '.boot', '.cl2', '.cljc', '.cljs', '.cljs.hl', '.cljscm', '.cljx', '.hic']
-    ),
-    "Closure Templates": GitLanguageInfo(
-        color = "#0d948f", 
-        language_type = "markup", 
-        language_id = 357046146,
-        name = "Closure Templates",
-        extension = ['.soy']
-    ),
-    "CodeQL": GitLanguageInfo(
-        color = "#140f46", 
-        language_type = "programming", 
-        language_id = 424259634,
-        name = "CodeQL",
-        extension = ['.ql', '.qll']
-    ),
-    "CoffeeScript": GitLanguageInfo(
-        color = "#244776", 
-        language_type = "programming", 
-        language_id = 63,
-        name = "CoffeeScript",
-        extension = ['.coffee', '._coffee', '.cake', '.cjsx', '.iced']
-    ),
-    "ColdFusion": GitLanguageInfo(
-        color = "#ed2cd6", 
-        language_type = "programming", 
-        language_id = 64,
-        name = "ColdFusion",
-        extension = ['.cfm', '.cfml']
-    ),
-    "ColdFusion CFC": GitLanguageInfo(
-        color = "#ed2cd6", 
-        language_type = "programming", 
-        language_id = 65,
-        name = "ColdFusion CFC",
-        extension = ['.cfc']
-    ),
-    "Common Lisp": GitLanguageInfo(
-        color = "#3fb68b", 
-        language_type = "programming", 
-        language_id = 66,
-        name = "Common Lisp",
-        extension = ['.lisp', '.asd', '.cl', '.l', '.lsp', '.ny', '.podsl', '.sexp']
-    ),
-    "Common Workflow Language": GitLanguageInfo(
-        color = "#B5314C", 
-        language_type = "programming", 
-        language_id = 988547172,
-        name = "Common Workflow Language",
-        extension = ['.cwl']
-    ),
-    "Component Pascal": GitLanguageInfo(
-        color = "#B0CE4E", 
-        language_type = "programming", 
-        language_id = 67,
-        name = "Component Pascal",
-        extension = ['.cp', '.cps']
-    ),
-    "Coq": GitLanguageInfo(
-        color = "#d0b68c", 
-        language_type = "programming", 
-        language_id = 69,
-        name = "Coq",
-        extension = ['.coq', '.v']
-    ),
-    "Crystal": GitLanguageInfo(
-        color = "#000100", 
-        language_type = "programming", 
-        language_id = 72,
-        name = "Crystal",
-        extension = ['.cr']
-    ),
-    "Csound": GitLanguageInfo(
-        color = "#1a1a1a", 
-        language_type = "programming", 
-        language_id = 73,
-        name = "Csound",
-        extension = ['.orc', '.udo']
-    ),
-    "Csound Document": GitLanguageInfo(
-        color = "#1a1a1a", 
-        language_type = "programming", 
-        language_id = 74,
-        name = "Csound Document",
-        extension = ['.csd']
-    ),
-    "Csound Score": GitLanguageInfo(
-        color = "#1a1a1a", 
-        language_type = "programming", 
-        language_id = 75,
-        name = "Csound Score",
-        extension = ['.sco']
-    ),
-    "Cuda": GitLanguageInfo(
-        color = "#3A4E3A", 
-        language_type = "programming", 
-        language_id = 77,
-        name = "Cuda",
-        extension = ['.cu', '.cuh']
-    ),
-    "Curry": GitLanguageInfo(
-        color = "#531242", 
-        language_type = "programming", 
-        language_id = 439829048,
-        name = "Curry",
-        extension = ['.curry']
-    ),
-    "Cypher": GitLanguageInfo(
-        color = "#34c0eb", 
-        language_type = "programming", 
-        language_id = 850806976,
-        name = "Cypher",
-        extension = ['.cyp', '.cypher']
-    ),
-    "Cython": GitLanguageInfo(
-        color = "#fedf5b", 
-        language_type = "programming", 
-        language_id = 79,
-        name = "Cython",
-        extension = ['.pyx', '.pxd', '.pxi']
-    ),
-    "D": GitLanguageInfo(
-        color = "#ba595e", 
-        language_type = "programming", 
-        language_id = 80,
-        name = "D",
-        extension = ['.d', '.di']
-    ),
-    "DM": GitLanguageInfo(
-        color = "#447265", 
-        language_type = "programming", 
-        language_id = 83,
-        name = "DM",
-        extension = ['.dm']
-    ),
-    "Dafny": GitLanguageInfo(
-        color = "#FFEC25", 
-        language_type = "programming", 
-        language_id = 969323346,
-        name = "Dafny",
-        extension = ['.dfy']
-    ),
-    "Darcs Patch": GitLanguageInfo(
-        color = "#8eff23", 
-        language_type = "data", 
-        language_id = 86,
-        name = "Darcs Patch",
-        extension = ['.darcspatch', '.dpatch']
-    ),
-    "Dart": GitLanguageInfo(
-        color = "#00B4AB", 
-        language_type = "programming", 
-        language_id = 87,
-        name = "Dart",
-        extension = ['.dart']
-    ),
-    "DataWeave": GitLanguageInfo(
-        color = "#003a52", 
-        language_type = "programming", 
-        language_id = 974514097,
-        name = "DataWeave",
-        extension = ['.dwl']
-    ),
-    "Debian Package Control File": GitLanguageInfo(
-        color = "#D70751", 
-        language_type = "data", 
-        language_id = 527438264,
-        name = "Debian Package Control File",
-        extension = ['.dsc']
-    ),
-    "DenizenScript": GitLanguageInfo(
-        color = "#FBEE96", 
-        language_type = "programming", 
-        language_id = 435000929,
-        name = "DenizenScript",
-        extension = ['.dsc']
-    ),
-    "Dhall": GitLanguageInfo(
-        color = "#dfafff", 
-        language_type = "programming", 
-        language_id = 793969321,
-        name = "Dhall",
-        extension = ['.dhall']
-    ),
-    "DirectX 3D File": GitLanguageInfo(
-        color = "#aace60", 
-        language_type = "data", 
-        language_id = 201049282,
-        name = "DirectX 3D File",
-        extension = ['.x']
-    ),
-    "Dockerfile": GitLanguageInfo(
-        color = "#384d54", 
-        language_type = "programming", 
-        language_id = 89,
-        name = "Dockerfile",
-        extension = ['.dockerfile']
-    ),
-    "Dogescript": GitLanguageInfo(
-        color = "#cca760", 
-        language_type = "programming", 
-        language_id = 90,
-        name = "Dogescript",
-        extension = ['.djs']
-    ),
-    "Dylan": GitLanguageInfo(
-        color = "#6c616e", 
-        language_type = "programming", 
-        language_id = 91,
-        name = "Dylan",
-        extension = ['.dylan', '.dyl', '.intr', '.lid']
-    ),
-    "E": GitLanguageInfo(
-        color = "#ccce35", 
-        language_type = "programming", 
-        language_id = 92,
-        name = "E",
-        extension = ['.e']
-    ),
-    "ECL": GitLanguageInfo(
-        color = "#8a1267", 
-        language_type = "programming", 
-        language_id = 93,
-        name = "ECL",
-        extension = ['.ecl', '.eclxml']
-    ),
-    "ECLiPSe": GitLanguageInfo(
-        color = "#001d9d", 
-        language_type = "programming", 
-        language_id = 94,
-        name = "ECLiPSe",
-        extension = ['.ecl']
-    ),
-    "EJS": GitLanguageInfo(
-        color = "#a91e50", 
-        language_type = "markup", 
-        language_id = 95,
-        name = "EJS",
-        extension = ['.ejs', '.ect', '.ejs.t', '.jst']
-    ),
-    "EQ": GitLanguageInfo(
-        color = "#a78649", 
-        language_type = "programming", 
-        language_id = 96,
-        name = "EQ",
-        extension = ['.eq']
-    ),
-    "Easybuild": GitLanguageInfo(
-        color = "#069406", 
-        language_type = "data", 
-        language_id = 342840477,
-        name = "Easybuild",
-        extension = ['.eb']
-    ),
-    "Ecere Projects": GitLanguageInfo(
-        color = "#913960", 
-        language_type = "data", 
-        language_id = 98,
-        name = "Ecere Projects",
-        extension = ['.epj']
-    ),
-    "Ecmarkup": GitLanguageInfo(
-        color = "#eb8131", 
-        language_type = "markup", 
-        language_id = 844766630,
-        name = "Ecmarkup",
-        extension = ['.html']
-    ),
-    "EditorConfig": GitLanguageInfo(
-        color = "#fff1f2", 
-        language_type = "data", 
-        language_id = 96139566,
-        name = "EditorConfig",
-        extension = ['.editorconfig']
-    ),
-    "Eiffel": GitLanguageInfo(
-        color = "#4d6977", 
-        language_type = "programming", 
-        language_id = 99,
-        name = "Eiffel",
-        extension = ['.e']
-    ),
-    "Elixir": GitLanguageInfo(
-        color = "#6e4a7e", 
-        language_type = "programming", 
-        language_id = 100,
-        name = "Elixir",
-        extension = ['.ex', '.exs']
-    ),
-    "Elm": GitLanguageInfo(
-        color = "#60B5CC", 
-        language_type = "programming", 
-        language_id = 101,
-        name = "Elm",
-        extension = ['.elm']
-    ),
-    "Elvish": GitLanguageInfo(
-        color = "#55BB55", 
-        language_type = "programming", 
-        language_id = 570996448,
-        name = "Elvish",
-        extension = ['.elv']
-    ),
-    "Emacs Lisp": GitLanguageInfo(
-        color = "#c065db", 
-        language_type = "programming", 
-        language_id = 102,
-        name = "Emacs Lisp",
-        extension = ['.el', '.emacs', '.emacs.desktop']
-    ),
-    "EmberScript": GitLanguageInfo(
-        color = "#FFF4F3", 
-        language_type = "programming", 
-        language_id = 103,
-        name = "EmberScript",
-        extension = ['.em', '.emberscript']
-    ),
-    "Erlang": GitLanguageInfo(
-        color = "#B83998", 
-        language_type = "programming", 
-        language_id = 104,
-        name = "Erlang",
-        extension = ['.erl', '.app.src', '.es', '.escript', '.hrl', '.xrl', '.yrl']
-    ),
-    "Euphoria": GitLanguageInfo(
-        color = "#FF790B", 
-        language_type = "programming", 
-        language_id = 880693982,
-        name = "Euphoria",
-        extension = ['.e', '.ex']
-    ),
-    "F#": GitLanguageInfo(
-        color = "#b845fc", 
-        language_type = "programming", 
-        language_id = 105,
-        name = "F#",
-        extension = ['.fs', '.fsi', '.fsx']
-    ),
-    "F*": GitLanguageInfo(
-        color = "#572e30", 
-        language_type = "programming", 
-        language_id = 336943375,
-        name = "F*",
-        extension = ['.fst', '.fsti']
-    ),
-    "FIGlet Font": GitLanguageInfo(
-        color = "#FFDDBB", 
-        language_type = "data", 
-        language_id = 686129783,
-        name = "FIGlet Font",
-        extension = ['.flf']
-    ),
-    "FLUX": GitLanguageInfo(
-        color = "#88ccff", 
-        language_type = "programming", 
-        language_id = 106,
-        name = "FLUX",
-        extension = ['.fx', '.flux']
-    ),
-    "Factor": GitLanguageInfo(
-        color = "#636746", 
-        language_type = "programming", 
-        language_id = 108,
-        name = "Factor",
-        extension = ['.factor']
-    ),
-    "Fancy": GitLanguageInfo(
-        color = "#7b9db4", 
-        language_type = "programming", 
-        language_id = 109,
-        name = "Fancy",
-        extension = ['.fy', '.fancypack']
-    ),
-    "Fantom": GitLanguageInfo(
-        color = "#14253c", 
-        language_type = "programming", 
-        language_id = 110,
-        name = "Fantom",
-        extension = ['.fan']
-    ),
-    "Faust": GitLanguageInfo(
-        color = "#c37240", 
-        language_type = "programming", 
-        language_id = 622529198,
-        name = "Faust",
-        extension = ['.dsp']
-    ),
-    "Fennel": GitLanguageInfo(
-        color = "#fff3d7", 
-        language_type = "programming", 
-        language_id = 239946126,
-        name = "Fennel",
-        extension = ['.fnl']
-    ),
-    "Filebench WML": GitLanguageInfo(
-        color = "#F6B900", 
-        language_type = "programming", 
-        language_id = 111,
-        name = "Filebench WML",
-        extension = ['.f']
-    ),
-    "Fluent": GitLanguageInfo(
-        color = "#ffcc33", 
-        language_type = "programming", 
-        language_id = 206353404,
-        name = "Fluent",
-        extension = ['.ftl']
-    ),
-    "Forth": GitLanguageInfo(
-        color = "#341708", 
-        language_type = "programming", 
-        language_id = 114,
-        name = "Forth",
-        extension = ['.fth', '.4th', '.f', '.for', '.forth', '.fr', '.frt', '.fs']
-    ),
-    "Fortran": GitLanguageInfo(
-        color = "#4d41b1", 
-        language_type = "programming", 
-        language_id = 107,
-        name = "Fortran",
-        extension = ['.f', '.f77', '.for', '.fpp']
-    ),
-    "Fortran Free Form": GitLanguageInfo(
-        color = "#4d41b1", 
-        language_type = "programming", 
-        language_id = 761352333,
-        name = "Fortran Free Form",
-        extension = ['.f90', '.f03', '.f08', '.f95']
-    ),
-    "FreeBasic": GitLanguageInfo(
-        color = "#867db1", 
-        language_type = "programming", 
-        language_id = 472896659,
-        name = "FreeBasic",
-        extension = ['.bi', '.bas']
-    ),
-    "FreeMarker": GitLanguageInfo(
-        color = "#0050b2", 
-        language_type = "programming", 
-        language_id = 115,
-        name = "FreeMarker",
-        extension = ['.ftl']
-    ),
-    "Frege": GitLanguageInfo(
-        color = "#00cafe", 
-        language_type = "programming", 
-        language_id = 116,
-        name = "Frege",
-        extension = ['.fr']
-    ),
-    "Futhark": GitLanguageInfo(
-        color = "#5f021f", 
-        language_type = "programming", 
-        language_id = 97358117,
-        name = "Futhark",
-        extension = ['.fut']
-    ),
-    "G-code": GitLanguageInfo(
-        color = "#D08CF2", 
-        language_type = "programming", 
-        language_id = 117,
-        name = "G-code",
-        extension = ['.g', '.cnc', '.gco', '.gcode']
-    ),
-    "GAML": GitLanguageInfo(
-        color = "#FFC766", 
-        language_type = "programming", 
-        language_id = 290345951,
-        name = "GAML",
-        extension = ['.gaml']
-    ),
-    "GAMS": GitLanguageInfo(
-        color = "#f49a22", 
-        language_type = "programming", 
-        language_id = 118,
-        name = "GAMS",
-        extension = ['.gms']
-    ),
-    "GAP": GitLanguageInfo(
-        color = "#0000cc", 
-        language_type = "programming", 
-        language_id = 119,
-        name = "GAP",
-        extension = ['.g', '.gap', '.gd', '.gi', '.tst']
-    ),
-    "GCC Machine Description": GitLanguageInfo(
-        color = "#FFCFAB", 
-        language_type = "programming", 
-        language_id = 121,
-        name = "GCC Machine Description",
-        extension = ['.md']
-    ),
-    "GDScript": GitLanguageInfo(
-        color = "#355570", 
-        language_type = "programming", 
-        language_id = 123,
-        name = "GDScript",
-        extension = ['.gd']
-    ),
-    "GEDCOM": GitLanguageInfo(
-        color = "#003058", 
-        language_type = "data", 
-        language_id = 459577965,
-        name = "GEDCOM",
-        extension = ['.ged']
-    ),
-    "GLSL": GitLanguageInfo(
-        color = "#5686a5", 
-        language_type = "programming", 
-        language_id = 124,
-        name = "GLSL",
-        extension = ['.glsl', '.fp', '.frag', '.frg', '.fs', '.fsh', '.fshader', '.geo', '.geom', '.glslf', '.glslv', '.gs', '.gshader', '.rchit', '.rmiss', '.shader', '.tesc', '.tese', '.vert', '.vrx', '.vsh', '.vshader']
-    ),
-    "GSC": GitLanguageInfo(
-        color = "#FF6800", 
-        language_type = "programming", 
-        language_id = 257856279,
-        name = "GSC",
-        extension = ['.gsc', '.csc', '.gsh']
-    ),
-    "Game Maker Language": GitLanguageInfo(
-        color = "#71b417", 
-        language_type = "programming", 
-        language_id = 125,
-        name = "Game Maker Language",
-        extension = ['.gml']
-    ),
-    "Gemini": GitLanguageInfo(
-        color = "#ff6900", 
-        language_type = "prose", 
-        language_id = 310828396,
-        name = "Gemini",
-        extension = ['.gmi']
-    ),
-    "Genero": GitLanguageInfo(
-        color = "#63408e", 
-        language_type = "programming", 
-        language_id = 986054050,
-        name = "Genero",
-        extension = ['.4gl']
-    ),
-    "Genero Forms": GitLanguageInfo(
-        color = "#d8df39", 
-        language_type = "markup", 
-        language_id = 902995658,
-        name = "Genero Forms",
-        extension = ['.per']
-    ),
-    "Genie": GitLanguageInfo(
-        color = "#fb855d", 
-        language_type = "programming", 
-        language_id = 792408528,
-        name = "Genie",
-        extension = ['.gs']
-    ),
-    "Genshi": GitLanguageInfo(
-        color = "#951531", 
-        language_type = "programming", 
-        language_id = 126,
-        name = "Genshi",
-        extension = ['.kid']
-    ),
-    "Gentoo Ebuild": GitLanguageInfo(
-        color = "#9400ff", 
-        language_type = "programming", 
-        language_id = 127,
-        name = "Gentoo Ebuild",
-        extension = ['.ebuild']
-    ),
-    "Gentoo Eclass": GitLanguageInfo(
-        color = "#9400ff", 
-        language_type = "programming", 
-        language_id = 128,
-        name = "Gentoo Eclass",
-        extension = ['.eclass']
-    ),
-    "Gerber Image": GitLanguageInfo(
-        color = "#d20b00", 
-        language_type = "data", 
-        language_id = 404627610,
-        name = "Gerber Image",
-        extension = ['.gbr', '.cmp', '.gbl', '.gbo', '.gbp', '.gbs', '.gko', '.gml', '.gpb', '.gpt', '.gtl', '.gto', '.gtp', '.gts', '.ncl', '.sol']
-    ),
-    "Gherkin": GitLanguageInfo(
-        color = "#5B2063", 
-        language_type = "programming", 
-        language_id = 76,
-        name = "Gherkin",
-        extension = ['.feature', '.story']
-    ),
-    "Git Config": GitLanguageInfo(
-        color = "#F44D27", 
-        language_type = "data", 
-        language_id = 807968997,
-        name = "Git Config",
-        extension = ['.gitconfig']
-    ),
-    "Gleam": GitLanguageInfo(
-        color = "#ffaff3", 
-        language_type = "programming", 
-        language_id = 1054258749,
-        name = "Gleam",
-        extension = ['.gleam']
-    ),
-    "Glyph": GitLanguageInfo(
-        color = "#c1ac7f", 
-        language_type = "programming", 
-        language_id = 130,
-        name = "Glyph",
-        extension = ['.glf']
-    ),
-    "Gnuplot": GitLanguageInfo(
-        color = "#f0a9f0", 
-        language_type = "programming", 
-        language_id = 131,
-        name = "Gnuplot",
-        extension = ['.gp', '.gnu', '.gnuplot', '.p', '.plot', '.plt']
-    ),
-    "Go": GitLanguageInfo(
-        color = "#00ADD8", 
-        language_type = "programming", 
-        language_id = 132,
-        name = "Go",
-        extension = ['.go']
-    ),
-    "Golo": GitLanguageInfo(
-        color = "#88562A", 
-        language_type = "programming", 
-        language_id = 133,
-        name = "Golo",
-        extension = ['.golo']
-    ),
-    "Gosu": GitLanguageInfo(
-        color = "#82937f", 
-        language_type = "programming", 
-        language_id = 134,
-        name = "Gosu",
-        extension = ['.gs', '.gst', '.gsx', '.vark']
-    ),
-    "Grace": GitLanguageInfo(
-        color = "#615f8b", 
-        language_type = "programming", 
-        language_id = 135,
-        name = "Grace",
-        extension = ['.grace']
-    ),
-    "Gradle": GitLanguageInfo(
-        color = "#02303a", 
-        language_type = "data", 
-        language_id = 136,
-        name = "Gradle",
-        extension = ['.gradle']
-    ),
-    "Grammatical Framework": GitLanguageInfo(
-        color = "#ff0000", 
-        language_type = "programming", 
-        language_id = 137,
-        name = "Grammatical Framework",
-        extension = ['.gf']
-    ),
-    "GraphQL": GitLanguageInfo(
-        color = "#e10098", 
-        language_type = "data", 
-        language_id = 139,
-        name = "GraphQL",
-        extension = ['.graphql', '.gql', '.graphqls']
-    ),
-    "Graphviz (DOT)": GitLanguageInfo(
-        color = "#2596be", 
-        language_type = "data", 
-        language_id = 140,
-        name = "Graphviz (DOT)",
-        extension = ['.dot', '.gv']
-    ),
-    "Groovy": GitLanguageInfo(
-        color = "#4298b8", 
-        language_type = "programming", 
-        language_id = 142,
-        name = "Groovy",
-        extension = ['.groovy', '.grt', '.gtpl', '.gvy']
-    ),
-    "Groovy Server Pages": GitLanguageInfo(
-        color = "#4298b8", 
-        language_type = "programming", 
-        language_id = 143,
-        name = "Groovy Server Pages",
-        extension = ['.gsp']
-    ),
-    "HAProxy": GitLanguageInfo(
-        color = "#106da9", 
-        language_type = "data", 
-        language_id = 366607477,
-        name = "HAProxy",
-        extension = ['.cfg']
-    ),
-    "HLSL": GitLanguageInfo(
-        color = "#aace60", 
-        language_type = "programming", 
-        language_id = 145,
-        name = "HLSL",
-        extension = ['.hlsl', '.cginc', '.fx', '.fxh', '.hlsli']
-    ),
-    "HOCON": GitLanguageInfo(
-        color = "#9ff8ee", 
-        language_type = "data", 
-        language_id = 679725279,
-        name = "HOCON",
-        extension = ['.hocon']
-    ),
-    "HTML": GitLanguageInfo(
-        color = "#e34c26", 
-        language_type = "markup", 
-        language_id = 146,
-        name = "HTML",
-        extension = ['.html', '.hta', '.htm', '.html.hl', '.inc', '.xht', '.xhtml']
-    ),
-    "HTML+ECR": GitLanguageInfo(
-        color = "#2e1052", 
-        language_type = "markup", 
-        language_id = 148,
-        name = "HTML+ECR",
-        extension = ['.ecr']
-    ),
-    "HTML+EEX": GitLanguageInfo(
-        color = "#6e4a7e", 
-        language_type = "markup", 
-        language_id = 149,
-        name = "HTML+EEX",
-        extension = ['.eex', '.html.heex', '.html.leex']
-    ),
-    "HTML+ERB": GitLanguageInfo(
-        color = "#701516", 
-        language_type = "markup", 
-        language_id = 150,
-        name = "HTML+ERB",
-        extension = ['.erb', '.erb.deface', '.rhtml']
-    ),
-    "HTML+PHP": GitLanguageInfo(
-        color = "#4f5d95", 
-        language_type = "markup", 
-        language_id = 151,
-        name = "HTML+PHP",
-        extension = ['.phtml']
-    ),
-    "HTML+Razor": GitLanguageInfo(
-        color = "#512be4", 
-        language_type = "markup", 
-        language_id = 479039817,
-        name = "HTML+Razor",
-        extension = ['.cshtml', '.razor']
-    ),
-    "HTTP": GitLanguageInfo(
-        color = "#005C9C", 
-        language_type = "data", 
-        language_id = 152,
-        name = "HTTP",
-        extension = ['.http']
-    ),
-    "HXML": GitLanguageInfo(
-        color = "#f68712", 
-        language_type = "data", 
-        language_id = 786683730,
-        name = "HXML",
-        extension = ['.hxml']
-    ),
-    "Hack": GitLanguageInfo(
-        color = "#878787", 
-        language_type = "programming", 
-        language_id = 153,
-        name = "Hack",
-        extension = ['.hack', '.hh', '.hhi', '.php']
-    ),
-    "Haml": GitLanguageInfo(
-        color = "#ece2a9", 
-        language_type = "markup", 
-        language_id = 154,
-        name = "Haml",
-        extension = ['.haml', '.haml.deface']
-    ),
-    "Handlebars": GitLanguageInfo(
-        color = "#f7931e", 
-        language_type = "markup", 
-        language_id = 155,
-        name = "Handlebars",
-        extension = ['.handlebars', '.hbs']
-    ),
-    "Harbour": GitLanguageInfo(
-        color = "#0e60e3", 
-        language_type = "programming", 
-        language_id = 156,
-        name = "Harbour",
-        extension = ['.hb']
-    ),
-    "Haskell": GitLanguageInfo(
-        color = "#5e5086", 
-        language_type = "programming", 
-        language_id = 157,
-        name = "Haskell",
-        extension = ['.hs', '.hs-boot', '.hsc']
-    ),
-    "Haxe": GitLanguageInfo(
-        color = "#df7900", 
-        language_type = "programming", 
-        language_id = 158,
-        name = "Haxe",
-        extension = ['.hx', '.hxsl']
-    ),
-    "HiveQL": GitLanguageInfo(
-        color = "#dce200", 
-        language_type = "programming", 
-        language_id = 931814087,
-        name = "HiveQL",
-        extension = ['.q', '.hql']
-    ),
-    "HolyC": GitLanguageInfo(
-        color = "#ffefaf", 
-        language_type = "programming", 
-        language_id = 928121743,
-        name = "HolyC",
-        extension = ['.hc']
-    ),
-    "Hy": GitLanguageInfo(
-        color = "#7790B2", 
-        language_type = "programming", 
-        language_id = 159,
-        name = "Hy",
-        extension = ['.hy']
-    ),
-    "IDL": GitLanguageInfo(
-        color = "#a3522f", 
-        language_type = "programming", 
-        language_id = 161,
-        name = "IDL",
-        extension = ['.pro', '.dlm']
-    ),
-    "IGOR Pro": GitLanguageInfo(
-        color = "#0000cc", 
-        language_type = "programming", 
-        language_id = 162,
-        name = "IGOR Pro",
-        extension = ['.ipf']
-    ),
-    "INI": GitLanguageInfo(
-        color = "#d1dbe0", 
-        language_type = "data", 
-        language_id = 163,
-        name = "INI",
-        extension = ['.ini', '.cfg', '.dof', '.lektorproject', '.prefs', '.pro', '.properties', '.url']
-    ),
-    "Idris": GitLanguageInfo(
-        color = "#b30000", 
-        language_type = "programming", 
-        language_id = 165,
-        name = "Idris",
-        extension = ['.idr', '.lidr']
-    ),
-    "Ignore List": GitLanguageInfo(
-        color = "#000000", 
-        language_type = "data", 
-        language_id = 74444240,
-        name = "Ignore List",
-        extension = ['.gitignore']
-    ),
-    "ImageJ Macro": GitLanguageInfo(
-        color = "#99AAFF", 
-        language_type = "programming", 
-        language_id = 575143428,
-        name = "ImageJ Macro",
-        extension = ['.ijm']
-    ),
-    "Imba": GitLanguageInfo(
-        color = "#16cec6", 
-        language_type = "programming", 
-        language_id = 1057618448,
-        name = "Imba",
-        extension = ['.imba']
-    ),
-    "Inno Setup": GitLanguageInfo(
-        color = "#264b99", 
-        language_type = "programming", 
-        language_id = 167,
-        name = "Inno Setup",
-        extension = ['.iss', '.isl']
-    ),
-    "Io": GitLanguageInfo(
-        color = "#a9188d", 
-        language_type = "programming", 
-        language_id = 168,
-        name = "Io",
-        extension = ['.io']
-    ),
-    "Ioke": GitLanguageInfo(
-        color = "#078193", 
-        language_type = "programming", 
-        language_id = 169,
-        name = "Ioke",
-        extension = ['.ik']
-    ),
-    "Isabelle": GitLanguageInfo(
-        color = "#FEFE00", 
-        language_type = "programming", 
-        language_id = 170,
-        name = "Isabelle",
-        extension = ['.thy']
-    ),
-    "J": GitLanguageInfo(
-        color = "#9EEDFF", 
-        language_type = "programming", 
-        language_id = 172,
-        name = "J",
-        extension = ['.ijs']
-    ),
-    "JFlex": GitLanguageInfo(
-        color = "#DBCA00", 
-        language_type = "programming", 
-        language_id = 173,
-        name = "JFlex",
-        extension = ['.flex', '.jflex']
-    ),
-    "JSON": GitLanguageInfo(
-        color = "#292929", 
-        language_type = "data", 
-        language_id = 174,
-        name = "JSON",
-        extension = ['.json', '.4DForm', '.4DProject', '.avsc', '.geojson', '.gltf', '.har', '.ice', '.JSON-tmLanguage', '.jsonl', '.mcmeta', '.tfstate', '.tfstate.backup', '.topojson', '.webapp', '.webmanifest', '.yy', '.yyp']
-    ),
-    "JSON with Comments": GitLanguageInfo(
-        color = "#292929", 
-        language_type = "data", 
-        language_id = 423,
-        name = "JSON with Comments",
-        extension = ['.jsonc', '.code-snippets', '.sublime-build', '.sublime-commands', '.sublime-completions', '.sublime-keymap', '.sublime-macro', '.sublime-menu', '.sublime-mousemap', '.sublime-project', '.sublime-settings', '.sublime-theme', '.sublime-workspace', '.sublime_metrics', '.sublime_session']
-    ),
-    "JSON5": GitLanguageInfo(
-        color = "#267CB9", 
-        language_type = "data", 
-        language_id = 175,
-        name = "JSON5",
-        extension = ['.json5']
-    ),
-    "JSONLD": GitLanguageInfo(
-        color = "#0c479c", 
-        language_type = "data", 
-        language_id = 176,
-        name = "JSONLD",
-        extension = ['.jsonld']
-    ),
-    "JSONiq": GitLanguageInfo(
-        color = "#40d47e", 
-        language_type = "programming", 
-        language_id = 177,
-        name = "JSONiq",
-        extension = ['.jq']
-    ),
-    "Janet": GitLanguageInfo(
-        color = "#0886a5", 
-        language_type = "programming", 
-        language_id = 1028705371,
-        name = "Janet",
-        extension = ['.janet']
-    ),
-    "Jasmin": GitLanguageInfo(
-        color = "#d03600", 
-        language_type = "programming", 
-        language_id = 180,
-        name = "Jasmin",
-        extension = ['.j']
-    ),
-    "Java": GitLanguageInfo(
-        color = "#b07219", 
-        language_type = "programming", 
-        language_id = 181,
-        name = "Java",
-        extension = ['.java', '.jav', '.jsh']
-    ),
-    "Java Properties": GitLanguageInfo(
-        color = "#2A6277", 
-        language_type = "data", 
-        language_id = 519377561,
-        name = "Java Properties",
-        extension = ['.properties']
-    ),
-    "Java Server Pages": GitLanguageInfo(
-        color = "#2A6277", 
-        language_type = "programming", 
-        language_id = 182,
-        name = "Java Server Pages",
-        extension = ['.jsp', '.tag']
-    ),
-    "JavaScript": GitLanguageInfo(
-        color = "#f1e05a", 
-        language_type = "programming", 
-        language_id = 183,
-        name = "JavaScript",
-        extension = ['.js', '._js', '.bones', '.cjs', '.es', '.es6', '.frag', '.gs', '.jake', '.javascript', '.jsb', '.jscad', '.jsfl', '.jslib', '.jsm', '.jspre', '.jss', '.jsx', '.mjs', '.njs', '.pac', '.sjs', '.ssjs', '.xsjs', '.xsjslib']
-    ),
-    "JavaScript+ERB": GitLanguageInfo(
-        color = "#f1e05a", 
-        language_type = "programming", 
-        language_id = 914318960,
-        name = "JavaScript+ERB",
-        extension = ['.js.erb']
-    ),
-    "Jest Snapshot": GitLanguageInfo(
-        color = "#15c213", 
-        language_type = "data", 
-        language_id = 774635084,
-        name = "Jest Snapshot",
-        extension = ['.snap']
-    ),
-    "JetBrains MPS": GitLanguageInfo(
-        color = "#21D789", 
-        language_type = "programming", 
-        language_id = 465165328,
-        name = "JetBrains MPS",
-        extension = ['.mps', '.mpl', '.msd']
-    ),
-    "Jinja": GitLanguageInfo(
-        color = "#a52a22", 
-        language_type = "markup", 
-        language_id = 147,
-        name = "Jinja",
-        extension = ['.jinja', '.j2', '.jinja2']
-    ),
-    "Jison": GitLanguageInfo(
-        color = "#56b3cb", 
-        language_type = "programming", 
-        language_id = 284531423,
-        name = "Jison",
-        extension = ['.jison']
-    ),
-    "Jison Lex": GitLanguageInfo(
-        color = "#56b3cb", 
-        language_type = "programming", 
-        language_id = 406395330,
-        name = "Jison Lex",
-        extension = ['.jisonlex']
-    ),
-    "Jolie": GitLanguageInfo(
-        color = "#843179", 
-        language_type = "programming", 
-        language_id = 998078858,
-        name = "Jolie",
-        extension = ['.ol', '.iol']
-    ),
-    "Jsonnet": GitLanguageInfo(
-        color = "#0064bd", 
-        language_type = "programming", 
-        language_id = 664885656,
-        name = "Jsonnet",
-        extension = ['.jsonnet', '.libsonnet']
-    ),
-    "Julia": GitLanguageInfo(
-        color = "#a270ba", 
-        language_type = "programming", 
-        language_id = 184,
-        name = "Julia",
-        extension = ['.jl']
-    ),
-    "Jupyter Notebook": GitLanguageInfo(
-        color = "#DA5B0B", 
-        language_type = "markup", 
-        language_id = 185,
-        name = "Jupyter Notebook",
-        extension = ['.ipynb']
-    ),
-    "KRL": GitLanguageInfo(
-        color = "#28430A", 
-        language_type = "programming", 
-        language_id = 186,
-        name = "KRL",
-        extension = ['.krl']
-    ),
-    "Kaitai Struct": GitLanguageInfo(
-        color = "#773b37", 
-        language_type = "programming", 
-        language_id = 818804755,
-        name = "Kaitai Struct",
-        extension = ['.ksy']
-    ),
-    "KakouneScript": GitLanguageInfo(
-        color = "#6f8042", 
-        language_type = "programming", 
-        language_id = 603336474,
-        name = "KakouneScript",
-        extension = ['.kak']
-    ),
-    "KiCad Layout": GitLanguageInfo(
-        color = "#2f4aab", 
-        language_type = "data", 
-        language_id = 187,
-        name = "KiCad Layout",
-        extension = ['.kicad_pcb', '.kicad_mod', '.kicad_wks']
-    ),
-    "KiCad Legacy Layout": GitLanguageInfo(
-        color = "#2f4aab", 
-        language_type = "data", 
-        language_id = 140848857,
-        name = "KiCad Legacy Layout",
-        extension = ['.brd']
-    ),
-    "KiCad Schematic": GitLanguageInfo(
-        color = "#2f4aab", 
-        language_type = "data", 
-        language_id = 622447435,
-        name = "KiCad Schematic",
-        extension = ['.kicad_sch', '.sch']
-    ),
-    "Kotlin": GitLanguageInfo(
-        color = "#A97BFF", 
-        language_type = "programming", 
-        language_id = 189,
-        name = "Kotlin",
-        extension = ['.kt', '.ktm', '.kts']
-    ),
-    "LFE": GitLanguageInfo(
-        color = "#4C3023", 
-        language_type = "programming", 
-        language_id = 190,
-        name = "LFE",
-        extension = ['.lfe']
-    ),
-    "LLVM": GitLanguageInfo(
-        color = "#185619", 
-        language_type = "programming", 
-        language_id = 191,
-        name = "LLVM",
-        extension = ['.ll']
-    ),
-    "LOLCODE": GitLanguageInfo(
-        color = "#cc9900", 
-        language_type = "programming", 
-        language_id = 192,
-        name = "LOLCODE",
-        extension = ['.lol']
-    ),
-    "LSL": GitLanguageInfo(
-        color = "#3d9970", 
-        language_type = "programming", 
-        language_id = 193,
-        name = "LSL",
-        extension = ['.lsl', '.lslp']
-    ),
-    "LabVIEW": GitLanguageInfo(
-        color = "#fede06", 
-        language_type = "programming", 
-        language_id = 194,
-        name = "LabVIEW",
-        extension = ['.lvproj', '.lvclass', '.lvlib']
-    ),
-    "Lark": GitLanguageInfo(
-        color = "#2980B9", 
-        language_type = "data", 
-        language_id = 758480799,
-        name = "Lark",
-        extension = ['.lark']
-    ),
-    "Lasso": GitLanguageInfo(
-        color = "#999999", 
-        language_type = "programming", 
-        language_id = 195,
-        name = "Lasso",
-        extension = ['.lasso', '.las', '.lasso8', '.lasso9']
-    ),
-    "Latte": GitLanguageInfo(
-        color = "#f2a542", 
-        language_type = "markup", 
-        language_id = 196,
-        name = "Latte",
-        extension = ['.latte']
-    ),
-    "Less": GitLanguageInfo(
-        color = "#1d365d", 
-        language_type = "markup", 
-        language_id = 198,
-        name = "Less",
-        extension = ['.less']
-    ),
-    "Lex": GitLanguageInfo(
-        color = "#DBCA00", 
-        language_type = "programming", 
-        language_id = 199,
-        name = "Lex",
-        extension = ['.l', '.lex']
-    ),
-    "LigoLANG": GitLanguageInfo(
-        color = "#0e74ff", 
-        language_type = "programming", 
-        language_id = 1040646257,
-        name = "LigoLANG",
-        extension = ['.ligo']
-    ),
-    "LilyPond": GitLanguageInfo(
-        color = "#9ccc7c", 
-        language_type = "programming", 
-        language_id = 200,
-        name = "LilyPond",
-        extension = ['.ly', '.ily']
-    ),
-    "Liquid": GitLanguageInfo(
-        color = "#67b8de", 
-        language_type = "markup", 
-        language_id = 204,
-        name = "Liquid",
-        extension = ['.liquid']
-    ),
-    "Literate Agda": GitLanguageInfo(
-        color = "#315665", 
-        language_type = "programming", 
-        language_id = 205,
-        name = "Literate Agda",
-        extension = ['.lagda']
-    ),
-    "Literate CoffeeScript": GitLanguageInfo(
-        color = "#244776", 
-        language_type = "programming", 
-        language_id = 206,
-        name = "Literate CoffeeScript",
-        extension = ['.litcoffee', '.coffee.md']
-    ),
-    "Literate Haskell": GitLanguageInfo(
-        color = "#5e5086", 
-        language_type = "programming", 
-        language_id = 207,
-        name = "Literate Haskell",
-        extension = ['.lhs']
-    ),
-    "LiveScript": GitLanguageInfo(
-        color = "#499886", 
-        language_type = "programming", 
-        language_id = 208,
-        name = "LiveScript",
-        extension = ['.ls', '._ls']
-    ),
-    "Logtalk": GitLanguageInfo(
-        color = "#295b9a", 
-        language_type = "programming", 
-        language_id = 210,
-        name = "Logtalk",
-        extension = ['.lgt', '.logtalk']
-    ),
-    "LookML": GitLanguageInfo(
-        color = "#652B81", 
-        language_type = "programming", 
-        language_id = 211,
-        name = "LookML",
-        extension = ['.lookml', '.model.lkml', '.view.lkml']
-    ),
-    "Lua": GitLanguageInfo(
-        color = "#000080", 
-        language_type = "programming", 
-        language_id = 213,
-        name = "Lua",
-        extension = ['.lua', '.fcgi', '.nse', '.p8', '.pd_lua', '.rbxs', '.rockspec', '.wlua']
-    ),
-    "MATLAB": GitLanguageInfo(
-        color = "#e16737", 
-        language_type = "programming", 
-        language_id = 225,
-        name = "MATLAB",
-        extension = ['.matlab', '.m']
-    ),
-    "MAXScript": GitLanguageInfo(
-        color = "#00a6a6", 
-        language_type = "programming", 
-        language_id = 217,
-        name = "MAXScript",
-        extension = ['.ms', '.mcr']
-    ),
-    "MLIR": GitLanguageInfo(
-        color = "#5EC8DB", 
-        language_type = "programming", 
-        language_id = 448253929,
-        name = "MLIR",
-        extension = ['.mlir']
-    ),
-    "MQL4": GitLanguageInfo(
-        color = "#62A8D6", 
-        language_type = "programming", 
-        language_id = 426,
-        name = "MQL4",
-        extension = ['.mq4', '.mqh']
-    ),
-    "MQL5": GitLanguageInfo(
-        color = "#4A76B8", 
-        language_type = "programming", 
-        language_id = 427,
-        name = "MQL5",
-        extension = ['.mq5', '.mqh']
-    ),
-    "MTML": GitLanguageInfo(
-        color = "#b7e1f4", 
-        language_type = "markup", 
-        language_id = 218,
-        name = "MTML",
-        extension = ['.mtml']
-    ),
-    "Macaulay2": GitLanguageInfo(
-        color = "#d8ffff", 
-        language_type = "programming", 
-        language_id = 34167825,
-        name = "Macaulay2",
-        extension = ['.m2']
-    ),
-    "Makefile": GitLanguageInfo(
-        color = "#427819", 
-        language_type = "programming", 
-        language_id = 220,
-        name = "Makefile",
-        extension = ['.mak', '.d', '.make', '.makefile', '.mk', '.mkfile']
-    ),
-    "Mako": GitLanguageInfo(
-        color = "#7e858d", 
-        language_type = "programming", 
-        language_id = 221,
-        name = "Mako",
-        extension = ['.mako', '.mao']
-    ),
-    "Markdown": GitLanguageInfo(
-        color = "#083fa1", 
-        language_type = "prose", 
-        language_id = 222,
-        name = "Markdown",
-        extension = ['.md', '.livemd', '.markdown', '.mdown', '.mdwn', '.mdx', '.mkd', '.mkdn', '.mkdown', '.ronn', '.scd', '.workbook']
-    ),
-    "Marko": GitLanguageInfo(
-        color = "#42bff2", 
-        language_type = "markup", 
-        language_id = 932782397,
-        name = "Marko",
-        extension = ['.marko']
-    ),
-    "Mask": GitLanguageInfo(
-        color = "#f97732", 
-        language_type = "markup", 
-        language_id = 223,
-        name = "Mask",
-        extension = ['.mask']
-    ),
-    "Mathematica": GitLanguageInfo(
-        color = "#dd1100", 
-        language_type = "programming", 
-        language_id = 224,
-        name = "Mathematica",
-        extension = ['.mathematica', '.cdf', '.m', '.ma', '.mt', '.nb', '.nbp', '.wl', '.wlt']
-    ),
-    "Max": GitLanguageInfo(
-        color = "#c4a79c", 
-        language_type = "programming", 
-        language_id = 227,
-        name = "Max",
-        extension = ['.maxpat', '.maxhelp', '.maxproj', '.mxt', '.pat']
-    ),
-    "Mercury": GitLanguageInfo(
-        color = "#ff2b2b", 
-        language_type = "programming", 
-        language_id = 229,
-        name = "Mercury",
-        extension = ['.m', '.moo']
-    ),
-    "Mermaid": GitLanguageInfo(
-        color = "#ff3670", 
-        language_type = "markup", 
-        language_id = 385992043,
-        name = "Mermaid",
-        extension = ['.mmd', '.mermaid']
-    ),
-    "Metal": GitLanguageInfo(
-        color = "#8f14e9", 
-        language_type = "programming", 
-        language_id = 230,
-        name = "Metal",
-        extension = ['.metal']
-    ),
-    "MiniYAML": GitLanguageInfo(
-        color = "#ff1111", 
-        language_type = "data", 
-        language_id = 4896465,
-        name = "MiniYAML",
-        extension = ['.yaml', '.yml']
-    ),
-    "Mint": GitLanguageInfo(
-        color = "#02b046", 
-        language_type = "programming", 
-        language_id = 968740319,
-        name = "Mint",
-        extension = ['.mint']
-    ),
-    "Mirah": GitLanguageInfo(
-        color = "#c7a938", 
-        language_type = "programming", 
-        language_id = 232,
-        name = "Mirah",
-        extension = ['.druby', '.duby', '.mirah']
-    ),
-    "Modelica": GitLanguageInfo(
-        color = "#de1d31", 
-        language_type = "programming", 
-        language_id = 233,
-        name = "Modelica",
-        extension = ['.mo']
-    ),
-    "Modula-2": GitLanguageInfo(
-        color = "#10253f", 
-        language_type = "programming", 
-        language_id = 234,
-        name = "Modula-2",
-        extension = ['.mod']
-    ),
-    "Modula-3": GitLanguageInfo(
-        color = "#223388", 
-        language_type = "programming", 
-        language_id = 564743864,
-        name = "Modula-3",
-        extension = ['.i3', '.ig', '.m3', '.mg']
-    ),
-    "Monkey C": GitLanguageInfo(
-        color = "#8D6747", 
-        language_type = "programming", 
-        language_id = 231751931,
-        name = "Monkey C",
-        extension = ['.mc']
-    ),
-    "MoonScript": GitLanguageInfo(
-        color = "#ff4585", 
-        language_type = "programming", 
-        language_id = 238,
-        name = "MoonScript",
-        extension = ['.moon']
-    ),
-    "Motoko": GitLanguageInfo(
-        color = "#fbb03b", 
-        language_type = "programming", 
-        language_id = 202937027,
-        name = "Motoko",
-        extension = ['.mo']
-    ),
-    "Motorola 68K Assembly": GitLanguageInfo(
-        color = "#005daa", 
-        language_type = "programming", 
-        language_id = 477582706,
-        name = "Motorola 68K Assembly",
-        extension = ['.asm', '.i', '.inc', '.s', '.x68']
-    ),
-    "Move": GitLanguageInfo(
-        color = "#4a137a", 
-        language_type = "programming", 
-        language_id = 638334599,
-        name = "Move",
-        extension = ['.move']
-    ),
-    "Mustache": GitLanguageInfo(
-        color = "#724b3b", 
-        language_type = "markup", 
-        language_id = 638334590,
-        name = "Mustache",
-        extension = ['.mustache']
-    ),
-    "NCL": GitLanguageInfo(
-        color = "#28431f", 
-        language_type = "programming", 
-        language_id = 240,
-        name = "NCL",
-        extension = ['.ncl']
-    ),
-    "NWScript": GitLanguageInfo(
-        color = "#111522", 
-        language_type = "programming", 
-        language_id = 731233819,
-        name = "NWScript",
-        extension = ['.nss']
-    ),
-    "Nasal": GitLanguageInfo(
-        color = "#1d2c4e", 
-        language_type = "programming", 
-        language_id = 178322513,
-        name = "Nasal",
-        extension = ['.nas']
-    ),
-    "Nearley": GitLanguageInfo(
-        color = "#990000", 
-        language_type = "programming", 
-        language_id = 521429430,
-        name = "Nearley",
-        extension = ['.ne', '.nearley']
-    ),
-    "Nemerle": GitLanguageInfo(
-        color = "#3d3c6e", 
-        language_type = "programming", 
-        language_id = 243,
-        name = "Nemerle",
-        extension = ['.n']
-    ),
-    "NetLinx": GitLanguageInfo(
-        color = "#0aa0ff", 
-        language_type = "programming", 
-        language_id = 244,
-        name = "NetLinx",
-        extension = ['.axs', '.axi']
-    ),
-    "NetLinx+ERB": GitLanguageInfo(
-        color = "#747faa", 
-        language_type = "programming", 
-        language_id = 245,
-        name = "NetLinx+ERB",
-        extension = ['.axs.erb', '.axi.erb']
-    ),
-    "NetLogo": GitLanguageInfo(
-        color = "#ff6375", 
-        language_type = "programming", 
-        language_id = 246,
-        name = "NetLogo",
-        extension = ['.nlogo']
-    ),
-    "NewLisp": GitLanguageInfo(
-        color = "#87AED7", 
-        language_type = "programming", 
-        language_id = 247,
-        name = "NewLisp",
-        extension = ['.nl', '.lisp', '.lsp']
-    ),
-    "Nextflow": GitLanguageInfo(
-        color = "#3ac486", 
-        language_type = "programming", 
-        language_id = 506780613,
-        name = "Nextflow",
-        extension = ['.nf']
-    ),
-    "Nginx": GitLanguageInfo(
-        color = "#009639", 
-        language_type = "data", 
-        language_id = 248,
-        name = "Nginx",
-        extension = ['.nginx', '.nginxconf', '.vhost']
-    ),
-    "Nim": GitLanguageInfo(
-        color = "#ffc200", 
-        language_type = "programming", 
-        language_id = 249,
-        name = "Nim",
-        extension = ['.nim', '.nim.cfg', '.nimble', '.nimrod', '.nims']
-    ),
-    "Nit": GitLanguageInfo(
-        color = "#009917", 
-        language_type = "programming", 
-        language_id = 251,
-        name = "Nit",
-        extension = ['.nit']
-    ),
-    "Nix": GitLanguageInfo(
-        color = "#7e7eff", 
-        language_type = "programming", 
-        language_id = 252,
-        name = "Nix",
-        extension = ['.nix']
-    ),
-    "Nu": GitLanguageInfo(
-        color = "#c9df40", 
-        language_type = "programming", 
-        language_id = 253,
-        name = "Nu",
-        extension = ['.nu']
-    ),
-    "NumPy": GitLanguageInfo(
-        color = "#9C8AF9", 
-        language_type = "programming", 
-        language_id = 254,
-        name = "NumPy",
-        extension = ['.numpy', '.numpyw', '.numsc']
-    ),
-    "Nunjucks": GitLanguageInfo(
-        color = "#3d8137", 
-        language_type = "markup", 
-        language_id = 461856962,
-        name = "Nunjucks",
-        extension = ['.njk']
-    ),
-    "OASv2-json": GitLanguageInfo(
-        color = "#85ea2d", 
-        language_type = "data", 
-        language_id = 834374816,
-        name = "OASv2-json",
-        extension = ['.json']
-    ),
-    "OASv2-yaml": GitLanguageInfo(
-        color = "#85ea2d", 
-        language_type = "data", 
-        language_id = 105187618,
-        name = "OASv2-yaml",
-        extension = ['.yaml', '.yml']
-    ),
-    "OASv3-json": GitLanguageInfo(
-        color = "#85ea2d", 
-        language_type = "data", 
-        language_id = 980062566,
-        name = "OASv3-json",
-        extension = ['.json']
-    ),
-    "OASv3-yaml": GitLanguageInfo(
-        color = "#85ea2d", 
-        language_type = "data", 
-        language_id = 51239111,
-        name = "OASv3-yaml",
-        extension = ['.yaml', '.yml']
-    ),
-    "OCaml": GitLanguageInfo(
-        color = "#3be133", 
-        language_type = "programming", 
-        language_id = 255,
-        name = "OCaml",
-        extension = ['.ml', '.eliom', '.eliomi', '.ml4', '.mli', '.mll', '.mly']
-    ),
-    "ObjectScript": GitLanguageInfo(
-        color = "#424893", 
-        language_type = "programming", 
-        language_id = 202735509,
-        name = "ObjectScript",
-        extension = ['.cls']
-    ),
-    "Objective-C": GitLanguageInfo(
-        color = "#438eff", 
-        language_type = "programming", 
-        language_id = 257,
-        name = "Objective-C",
-        extension = ['.m', '.h']
-    ),
-    "Objective-C++": GitLanguageInfo(
-        color = "#6866fb", 
-        language_type = "programming", 
-        language_id = 258,
-        name = "Objective-C++",
-        extension = ['.mm']
-    ),
-    "Objective-J": GitLanguageInfo(
-        color = "#ff0c5a", 
-        language_type = "programming", 
-        language_id = 259,
-        name = "Objective-J",
-        extension = ['.j', '.sj']
-    ),
-    "Odin": GitLanguageInfo(
-        color = "#60AFFE", 
-        language_type = "programming", 
-        language_id = 889244082,
-        name = "Odin",
-        extension = ['.odin']
-    ),
-    "Omgrofl": GitLanguageInfo(
-        color = "#cabbff", 
-        language_type = "programming", 
-        language_id = 260,
-        name = "Omgrofl",
-        extension = ['.omgrofl']
-    ),
-    "Opal": GitLanguageInfo(
-        color = "#f7ede0", 
-        language_type = "programming", 
-        language_id = 262,
-        name = "Opal",
-        extension = ['.opal']
-    ),
-    "Open Policy Agent": GitLanguageInfo(
-        color = "#7d9199", 
-        language_type = "programming", 
-        language_id = 840483232,
-        name = "Open Policy Agent",
-        extension = ['.rego']
-    ),
-    "OpenCL": GitLanguageInfo(
-        color = "#ed2e2d", 
-        language_type = "programming", 
-        language_id = 263,
-        name = "OpenCL",
-        extension = ['.cl', '.opencl']
-    ),
-    "OpenEdge ABL": GitLanguageInfo(
-        color = "#5ce600", 
-        language_type = "programming", 
-        language_id = 264,
-        name = "OpenEdge ABL",
-        extension = ['.p', '.cls', '.w']
-    ),
-    "OpenQASM": GitLanguageInfo(
-        color = "#AA70FF", 
-        language_type = "programming", 
-        language_id = 153739399,
-        name = "OpenQASM",
-        extension = ['.qasm']
-    ),
-    "OpenSCAD": GitLanguageInfo(
-        color = "#e5cd45", 
-        language_type = "programming", 
-        language_id = 266,
-        name = "OpenSCAD",
-        extension = ['.scad']
-    ),
-    "Org": GitLanguageInfo(
-        color = "#77aa99", 
-        language_type = "prose", 
-        language_id = 267,
-        name = "Org",
-        extension = ['.org']
-    ),
-    "Oxygene": GitLanguageInfo(
-        color = "#cdd0e3", 
-        language_type = "programming", 
-        language_id = 269,
-        name = "Oxygene",
-        extension = ['.oxygene']
-    ),
-    "Oz": GitLanguageInfo(
-        color = "#fab738", 
-        language_type = "programming", 
-        language_id = 270,
-        name = "Oz",
-        extension = ['.oz']
-    ),
-    "P4": GitLanguageInfo(
-        color = "#7055b5", 
-        language_type = "programming", 
-        language_id = 348895984,
-        name = "P4",
-        extension = ['.p4']
-    ),
-    "PDDL": GitLanguageInfo(
-        color = "#0d00ff", 
-        language_type = "programming", 
-        language_id = 736235603,
-        name = "PDDL",
-        extension = ['.pddl']
-    ),
-    "PEG.js": GitLanguageInfo(
-        color = "#234d6b", 
-        language_type = "programming", 
-        language_id = 81442128,
-        name = "PEG.js",
-        extension = ['.pegjs']
-    ),
-    "PHP": GitLanguageInfo(
-        color = "#4F5D95", 
-        language_type = "programming", 
-        language_id = 272,
-        name = "PHP",
-        extension = ['.php', '.aw', '.ctp', '.fcgi', '.inc', '.php3', '.php4', '.php5', '.phps', '.phpt']
-    ),
-    "PLSQL": GitLanguageInfo(
-        color = "#dad8d8", 
-        language_type = "programming", 
-        language_id = 273,
-        name = "PLSQL",
-        extension = ['.pls', '.bdy', '.ddl', '.fnc', '.pck', '.pkb', '.pks', '.plb', '.plsql', '.prc', '.spc', '.sql', '.tpb', '.tps', '.trg', '.vw']
-    ),
-    "PLpgSQL": GitLanguageInfo(
-        color = "#336790", 
-        language_type = "programming", 
-        language_id = 274,
-        name = "PLpgSQL",
-        extension = ['.pgsql', '.sql']
-    ),
-    "POV-Ray SDL": GitLanguageInfo(
-        color = "#6bac65", 
-        language_type = "programming", 
-        language_id = 275,
-        name = "POV-Ray SDL",
-        extension = ['.pov', '.inc']
-    ),
-    "Pan": GitLanguageInfo(
-        color = "#cc0000", 
-        language_type = "programming", 
-        language_id = 276,
-        name = "Pan",
-        extension = ['.pan']
-    ),
-    "Papyrus": GitLanguageInfo(
-        color = "#6600cc", 
-        language_type = "programming", 
-        language_id = 277,
-        name = "Papyrus",
-        extension = ['.psc']
-    ),
-    "Parrot": GitLanguageInfo(
-        color = "#f3ca0a", 
-        language_type = "programming", 
-        language_id = 278,
-        name = "Parrot",
-        extension = ['.parrot']
-    ),
-    "Pascal": GitLanguageInfo(
-        color = "#E3F171", 
-        language_type = "programming", 
-        language_id = 281,
-        name = "Pascal",
-        extension = ['.pas', '.dfm', '.dpr', '.inc', '.lpr', '.pascal', '.pp']
-    ),
-    "Pawn": GitLanguageInfo(
-        color = "#dbb284", 
-        language_type = "programming", 
-        language_id = 271,
-        name = "Pawn",
-        extension = ['.pwn', '.inc', '.sma']
-    ),
-    "Pep8": GitLanguageInfo(
-        color = "#C76F5B", 
-        language_type = "programming", 
-        language_id = 840372442,
-        name = "Pep8",
-        extension = ['.pep']
-    ),
-    "Perl": GitLanguageInfo(
-        color = "#0298c3", 
-        language_type = "programming", 
-        language_id = 282,
-        name = "Perl",
-        extension = ['.pl', '.al', '.cgi', '.fcgi', '.perl', '.ph', '.plx', '.pm', '.psgi', '.t']
-    ),
-    "PicoLisp": GitLanguageInfo(
-        color = "#6067af", 
-        language_type = "programming", 
-        language_id = 285,
-        name = "PicoLisp",
-        extension = ['.l']
-    ),
-    "PigLatin": GitLanguageInfo(
-        color = "#fcd7de", 
-        language_type = "programming", 
-        language_id = 286,
-        name = "PigLatin",
-        extension = ['.pig']
-    ),
-    "Pike": GitLanguageInfo(
-        color = "#005390", 
-        language_type = "programming", 
-        language_id = 287,
-        name = "Pike",
-        extension = ['.pike', '.pmod']
-    ),
-    "PogoScript": GitLanguageInfo(
-        color = "#d80074", 
-        language_type = "programming", 
-        language_id = 289,
-        name = "PogoScript",
-        extension = ['.pogo']
-    ),
-    "Polar": GitLanguageInfo(
-        color = "#ae81ff", 
-        language_type = "programming", 
-        language_id = 839112914,
-        name = "Polar",
-        extension = ['.polar']
-    ),
-    "Portugol": GitLanguageInfo(
-        color = "#f8bd00", 
-        language_type = "programming", 
-        language_id = 832391833,
-        name = "Portugol",
-        extension = ['.por']
-    ),
-    "PostCSS": GitLanguageInfo(
-        color = "#dc3a0c", 
-        language_type = "markup", 
-        language_id = 262764437,
-        name = "PostCSS",
-        extension = ['.pcss', '.postcss']
-    ),
-    "PostScript": GitLanguageInfo(
-        color = "#da291c", 
-        language_type = "markup", 
-        language_id = 291,
-        name = "PostScript",
-        extension = ['.ps', '.eps', '.epsi', '.pfa']
-    ),
-    "PowerBuilder": GitLanguageInfo(
-        color = "#8f0f8d", 
-        language_type = "programming", 
-        language_id = 292,
-        name = "PowerBuilder",
-        extension = ['.pbt', '.sra', '.sru', '.srw']
-    ),
-    "PowerShell": GitLanguageInfo(
-        color = "#012456", 
-        language_type = "programming", 
-        language_id = 293,
-        name = "PowerShell",
-        extension = ['.ps1', '.psd1', '.psm1']
-    ),
-    "Prisma": GitLanguageInfo(
-        color = "#0c344b", 
-        language_type = "data", 
-        language_id = 499933428,
-        name = "Prisma",
-        extension = ['.prisma']
-    ),
-    "Processing": GitLanguageInfo(
-        color = "#0096D8", 
-        language_type = "programming", 
-        language_id = 294,
-        name = "Processing",
-        extension = ['.pde']
-    ),
-    "Prolog": GitLanguageInfo(
-        color = "#74283c", 
-        language_type = "programming", 
-        language_id = 295,
-        name = "Prolog",
-        extension = ['.pl', '.pro', '.prolog', '.yap']
-    ),
-    "Promela": GitLanguageInfo(
-        color = "#de0000", 
-        language_type = "programming", 
-        language_id = 441858312,
-        name = "Promela",
-        extension = ['.pml']
-    ),
-    "Propeller Spin": GitLanguageInfo(
-        color = "#7fa2a7", 
-        language_type = "programming", 
-        language_id = 296,
-        name = "Propeller Spin",
-        extension = ['.spin']
-    ),
-    "Pug": GitLanguageInfo(
-        color = "#a86454", 
-        language_type = "markup", 
-        language_id = 179,
-        name = "Pug",
-        extension = ['.jade', '.pug']
-    ),
-    "Puppet": GitLanguageInfo(
-        color = "#302B6D", 
-        language_type = "programming", 
-        language_id = 299,
-        name = "Puppet",
-        extension = ['.pp']
-    ),
-    "PureBasic": GitLanguageInfo(
-        color = "#5a6986", 
-        language_type = "programming", 
-        language_id = 301,
-        name = "PureBasic",
-        extension = ['.pb', '.pbi']
-    ),
-    "PureScript": GitLanguageInfo(
-        color = "#1D222D", 
-        language_type = "programming", 
-        language_id = 302,
-        name = "PureScript",
-        extension = ['.purs']
-    ),
-    "Python": GitLanguageInfo(
-        color = "#3572A5", 
-        language_type = "programming", 
-        language_id = 303,
-        name = "Python",
-        extension = ['.py', '.cgi', '.fcgi', '.gyp', '.gypi', '.lmi', '.py3', '.pyde', '.pyi', '.pyp', '.pyt', '.pyw', '.rpy', '.smk', '.spec', '.tac', '.wsgi', '.xpy']
-    ),
-    "Python traceback": GitLanguageInfo(
-        color = "#3572A5", 
-        language_type = "data", 
-        language_id = 304,
-        name = "Python traceback",
-        extension = ['.pytb']
-    ),
-    "Q#": GitLanguageInfo(
-        color = "#fed659", 
-        language_type = "programming", 
-        language_id = 697448245,
-        name = "Q#",
-        extension = ['.qs']
-    ),
-    "QML": GitLanguageInfo(
-        color = "#44a51c", 
-        language_type = "programming", 
-        language_id = 305,
-        name = "QML",
-        extension = ['.qml', '.qbs']
-    ),
-    "Qt Script": GitLanguageInfo(
-        color = "#00b841", 
-        language_type = "programming", 
-        language_id = 558193693,
-        name = "Qt Script",
-        extension = ['.qs']
-    ),
-    "R": GitLanguageInfo(
-        color = "#198CE7", 
-        language_type = "programming", 
-        language_id = 307,
-        name = "R",
-        extension = ['.r', '.rd', '.rsx']
-    ),
-    "RAML": GitLanguageInfo(
-        color = "#77d9fb", 
-        language_type = "markup", 
-        language_id = 308,
-        name = "RAML",
-        extension = ['.raml']
-    ),
-    "RDoc": GitLanguageInfo(
-        color = "#701516", 
-        language_type = "prose", 
-        language_id = 309,
-        name = "RDoc",
-        extension = ['.rdoc']
-    ),
-    "REXX": GitLanguageInfo(
-        color = "#d90e09", 
-        language_type = "programming", 
-        language_id = 311,
-        name = "REXX",
-        extension = ['.rexx', '.pprx', '.rex']
-    ),
-    "RMarkdown": GitLanguageInfo(
-        color = "#198ce7", 
-        language_type = "prose", 
-        language_id = 313,
-        name = "RMarkdown",
-        extension = ['.qmd', '.rmd']
-    ),
-    "RPGLE": GitLanguageInfo(
-        color = "#2BDE21", 
-        language_type = "programming", 
-        language_id = 609977990,
-        name = "RPGLE",
-        extension = ['.rpgle', '.sqlrpgle']
-    ),
-    "RUNOFF": GitLanguageInfo(
-        color = "#665a4e", 
-        language_type = "markup", 
-        language_id = 315,
-        name = "RUNOFF",
-        extension = ['.rnh', '.rno']
-    ),
-    "Racket": GitLanguageInfo(
-        color = "#3c5caa", 
-        language_type = "programming", 
-        language_id = 316,
-        name = "Racket",
-        extension = ['.rkt', '.rktd', '.rktl', '.scrbl']
-    ),
-    "Ragel": GitLanguageInfo(
-        color = "#9d5200", 
-        language_type = "programming", 
-        language_id = 317,
-        name = "Ragel",
-        extension = ['.rl']
-    ),
-    "Raku": GitLanguageInfo(
-        color = "#0000fb", 
-        language_type = "programming", 
-        language_id = 283,
-        name = "Raku",
-        extension = ['.6pl', '.6pm', '.nqp', '.p6', '.p6l', '.p6m', '.pl', '.pl6', '.pm', '.pm6', '.raku', '.rakumod', '.t']
-    ),
-    "Rascal": GitLanguageInfo(
-        color = "#fffaa0", 
-        language_type = "programming", 
-        language_id = 173616037,
-        name = "Rascal",
-        extension = ['.rsc']
-    ),
-    "ReScript": GitLanguageInfo(
-        color = "#ed5051", 
-        language_type = "programming", 
-        language_id = 501875647,
-        name = "ReScript",
-        extension = ['.res']
-    ),
-    "Reason": GitLanguageInfo(
-        color = "#ff5847", 
-        language_type = "programming", 
-        language_id = 869538413,
-        name = "Reason",
-        extension = ['.re', '.rei']
-    ),
-    "ReasonLIGO": GitLanguageInfo(
-        color = "#ff5847", 
-        language_type = "programming", 
-        language_id = 319002153,
-        name = "ReasonLIGO",
-        extension = ['.religo']
-    ),
-    "Rebol": GitLanguageInfo(
-        color = "#358a5b", 
-        language_type = "programming", 
-        language_id = 319,
-        name = "Rebol",
-        extension = ['.reb', '.r', '.r2', '.r3', '.rebol']
-    ),
-    "Red": GitLanguageInfo(
-        color = "#f50000", 
-        language_type = "programming", 
-        language_id = 320,
-        name = "Red",
-        extension = ['.red', '.reds']
-    ),
-    "Regular Expression": GitLanguageInfo(
-        color = "#009a00", 
-        language_type = "data", 
-        language_id = 363378884,
-        name = "Regular Expression",
-        extension = ['.regexp', '.regex']
-    ),
-    "Ren'Py": GitLanguageInfo(
-        color = "#ff7f7f", 
-        language_type = "programming", 
-        language_id = 322,
-        name = "Ren'Py",
-        extension = ['.rpy']
-    ),
-    "Ring": GitLanguageInfo(
-        color = "#2D54CB", 
-        language_type = "programming", 
-        language_id = 431,
-        name = "Ring",
-        extension = ['.ring']
-    ),
-    "Riot": GitLanguageInfo(
-        color = "#A71E49", 
-        language_type = "markup", 
-        language_id = 878396783,
-        name = "Riot",
-        extension = ['.riot']
-    ),
-    "RobotFramework": GitLanguageInfo(
-        color = "#00c0b5", 
-        language_type = "programming", 
-        language_id = 324,
-        name = "RobotFramework",
-        extension = ['.robot']
-    ),
-    "Roff": GitLanguageInfo(
-        color = "#ecdebe", 
-        language_type = "markup", 
-        language_id = 141,
-        name = "Roff",
-        extension = ['.roff', '.1', '.1in', '.1m', '.1x', '.2', '.3', '.3in', '.3m', '.3p', '.3pm', '.3qt', '.3x', '.4', '.5', '.6', '.7', '.8', '.9', '.l', '.man', '.mdoc', '.me', '.ms', '.n', '.nr', '.rno', '.tmac']
-    ),
-    "Roff Manpage": GitLanguageInfo(
-        color = "#ecdebe", 
-        language_type = "markup", 
-        language_id = 612669833,
-        name = "Roff Manpage",
-        extension = ['.1', '.1in', '.1m', '.1x', '.2', '.3', '.3in', '.3m', '.3p', '.3pm', '.3qt', '.3x', '.4', '.5', '.6', '.7', '.8', '.9', '.man', '.mdoc']
-    ),
-    "Rouge": GitLanguageInfo(
-        color = "#cc0088", 
-        language_type = "programming", 
-        language_id = 325,
-        name = "Rouge",
-        extension = ['.rg']
-    ),
-    "RouterOS Script": GitLanguageInfo(
-        color = "#DE3941", 
-        language_type = "programming", 
-        language_id = 592853203,
-        name = "RouterOS Script",
-        extension = ['.rsc']
-    ),
-    "Ruby": GitLanguageInfo(
-        color = "#701516", 
-        language_type = "programming", 
-        language_id = 326,
-        name = "Ruby",
-        extension = ['.rb', '.builder', '.eye', '.fcgi', '.gemspec', '.god', '.jbuilder', '.mspec', '.pluginspec', '.podspec', '.prawn', '.rabl', '.rake', '.rbi', '.rbuild', '.rbw', '.rbx', '.ru', '.ruby', '.spec', '.thor', '.watchr']
-    ),
-    "Rust": GitLanguageInfo(
-        color = "#dea584", 
-        language_type = "programming", 
-        language_id = 327,
-        name = "Rust",
-        extension = ['.rs', '.rs.in']
-    ),
-    "SAS": GitLanguageInfo(
-        color = "#B34936", 
-        language_type = "programming", 
-        language_id = 328,
-        name = "SAS",
-        extension = ['.sas']
-    ),
-    "SCSS": GitLanguageInfo(
-        color = "#c6538c", 
-        language_type = "markup", 
-        language_id = 329,
-        name = "SCSS",
-        extension = ['.scss']
-    ),
-    "SPARQL": GitLanguageInfo(
-        color = "#0C4597", 
-        language_type = "data", 
-        language_id = 331,
-        name = "SPARQL",
-        extension = ['.sparql', '.rq']
-    ),
-    "SQF": GitLanguageInfo(
-        color = "#3F3F3F", 
-        language_type = "programming", 
-        language_id = 332,
-        name = "SQF",
-        extension = ['.sqf', '.hqf']
-    ),
-    "SQL": GitLanguageInfo(
-        color = "#e38c00", 
-        language_type = "data", 
-        language_id = 333,
-        name = "SQL",
-        extension = ['.sql', '.cql', '.ddl', '.inc', '.mysql', '.prc', '.tab', '.udf', '.viw']
-    ),
-    "SQLPL": GitLanguageInfo(
-        color = "#e38c00", 
-        language_type = "programming", 
-        language_id = 334,
-        name = "SQLPL",
-        extension = ['.sql', '.db2']
-    ),
-    "SRecode Template": GitLanguageInfo(
-        color = "#348a34", 
-        language_type = "markup", 
-        language_id = 335,
-        name = "SRecode Template",
-        extension = ['.srt']
-    ),
-    "STL": GitLanguageInfo(
-        color = "#373b5e", 
-        language_type = "data", 
-        language_id = 455361735,
-        name = "STL",
-        extension = ['.stl']
-    ),
-    "SVG": GitLanguageInfo(
-        color = "#ff9900", 
-        language_type = "data", 
-        language_id = 337,
-        name = "SVG",
-        extension = ['.svg']
-    ),
-    "SaltStack": GitLanguageInfo(
-        color = "#646464", 
-        language_type = "programming", 
-        language_id = 339,
-        name = "SaltStack",
-        extension = ['.sls']
-    ),
-    "Sass": GitLanguageInfo(
-        color = "#a53b70", 
-        language_type = "markup", 
-        language_id = 340,
-        name = "Sass",
-        extension = ['.sass']
-    ),
-    "Scala": GitLanguageInfo(
-        color = "#c22d40", 
-        language_type = "programming", 
-        language_id = 341,
-        name = "Scala",
-        extension = ['.scala', '.kojo', '.sbt', '.sc']
-    ),
-    "Scaml": GitLanguageInfo(
-        color = "#bd181a", 
-        language_type = "markup", 
-        language_id = 342,
-        name = "Scaml",
-        extension = ['.scaml']
-    ),
-    "Scenic": GitLanguageInfo(
-        color = "#fdc700", 
-        language_type = "programming", 
-        language_id = 619814037,
-        name = "Scenic",
-        extension = ['.scenic']
-    ),
-    "Scheme": GitLanguageInfo(
-        color = "#1e4aec", 
-        language_type = "programming", 
-        language_id = 343,
-        name = "Scheme",
-        extension = ['.scm', '.sch', '.sld', '.sls', '.sps', '.ss']
-    ),
-    "Scilab": GitLanguageInfo(
-        color = "#ca0f21", 
-        language_type = "programming", 
-        language_id = 344,
-        name = "Scilab",
-        extension = ['.sci', '.sce', '.tst']
-    ),
-    "Self": GitLanguageInfo(
-        color = "#0579aa", 
-        language_type = "programming", 
-        language_id = 345,
-        name = "Self",
-        extension = ['.self']
-    ),
-    "ShaderLab": GitLanguageInfo(
-        color = "#222c37", 
-        language_type = "programming", 
-        language_id = 664257356,
-        name = "ShaderLab",
-        extension = ['.shader']
-    ),
-    "Shell": GitLanguageInfo(
-        color = "#89e051", 
-        language_type = "programming", 
-        language_id = 346,
-        name = "Shell",
-        extension = ['.sh', '.bash', '.bats', '.cgi', '.command', '.env', '.fcgi', '.ksh', '.sh.in', '.tmux', '.tool', '.zsh', '.zsh-theme']
-    ),
-    "Shen": GitLanguageInfo(
-        color = "#120F14", 
-        language_type = "programming", 
-        language_id = 348,
-        name = "Shen",
-        extension = ['.shen']
-    ),
-    "Simple File Verification": GitLanguageInfo(
-        color = "#C9BFED", 
-        language_type = "data", 
-        language_id = 735623761,
-        name = "Simple File Verification",
-        extension = ['.sfv']
-    ),
-    "Slash": GitLanguageInfo(
-        color = "#007eff", 
-        language_type = "programming", 
-        language_id = 349,
-        name = "Slash",
-        extension = ['.sl']
-    ),
-    "Slice": GitLanguageInfo(
-        color = "#003fa2", 
-        language_type = "programming", 
-        language_id = 894641667,
-        name = "Slice",
-        extension = ['.ice']
-    ),
-    "Slim": GitLanguageInfo(
-        color = "#2b2b2b", 
-        language_type = "markup", 
-        language_id = 350,
-        name = "Slim",
-        extension = ['.slim']
-    ),
-    "SmPL": GitLanguageInfo(
-        color = "#c94949", 
-        language_type = "programming", 
-        language_id = 164123055,
-        name = "SmPL",
-        extension = ['.cocci']
-    ),
-    "Smalltalk": GitLanguageInfo(
-        color = "#596706", 
-        language_type = "programming", 
-        language_id = 352,
-        name = "Smalltalk",
-        extension = ['.st', '.cs']
-    ),
-    "Smarty": GitLanguageInfo(
-        color = "#f0c040", 
-        language_type = "programming", 
-        language_id = 353,
-        name = "Smarty",
-        extension = ['.tpl']
-    ),
-    "Smithy": GitLanguageInfo(
-        color = "#c44536", 
-        language_type = "programming", 
-        language_id = 1027892786,
-        name = "Smithy",
-        extension = ['.smithy']
-    ),
-    "Solidity": GitLanguageInfo(
-        color = "#AA6746", 
-        language_type = "programming", 
-        language_id = 237469032,
-        name = "Solidity",
-        extension = ['.sol']
-    ),
-    "SourcePawn": GitLanguageInfo(
-        color = "#f69e1d", 
-        language_type = "programming", 
-        language_id = 354,
-        name = "SourcePawn",
-        extension = ['.sp', '.inc']
-    ),
-    "Squirrel": GitLanguageInfo(
-        color = "#800000", 
-        language_type = "programming", 
-        language_id = 355,
-        name = "Squirrel",
-        extension = ['.nut']
-    ),
-    "Stan": GitLanguageInfo(
-        color = "#b2011d", 
-        language_type = "programming", 
-        language_id = 356,
-        name = "Stan",
-        extension = ['.stan']
-    ),
-    "Standard ML": GitLanguageInfo(
-        color = "#dc566d", 
-        language_type = "programming", 
-        language_id = 357,
-        name = "Standard ML",
-        extension = ['.ml', '.fun', '.sig', '.sml']
-    ),
-    "Starlark": GitLanguageInfo(
-        color = "#76d275", 
-        language_type = "programming", 
-        language_id = 960266174,
-        name = "Starlark",
-        extension = ['.bzl', '.star']
-    ),
-    "Stata": GitLanguageInfo(
-        color = "#1a5f91", 
-        language_type = "programming", 
-        language_id = 358,
-        name = "Stata",
-        extension = ['.do', '.ado', '.doh', '.ihlp', '.mata', '.matah', '.sthlp']
-    ),
-    "StringTemplate": GitLanguageInfo(
-        color = "#3fb34f", 
-        language_type = "markup", 
-        language_id = 89855901,
-        name = "StringTemplate",
-        extension = ['.st']
-    ),
-    "Stylus": GitLanguageInfo(
-        color = "#ff6347", 
-        language_type = "markup", 
-        language_id = 359,
-        name = "Stylus",
-        extension = ['.styl']
-    ),
-    "SubRip Text": GitLanguageInfo(
-        color = "#9e0101", 
-        language_type = "data", 
-        language_id = 360,
-        name = "SubRip Text",
-        extension = ['.srt']
-    ),
-    "SugarSS": GitLanguageInfo(
-        color = "#2fcc9f", 
-        language_type = "markup", 
-        language_id = 826404698,
-        name = "SugarSS",
-        extension = ['.sss']
-    ),
-    "SuperCollider": GitLanguageInfo(
-        color = "#46390b", 
-        language_type = "programming", 
-        language_id = 361,
-        name = "SuperCollider",
-        extension = ['.sc', '.scd']
-    ),
-    "Svelte": GitLanguageInfo(
-        color = "#ff3e00", 
-        language_type = "markup", 
-        language_id = 928734530,
-        name = "Svelte",
-        extension = ['.svelte']
-    ),
-    "Swift": GitLanguageInfo(
-        color = "#F05138", 
-        language_type = "programming", 
-        language_id = 362,
-        name = "Swift",
-        extension = ['.swift']
-    ),
-    "SystemVerilog": GitLanguageInfo(
-        color = "#DAE1C2", 
-        language_type = "programming", 
-        language_id = 363,
-        name = "SystemVerilog",
-        extension = ['.sv', '.svh', '.vh']
-    ),
-    "TI Program": GitLanguageInfo(
-        color = "#A0AA87", 
-        language_type = "programming", 
-        language_id = 422,
-        name = "TI Program",
-        extension = ['.8xp', '.8xk', '.8xk.txt', '.8xp.txt']
-    ),
-    "TLA": GitLanguageInfo(
-        color = "#4b0079", 
-        language_type = "programming", 
-        language_id = 364,
-        name = "TLA",
-        extension = ['.tla']
-    ),
-    "TOML": GitLanguageInfo(
-        color = "#9c4221", 
-        language_type = "data", 
-        language_id = 365,
-        name = "TOML",
-        extension = ['.toml']
-    ),
-    "TSQL": GitLanguageInfo(
-        color = "#e38c00", 
-        language_type = "programming", 
-        language_id = 918334941,
-        name = "TSQL",
-        extension = ['.sql']
-    ),
-    "TSV": GitLanguageInfo(
-        color = "#237346", 
-        language_type = "data", 
-        language_id = 1035892117,
-        name = "TSV",
-        extension = ['.tsv']
-    ),
-    "TSX": GitLanguageInfo(
-        color = "#3178c6", 
-        language_type = "programming", 
-        language_id = 94901924,
-        name = "TSX",
-        extension = ['.tsx']
-    ),
-    "TXL": GitLanguageInfo(
-        color = "#0178b8", 
-        language_type = "programming", 
-        language_id = 366,
-        name = "TXL",
-        extension = ['.txl']
-    ),
-    "Talon": GitLanguageInfo(
-        color = "#333333", 
-        language_type = "programming", 
-        language_id = 959889508,
-        name = "Talon",
-        extension = ['.talon']
-    ),
-    "Tcl": GitLanguageInfo(
-        color = "#e4cc98", 
-        language_type = "programming", 
-        language_id = 367,
-        name = "Tcl",
-        extension = ['.tcl', '.adp', '.sdc', '.tcl.in', '.tm', '.xdc']
-    ),
-    "TeX": GitLanguageInfo(
-        color = "#3D6117", 
-        language_type = "markup", 
-        language_id = 369,
-        name = "TeX",
-        extension = ['.tex', '.aux', '.bbx', '.cbx', '.cls', '.dtx', '.ins', '.lbx', '.ltx', '.mkii', '.mkiv', '.mkvi', '.sty', '.toc']
-    ),
-    "Terra": GitLanguageInfo(
-        color = "#00004c", 
-        language_type = "programming", 
-        language_id = 371,
-        name = "Terra",
-        extension = ['.t']
-    ),
-    "Textile": GitLanguageInfo(
-        color = "#ffe7ac", 
-        language_type = "prose", 
-        language_id = 373,
-        name = "Textile",
-        extension = ['.textile']
-    ),
-    "Thrift": GitLanguageInfo(
-        color = "#D12127", 
-        language_type = "programming", 
-        language_id = 374,
-        name = "Thrift",
-        extension = ['.thrift']
-    ),
-    "Turing": GitLanguageInfo(
-        color = "#cf142b", 
-        language_type = "programming", 
-        language_id = 375,
-        name = "Turing",
-        extension = ['.t', '.tu']
-    ),
-    "Twig": GitLanguageInfo(
-        color = "#c1d026", 
-        language_type = "markup", 
-        language_id = 377,
-        name = "Twig",
-        extension = ['.twig']
-    ),
-    "TypeScript": GitLanguageInfo(
-        color = "#3178c6", 
-        language_type = "programming", 
-        language_id = 378,
-        name = "TypeScript",
-        extension = ['.ts', '.cts', '.mts']
-    ),
-    "Unified Parallel C": GitLanguageInfo(
-        color = "#4e3617", 
-        language_type = "programming", 
-        language_id = 379,
-        name = "Unified Parallel C",
-        extension = ['.upc']
-    ),
-    "Unity3D Asset": GitLanguageInfo(
-        color = "#222c37", 
-        language_type = "data", 
-        language_id = 380,
-        name = "Unity3D Asset",
-        extension = ['.anim', '.asset', '.mask', '.mat', '.meta', '.prefab', '.unity']
-    ),
-    "Uno": GitLanguageInfo(
-        color = "#9933cc", 
-        language_type = "programming", 
-        language_id = 381,
-        name = "Uno",
-        extension = ['.uno']
-    ),
-    "UnrealScript": GitLanguageInfo(
-        color = "#a54c4d", 
-        language_type = "programming", 
-        language_id = 382,
-        name = "UnrealScript",
-        extension = ['.uc']
-    ),
-    "UrWeb": GitLanguageInfo(
-        color = "#ccccee", 
-        language_type = "programming", 
-        language_id = 383,
-        name = "UrWeb",
-        extension = ['.ur', '.urs']
-    ),
-    "V": GitLanguageInfo(
-        color = "#4f87c4", 
-        language_type = "programming", 
-        language_id = 603371597,
-        name = "V",
-        extension = ['.v']
-    ),
-    "VBA": GitLanguageInfo(
-        color = "#867db1", 
-        language_type = "programming", 
-        language_id = 399230729,
-        name = "VBA",
-        extension = ['.bas', '.cls', '.frm', '.vba']
-    ),
-    "VBScript": GitLanguageInfo(
-        color = "#15dcdc", 
-        language_type = "programming", 
-        language_id = 408016005,
-        name = "VBScript",
-        extension = ['.vbs']
-    ),
-    "VCL": GitLanguageInfo(
-        color = "#148AA8", 
-        language_type = "programming", 
-        language_id = 384,
-        name = "VCL",
-        extension = ['.vcl']
-    ),
-    "VHDL": GitLanguageInfo(
-        color = "#adb2cb", 
-        language_type = "programming", 
-        language_id = 385,
-        name = "VHDL",
-        extension = ['.vhdl', '.vhd', '.vhf', '.vhi', '.vho', '.vhs', '.vht', '.vhw']
-    ),
-    "Vala": GitLanguageInfo(
-        color = "#a56de2", 
-        language_type = "programming", 
-        language_id = 386,
-        name = "Vala",
-        extension = ['.vala', '.vapi']
-    ),
-    "Valve Data Format": GitLanguageInfo(
-        color = "#f26025", 
-        language_type = "data", 
-        language_id = 544060961,
-        name = "Valve Data Format",
-        extension = ['.vdf']
-    ),
-    "Velocity Template Language": GitLanguageInfo(
-        color = "#507cff", 
-        language_type = "markup", 
-        language_id = 292377326,
-        name = "Velocity Template Language",
-        extension = ['.vtl']
-    ),
-    "Verilog": GitLanguageInfo(
-        color = "#b2b7f8", 
-        language_type = "programming", 
-        language_id = 387,
-        name = "Verilog",
-        extension = ['.v', '.veo']
-    ),
-    "Vim Help File": GitLanguageInfo(
-        color = "#199f4b", 
-        language_type = "prose", 
-        language_id = 508563686,
-        name = "Vim Help File",
-        extension = ['.txt']
-    ),
-    "Vim Script": GitLanguageInfo(
-        color = "#199f4b", 
-        language_type = "programming", 
-        language_id = 388,
-        name = "Vim Script",
-        extension = ['.vim', '.vba', '.vimrc', '.vmb']
-    ),
-    "Vim Snippet": GitLanguageInfo(
-        color = "#199f4b", 
-        language_type = "markup", 
-        language_id = 81265970,
-        name = "Vim Snippet",
-        extension = ['.snip', '.snippet', '.snippets']
-    ),
-    "Visual Basic .NET": GitLanguageInfo(
-        color = "#945db7", 
-        language_type = "programming", 
-        language_id = 389,
-        name = "Visual Basic .NET",
-        extension = ['.vb', '.vbhtml']
-    ),
-    "Visual Basic 6.0": GitLanguageInfo(
-        color = "#2c6353", 
-        language_type = "programming", 
-        language_id = 679594952,
-        name = "Visual Basic 6.0",
-        extension = ['.cls', '.ctl', '.Dsr', '.frm']
-    ),
-    "Volt": GitLanguageInfo(
-        color = "#1F1F1F", 
-        language_type = "programming", 
-        language_id = 390,
-        name = "Volt",
-        extension = ['.volt']
-    ),
-    "Vue": GitLanguageInfo(
-        color = "#41b883", 
-        language_type = "markup", 
-        language_id = 391,
-        name = "Vue",
-        extension = ['.vue']
-    ),
-    "Vyper": GitLanguageInfo(
-        color = "#2980b9", 
-        language_type = "programming", 
-        language_id = 1055641948,
-        name = "Vyper",
-        extension = ['.vy']
-    ),
-    "Web Ontology Language": GitLanguageInfo(
-        color = "#5b70bd", 
-        language_type = "data", 
-        language_id = 394,
-        name = "Web Ontology Language",
-        extension = ['.owl']
-    ),
-    "WebAssembly": GitLanguageInfo(
-        color = "#04133b", 
-        language_type = "programming", 
-        language_id = 956556503,
-        name = "WebAssembly",
-        extension = ['.wast', '.wat']
-    ),
-    "Whiley": GitLanguageInfo(
-        color = "#d5c397", 
-        language_type = "programming", 
-        language_id = 888779559,
-        name = "Whiley",
-        extension = ['.whiley']
-    ),
-    "Wikitext": GitLanguageInfo(
-        color = "#fc5757", 
-        language_type = "prose", 
-        language_id = 228,
-        name = "Wikitext",
-        extension = ['.mediawiki', '.wiki', '.wikitext']
-    ),
-    "Windows Registry Entries": GitLanguageInfo(
-        color = "#52d5ff", 
-        language_type = "data", 
-        language_id = 969674868,
-        name = "Windows Registry Entries",
-        extension = ['.reg']
-    ),
-    "Witcher Script": GitLanguageInfo(
-        color = "#ff0000", 
-        language_type = "programming", 
-        language_id = 686821385,
-        name = "Witcher Script",
-        extension = ['.ws']
-    ),
-    "Wollok": GitLanguageInfo(
-        color = "#a23738", 
-        language_type = "programming", 
-        language_id = 632745969,
-        name = "Wollok",
-        extension = ['.wlk']
-    ),
-    "World of Warcraft Addon Data": GitLanguageInfo(
-        color = "#f7e43f", 
-        language_type = "data", 
-        language_id = 396,
-        name = "World of Warcraft Addon Data",
-        extension = ['.toc']
-    ),
-    "Wren": GitLanguageInfo(
-        color = "#383838", 
-        language_type = "programming", 
-        language_id = 713580619,
-        name = "Wren",
-        extension = ['.wren']
-    ),
-    "X10": GitLanguageInfo(
-        color = "#4B6BEF", 
-        language_type = "programming", 
-        language_id = 397,
-        name = "X10",
-        extension = ['.x10']
-    ),
-    "XC": GitLanguageInfo(
-        color = "#99DA07", 
-        language_type = "programming", 
-        language_id = 398,
-        name = "XC",
-        extension = ['.xc']
-    ),
-    "XML": GitLanguageInfo(
-        color = "#0060ac", 
-        language_type = "data", 
-        language_id = 399,
-        name = "XML",
-        extension = ['.xml', '.adml', '.admx', '.ant', '.axaml', '.axml', '.builds', '.ccproj', '.ccxml', '.clixml', '.cproject', '.cscfg', '.csdef', '.csl', '.csproj', '.ct', '.depproj', '.dita', '.ditamap', '.ditaval', '.dll.config', '.dotsettings', '.filters', '.fsproj', '.fxml', '.glade', '.gml', '.gmx', '.grxml', '.gst', '.hzp', '.iml', '.ivy', '.jelly', '.jsproj', '.kml', '.launch', '.mdpolicy', '.mjml', '.mm', '.mod', '.mxml', '.natvis', '.ncl', '.ndproj', '.nproj', '.nuspec', '.odd', '.osm', '.pkgproj', '.pluginspec', '.proj', '.props', '.ps1xml', '.psc1', '.pt', '.qhelp', '.rdf', '.res', '.resx', '.rs', '.rss', '.sch', '.scxml', '.sfproj', '.shproj', '.srdf', '.storyboard', '.sublime-snippet', '.targets', '.tml', '.ts', '.tsx', '.ui', '.urdf', '.ux', '.vbproj', '.vcxproj', '.vsixmanifest', '.vssettings', '.vstemplate', '.vxml', '.wixproj', '.workflow', '.wsdl', '.wsf', '.wxi', '.wxl', '.wxs', '.x3d', '.xacro', '.xaml', '.xib', '.xlf', '.xliff', '.xmi', '.xml.dist', '.xmp', '.xproj', '.xsd', '.xspec', '.xul', '.zcml']
-    ),
-    "XML Property List": GitLanguageInfo(
-        color = "#0060ac", 
-        language_type = "data", 
-        language_id = 75622871,
-        name = "XML Property List",
-        extension = ['.plist', '.stTheme', '.tmCommand', '.tmLanguage', '.tmPreferences', '.tmSnippet', '.tmTheme']
-    ),
-    "XQuery": GitLanguageInfo(
-        color = "#5232e7", 
-        language_type = "programming", 
-        language_id = 402,
-        name = "XQuery",
-        extension = ['.xquery', '.xq', '.xql', '.xqm', '.xqy']
-    ),
-    "XSLT": GitLanguageInfo(
-        color = "#EB8CEB", 
-        language_type = "programming", 
-        language_id = 404,
-        name = "XSLT",
-        extension = ['.xslt', '.xsl']
-    ),
-    "Xojo": GitLanguageInfo(
-        color = "#81bd41", 
-        language_type = "programming", 
-        language_id = 405,
-        name = "Xojo",
-        extension = ['.xojo_code', '.xojo_menu', '.xojo_report', '.xojo_script', '.xojo_toolbar', '.xojo_window']
-    ),
-    "Xonsh": GitLanguageInfo(
-        color = "#285EEF", 
-        language_type = "programming", 
-        language_id = 614078284,
-        name = "Xonsh",
-        extension = ['.xsh']
-    ),
-    "Xtend": GitLanguageInfo(
-        color = "#24255d", 
-        language_type = "programming", 
-        language_id = 406,
-        name = "Xtend",
-        extension = ['.xtend']
-    ),
-    "YAML": GitLanguageInfo(
-        color = "#cb171e", 
-        language_type = "data", 
-        language_id = 407,
-        name = "YAML",
-        extension = ['.yml', '.mir', '.reek', '.rviz', '.sublime-syntax', '.syntax', '.yaml', '.yaml-tmlanguage', '.yaml.sed', '.yml.mysql']
-    ),
-    "YARA": GitLanguageInfo(
-        color = "#220000", 
-        language_type = "programming", 
-        language_id = 805122868,
-        name = "YARA",
-        extension = ['.yar', '.yara']
-    ),
-    "YASnippet": GitLanguageInfo(
-        color = "#32AB90", 
-        language_type = "markup", 
-        language_id = 378760102,
-        name = "YASnippet",
-        extension = ['.yasnippet']
-    ),
-    "Yacc": GitLanguageInfo(
-        color = "#4B6C4B", 
-        language_type = "programming", 
-        language_id = 409,
-        name = "Yacc",
-        extension = ['.y', '.yacc', '.yy']
-    ),
-    "Yul": GitLanguageInfo(
-        color = "#794932", 
-        language_type = "programming", 
-        language_id = 237469033,
-        name = "Yul",
-        extension = ['.yul']
-    ),
-    "ZAP": GitLanguageInfo(
-        color = "#0d665e", 
-        language_type = "programming", 
-        language_id = 952972794,
-        name = "ZAP",
-        extension = ['.zap', '.xzap']
-    ),
-    "ZIL": GitLanguageInfo(
-        color = "#dc75e5", 
-        language_type = "programming", 
-        language_id = 973483626,
-        name = "ZIL",
-        extension = ['.zil', '.mud']
-    ),
-    "ZenScript": GitLanguageInfo(
-        color = "#00BCD1", 
-        language_type = "programming", 
-        language_id = 494938890,
-        name = "ZenScript",
-        extension = ['.zs']
-    ),
-    "Zephir": GitLanguageInfo(
-        color = "#118f9e", 
-        language_type = "programming", 
-        language_id = 410,
-        name = "Zephir",
-        extension = ['.zep']
-    ),
-    "Zig": GitLanguageInfo(
-        color = "#ec915c", 
-        language_type = "programming", 
-        language_id = 646424281,
-        name = "Zig",
-        extension = ['.zig']
-    ),
-    "Zimpl": GitLanguageInfo(
-        color = "#d67711", 
-        language_type = "programming", 
-        language_id = 411,
-        name = "Zimpl",
-        extension = ['.zimpl', '.zmpl', '.zpl']
-    ),
-    "eC": GitLanguageInfo(
-        color = "#913960", 
-        language_type = "programming", 
-        language_id = 413,
-        name = "eC",
-        extension = ['.ec', '.eh']
-    ),
-    "fish": GitLanguageInfo(
-        color = "#4aae47", 
-        language_type = "programming", 
-        language_id = 415,
-        name = "fish",
-        extension = ['.fish']
-    ),
-    "hoon": GitLanguageInfo(
-        color = "#00b171", 
-        language_type = "programming", 
-        language_id = 560883276,
-        name = "hoon",
-        extension = ['.hoon']
-    ),
-    "jq": GitLanguageInfo(
-        color = "#c7254e", 
-        language_type = "programming", 
-        language_id = 905371884,
-        name = "jq",
-        extension = ['.jq']
-    ),
-    "kvlang": GitLanguageInfo(
-        color = "#1da6e0", 
-        language_type = "markup", 
-        language_id = 970675279,
-        name = "kvlang",
-        extension = ['.kv']
-    ),
-    "mIRC Script": GitLanguageInfo(
-        color = "#3d57c3", 
-        language_type = "programming", 
-        language_id = 517654727,
-        name = "mIRC Script",
-        extension = ['.mrc']
-    ),
-    "mcfunction": GitLanguageInfo(
-        color = "#E22837", 
-        language_type = "programming", 
-        language_id = 462488745,
-        name = "mcfunction",
-        extension = ['.mcfunction']
-    ),
-    "mupad": GitLanguageInfo(
-        color = "#244963", 
-        language_type = "programming", 
-        language_id = 416,
-        name = "mupad",
-        extension = ['.mu']
-    ),
-    "nanorc": GitLanguageInfo(
-        color = "#2d004d", 
-        language_type = "data", 
-        language_id = 775996197,
-        name = "nanorc",
-        extension = ['.nanorc']
-    ),
-    "nesC": GitLanguageInfo(
-        color = "#94B0C7", 
-        language_type = "programming", 
-        language_id = 417,
-        name = "nesC",
-        extension = ['.nc']
-    ),
-    "ooc": GitLanguageInfo(
-        color = "#b0b77e", 
-        language_type = "programming", 
-        language_id = 418,
-        name = "ooc",
-        extension = ['.ooc']
-    ),
-    "q": GitLanguageInfo(
-        color = "#0040cd", 
-        language_type = "programming", 
-        language_id = 970539067,
-        name = "q",
-        extension = ['.q']
-    ),
-    "reStructuredText": GitLanguageInfo(
-        color = "#141414", 
-        language_type = "prose", 
-        language_id = 419,
-        name = "reStructuredText",
-        extension = ['.rst', '.rest', '.rest.txt', '.rst.txt']
-    ),
-    "sed": GitLanguageInfo(
-        color = "#64b970", 
-        language_type = "programming", 
-        language_id = 847830017,
-        name = "sed",
-        extension = ['.sed']
-    ),
-    "wdl": GitLanguageInfo(
-        color = "#42f1f4", 
-        language_type = "programming", 
-        language_id = 374521672,
-        name = "wdl",
-        extension = ['.wdl']
-    ),
-    "wisp": GitLanguageInfo(
-        color = "#7582D1", 
-        language_type = "programming", 
-        language_id = 420,
-        name = "wisp",
-        extension = ['.wisp']
-    ),
-    "xBase": GitLanguageInfo(
-        color = "#403a40", 
-        language_type = "programming", 
-        language_id = 421,
-        name = "xBase",
-        extension = ['.prg', '.ch', '.prw']
-    ),
-}
\ No newline at end of file
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_colors.json")
+
+class LanguageTable(Mapping[str, GitLanguageInfo]):
+    """Read only mapping from language names to their GitLanguageInfo. The data file is only read the first time the
+    table is used, and each GitLanguageInfo is only made the first time it is looked up"""
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._columns: dict[str, list[Any]] = {}
+        self._index: dict[str, int] | None = None
+        self._entries: dict[str, GitLanguageInfo] = {}
+    
+    def _load(self) -> dict[str, int]:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    with open(self._path, 'r', encoding = 'utf-8') as f:
+                        self._columns = json.load(f)["languages"]
+                    self._index = {name: i for i, name in enumerate(self._columns["name"])}
+        return self._index
+    
+    def __getitem__(self, name: str) -> GitLanguageInfo:
+        info = self._entries.get(name)
+        if info is None:
+            i = self._load()[name]
+            c = self._columns
+            info = GitLanguageInfo(
+                color = c["color"][i],
+                name = name,
+                extension = c["extensions"][i],
+                language_type = c["type"][i],
+                language_id = c["language_id"][i]
+            )
+            # Another thread might have made the same entry in the meantime, always hand out the same object
+            info = self._entries.setdefault(name, info)
+        return info
+    
+    def color(self, name: str) -> str | None:
+        """The hex code of the language's color, or None if it has none. Reads the column directly, without making the GitLanguageInfo"""
+        i = self._load().get(name)
+        return None if i is None else self._columns["color"][i]
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._load()
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+    
+    def __len__(self) -> int:
+        return len(self._load())
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._path!r})"
+
+COLORS = LanguageTable(DATA_PATH)
@@ -1,15 +1,20 @@
 import re
+import sys
+from typing import Iterable
 
 from MDgen.chart.colorinfo import ColorInfo
-from MDgen.util import copy
 
 class GitLanguageInfo(ColorInfo):
-    def __init__(self, color: str, name: str, extension: list[str], language_type: str, language_id: int):
-        self.color = color
-        self.name = name
-        self.lang_type = language_type
+    __slots__ = ("lang_type", "id", "ext")
+    def __init__(self, color: str, name: str, extension: Iterable[str], language_type: str, language_id: int):
+        super().__init__(color, name)
+        self.lang_type = sys.intern(language_type)
         self.id = language_id
-        self.ext = copy(extension)
+        # Tuples are immutable so they can be shared between copies instead of being deep copied
+        self.ext = extension if isinstance(extension, tuple) else tuple(extension)
+    
+    def __copy__(self):
+        return GitLanguageInfo(self.color, self.name, self.ext, self.lang_type, self.id)
 
 def variablize(k: str):
     """Makes the string a valid variable name in lowercase by replacing all non-alphabetic characters with underscores"""
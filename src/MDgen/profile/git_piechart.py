@@ -1,19 +1,38 @@
 ### This module contains helpful methods that generates pie charts for us
-from typing import Optional, Callable
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Optional, Callable
 
 from MDgen.base import ReadMe
-from MDgen.profile.gituser import GitUser
 from MDgen.chart.piechart import PieChart
 from MDgen.chart.colorinfo import ColorInfo
 from MDgen.chart.chartinfo import ChartInfo
+from MDgen.chart.chart_table import ChartTable
 from MDgen.profile.git_colors import COLORS
 
+if TYPE_CHECKING:
+    from MDgen.profile.gituser import GitUser
+    from MDgen.profile.async_gituser import AsyncGitUser
+    from MDgen.profile.local_user import LocalUser
+    from MDgen.profile.snapshot import GitSnapshot
+
 class GitPieChart(PieChart):
-    def __init__(self, user: GitUser, chart_size: int = 150, use_columns: bool = False, ignore_key: Callable[[ChartInfo, float], bool] | None = None):
-        """Process all the repo information and creates the language pie chart for you"""
-        entries: list[ChartInfo] = []
-        for language, num_bytes in user.total_languages.items():
-            color = COLORS.get(language)
-            if color:
-                entries.append(ChartInfo(num_bytes, color))
-        return super().__init__(chart_size, entries, use_columns, ignore_key)
+    def __init__(self, user: GitUser | AsyncGitUser | LocalUser | GitSnapshot | Mapping[str, int], chart_size: int = 150, use_columns: bool = False, ignore_key: Callable[[ChartInfo, float], bool] | None = None, max_slices: int | None = None, min_ratio: float = 0.):
+        """Process all the repo information and creates the language pie chart for you
+        user can also be a LocalUser to make the chart from repositories checked out on this machine, a GitSnapshot loaded
+        from a file to make it without the network, or just the mapping from languages to their number of bytes (like GitUser.total_languages)"""
+        languages = user if isinstance(user, Mapping) else user.total_languages
+        # Goes straight into columns, without a ChartInfo per language. Languages without a color are left out
+        table = ChartTable.from_mapping(languages, COLORS.color)
+        return super().__init__(chart_size, table, use_columns, ignore_key, max_slices, min_ratio)
+
+    @classmethod
+    async def from_user(cls, user: AsyncGitUser | str, chart_size: int = 150, use_columns: bool = False, ignore_key: Callable[[ChartInfo, float], bool] | None = None, max_slices: int | None = None, min_ratio: float = 0.) -> GitPieChart:
+        """Makes the chart from an AsyncGitUser without blocking the event loop, fetching its data first if that has not been done yet
+        user can also be an auth token, in which case an AsyncGitUser is made with it"""
+        if isinstance(user, str):
+            from MDgen.profile.async_gituser import AsyncGitUser
+            user = AsyncGitUser(user)
+        if not user.fetched:
+            await user.fetch()
+        return cls(user, chart_size, use_columns, ignore_key, max_slices, min_ratio)
@@ -0,0 +1,152 @@
+### This module contains a small client for the GitHub REST API
+### Unlike PyGithub it is safe to share between threads, since every request uses its own connection
+from __future__ import annotations
+import re
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import TYPE_CHECKING, Any, Iterator
+
+from MDgen.profile.rate_limit import RateLimitScheduler, scheduler_for
+
+if TYPE_CHECKING:
+    from MDgen.profile.response_cache import ResponseCache
+
+DEFAULT_BASE_URL = "https://api.github.com"
+
+_NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+class GitHubError(Exception):
+    """Raised when the GitHub API answers with an error status"""
+    def __init__(self, status: int, url: str, message: str):
+        super().__init__(f"{status} {message} ({url})")
+        self.status = status
+        self.url = url
+        self.message = message
+
+def api_headers() -> dict[str, str]:
+    """Returns the headers sent with every API request. The Authorization header is added per request with the token
+    the scheduler hands out"""
+    return {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "MDgen",
+    }
+
+def lower_headers(headers: Any) -> dict[str, str]:
+    """Copies the headers of a response with the names in lowercase, since header names are not case sensitive
+    This is done once where the responses come in, everything after that (the rate limits and the cache) takes these"""
+    return {k.lower(): v for k, v in headers.items()}
+
+def next_page_url(headers: dict[str, str]) -> str | None:
+    """Returns the url of the next page from the link header of a paginated response, or None on the last page"""
+    m = _NEXT_LINK.search(headers.get("link", ""))
+    return m.group(1) if m else None
+
+class GitHubClient:
+    def __init__(self, auth_token: str | None = None, base_url: str = DEFAULT_BASE_URL, timeout: float = 30, cache: ResponseCache | None = None, scheduler: RateLimitScheduler | None = None):
+        """Client for the GitHub REST API. base_url can point to a GitHub Enterprise server or a local stand-in server for testing
+        If a cache is given, responses are stored in it and revalidated with conditional requests
+        Requests are authenticated with the tokens of the scheduler, which keeps them within the rate limits and retries the requests
+        that hit one. If no scheduler is given, one is made for auth_token. Giving both raises a ValueError"""
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cache = cache
+        self.scheduler = scheduler_for(auth_token, scheduler)
+        self.headers = api_headers()
+    
+    def url(self, path: str, params: dict[str, Any] | None = None) -> str:
+        """Makes the full url of an endpoint. Full urls (like the languages_url of a repository) are used as they are"""
+        url = path if path.startswith(("http://", "https://")) else self.base_url + path
+        if params:
+            url += ("&" if "?" in url else "?") + urllib.parse.urlencode(params)
+        return url
+    
+    @property
+    def graphql_url(self) -> str:
+        # GitHub Enterprise serves the REST API at /api/v3 and the GraphQL API at /api/graphql
+        if self.base_url.endswith("/v3"):
+            return self.base_url[:-len("v3")] + "graphql"
+        return self.base_url + "/graphql"
+    
+    def _send(self, url: str, headers: dict[str, str], data: bytes | None = None, resource: str = "core") -> tuple[int, bytes, dict[str, str]]:
+        retries = 0
+        while True:
+            token = self.scheduler.acquire(resource)
+            if token:
+                headers = {**headers, "Authorization": f"token {token}"}
+            req = urllib.request.Request(url, data = data, headers = headers)
+            try:
+                with urllib.request.urlopen(req, timeout = self.timeout) as response:
+                    response_headers = lower_headers(response.headers)
+                    self.scheduler.update(token, response.status, response_headers, resource = resource)
+                    return response.status, response.read(), response_headers
+            except urllib.error.HTTPError as e:
+                response_headers = lower_headers(e.headers)
+                if e.code == 304:
+                    self.scheduler.update(token, e.code, response_headers, resource = resource)
+                    return e.code, b"", response_headers
+                try:
+                    message = json.loads(e.read()).get("message", e.reason)
+                except ValueError:
+                    message = e.reason
+                if self.scheduler.update(token, e.code, response_headers, message, resource) and retries < self.scheduler.max_retries:
+                    # Rate limited, the scheduler holds this token back until the limit is over
+                    retries += 1
+                    continue
+                raise GitHubError(e.code, url, message) from None
+    
+    def request(self, path: str, params: dict[str, Any] | None = None) -> tuple[Any, dict[str, str]]:
+        """Sends a GET request and returns the decoded json body together with the response headers"""
+        url = self.url(path, params)
+        if self.cache is None:
+            _, body, headers = self._send(url, self.headers)
+            return json.loads(body) if body else None, headers
+        
+        key = self.cache.key(url, self.scheduler.identity)
+        entry = self.cache.get(key)
+        request_headers = self.headers
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                self.cache.record("hits")
+                return entry.body, entry.headers
+            request_headers = dict(self.headers)
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+        
+        status, body, headers = self._send(url, request_headers)
+        if status == 304 and entry is not None:
+            # Nothing changed, keep the cached body but take the new headers (like the rate limit)
+            self.cache.record("not_modified")
+            headers = {**entry.headers, **headers}
+            self.cache.put(key, entry.body, headers)
+            return entry.body, headers
+        
+        self.cache.record("misses")
+        data = json.loads(body) if body else None
+        self.cache.put(key, data, headers)
+        return data, headers
+    
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request(path, params)[0]
+    
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> Any:
+        """Sends a GraphQL query and returns its data. GraphQL answers are never cached since they are POST requests"""
+        url = self.graphql_url
+        payload = json.dumps({"query": query, "variables": variables or {}}).encode('utf-8')
+        _, body, _ = self._send(url, {**self.headers, "Content-Type": "application/json"}, payload, "graphql")
+        result = json.loads(body)
+        # GraphQL reports errors in the body with a 200 status
+        if result.get("errors"):
+            raise GitHubError(200, url, "; ".join(e.get("message", str(e)) for e in result["errors"]))
+        return result["data"]
+    
+    def paginate(self, path: str, params: dict[str, Any] | None = None) -> Iterator[list[Any]]:
+        """Yields the pages of a paginated endpoint one at a time by following the Link headers"""
+        url: str | None = self.url(path, params)
+        while url is not None:
+            page, headers = self.request(url)
+            yield page
+            url = next_page_url(headers)
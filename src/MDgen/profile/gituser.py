@@ -1,28 +1,283 @@
 ### This module contains helpful methods that generates pie charts for us
-from github import Github
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable
 import sys
+import json
+
+from MDgen.profile.github_api import DEFAULT_BASE_URL, GitHubClient, GitHubError
+from MDgen.util import write_if_changed
+
+if TYPE_CHECKING:
+    from MDgen.profile.response_cache import ResponseCache
+    from MDgen.profile.rate_limit import RateLimitScheduler
+    from MDgen.profile.snapshot import GitSnapshot
+
+STATE_VERSION = 1
+
+def sum_languages(repo_languages: Iterable[dict[str, int]]) -> tuple[dict[str, int], int]:
+    """Adds up the languages of many repositories. Returns the bytes of each language and the total number of bytes"""
+    total_languages: dict[str, int] = {}
+    total_bytes = 0
+    for languages in repo_languages:
+        for k, v in languages.items():
+            total_languages[k] = total_languages.get(k, 0) + v
+            total_bytes += v
+    return total_languages, total_bytes
+
+class Repository:
+    # Only the few fields we use are kept from the API answers, which have close to a hundred fields per repository
+    __slots__ = ("name", "full_name", "pushed_at", "fork", "archived", "languages")
+    def __init__(self, name: str, full_name: str, pushed_at: str | None, fork: bool = False, archived: bool = False, languages: dict[str, int] | None = None):
+        """A repository and the bytes of each of its languages. languages is None if they could not be fetched"""
+        self.name = name
+        self.full_name = full_name
+        self.pushed_at = pushed_at
+        self.fork = fork
+        self.archived = archived
+        self.languages = languages
+
+    @classmethod
+    def from_rest(cls, repo: dict[str, Any]) -> Repository:
+        return cls(repo["name"], repo["full_name"], repo.get("pushed_at"), bool(repo.get("fork")), bool(repo.get("archived")))
+
+    @classmethod
+    def from_graphql(cls, node: dict[str, Any]) -> Repository:
+        languages = {e["node"]["name"]: e["size"] for e in node["languages"]["edges"]}
+        return cls(node["name"], node["nameWithOwner"], node["pushedAt"], node["isFork"], node["isArchived"], languages)
+
+    def get_languages(self) -> dict[str, int]:
+        """Same as PyGithub's Repository.get_languages, which older versions of GitUser.repos held, but without a request"""
+        return dict(self.languages or {})
+
+    def __repr__(self):
+        return f"Repository({self.full_name!r})"
+
+# Fetches 100 repositories with up to 100 languages each per request, in the same shape as the REST answers
+REPOSITORY_FIELDS = """\
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        pushedAt
+        isFork
+        isArchived
+        languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name color } } }
+      }"""
+
+REPOSITORIES_QUERY = f"""\
+query($after: String) {{
+  viewer {{
+    repositories(first: 100, after: $after, ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {{
+{REPOSITORY_FIELDS}
+    }}
+  }}
+}}"""
+
+# Same as REPOSITORIES_QUERY, but for the public repositories owned by someone else
+USER_REPOSITORIES_QUERY = f"""\
+query($login: String!, $after: String) {{
+  user(login: $login) {{
+    repositories(first: 100, after: $after, ownerAffiliations: [OWNER], privacy: PUBLIC) {{
+{REPOSITORY_FIELDS}
+    }}
+  }}
+}}"""
 
 class GitUser:
-    def __init__(self, auth_token: str):
+    _g: Any = None
+    
+    def __init__(self, auth_token: str | None, max_workers: int = 8, base_url: str = DEFAULT_BASE_URL, cache: ResponseCache | None = None, use_graphql: bool = False, state_path: str | None = None, scheduler: RateLimitScheduler | None = None, username: str | None = None):
         """Use the auth token to log into github to grab the repository information and other useful things to help us generate graphs and profiles
-        All the login code is run in this class so if stuff goes wrong we will see error messages here instead of in the git charts methods"""
-        self.g = Github(auth_token)
-        self.repos = list(self.g.get_user().get_repos())
+        All the login code is run in this class so if stuff goes wrong we will see error messages here instead of in the git charts methods
+        The languages of the repositories are fetched concurrently by up to max_workers threads. A failed request only
+        leaves out that repository, and its error is kept in self.errors
+        base_url can point to a GitHub Enterprise server or a local stand-in server for testing
+        If a ResponseCache is given, unchanged responses are reused from disk instead of being downloaded again
+        If use_graphql is set to true, the GraphQL API is used instead, which gets 100 repositories together with their languages
+        in a single request. The cache and max_workers are not used in that case
+        If state_path is given, the languages and push time of every repository are saved there. The next time, only the
+        repositories that are new or were pushed to since then have their languages fetched again, and the totals are patched
+        Requests wait instead of failing when the rate limit runs out. To spread the requests over a pool of tokens (or to share
+        the rate limit between many users), pass a RateLimitScheduler, in which case auth_token must be None
+        If username is given, the public repositories of that user are used instead of the repositories of the logged in user"""
+        self.username = username
+        self.client = GitHubClient(auth_token, base_url, cache = cache, scheduler = scheduler)
+        previous = self._load_state(state_path) if state_path else None
+        
+        # Errors of the failed language requests by repository full name
+        self.errors: dict[str, Exception] = {}
         
-        # Create the language information here
+        # Full names of the repositories whose languages were fetched this time
+        self.refreshed: list[str] = []
+        
+        # The repositories are read page by page and the languages are added up as they come, so the raw answers of
+        # the API are let go of right away and only the small Repository records are kept
+        self.repos: list[Repository] = []
         self.total_languages: dict[str, int] = {}
         self.total_bytes = 0
+        if use_graphql:
+            self._fetch_graphql(previous is None)
+        else:
+            self._fetch_rest(max_workers, previous["repos"] if previous else None)
+        
+        # With a saved state, the totals are patched instead
+        if previous is not None:
+            self._patch_totals(previous)
+        
+        if state_path:
+            self._save_state(state_path, previous["repos"] if previous else {})
+    
+    @property
+    def g(self):
+        """A PyGithub client logged in the same way as this user, for anything GitUser does not fetch itself
+        It is only made when first used, and needs PyGithub (pip install PyGithub)"""
+        if self._g is None:
+            try:
+                import github
+            except ImportError as e:
+                raise ImportError("GitUser.g needs PyGithub, install it with 'pip install PyGithub'") from e
+            token = self.client.scheduler.tokens[0] or None
+            if hasattr(github, "Auth"):
+                self._g = github.Github(auth = github.Auth.Token(token) if token else None, base_url = self.client.base_url)
+            else:
+                # PyGithub before 1.59 takes the token as the first argument
+                self._g = github.Github(token, base_url = self.client.base_url)
+        return self._g
+    
+    @property
+    def repo_languages(self) -> dict[str, dict[str, int]]:
+        """Languages per repository full name, in the same order as self.repos. Repositories whose languages could not be fetched are left out"""
+        return {repo.full_name: repo.languages for repo in self.repos if repo.languages is not None}
+    
+    def snapshot(self) -> GitSnapshot:
+        """The fetched data without the connection, which can be saved and loaded again to make charts offline"""
+        from MDgen.profile.snapshot import GitSnapshot
+        return GitSnapshot.from_user(self)
+    
+    def _add_languages(self, languages: dict[str, int]):
+        for k, v in languages.items():
+            self.total_languages[k] = self.total_languages.get(k, 0) + v
+            self.total_bytes += v
+    
+    def _fetch_rest(self, max_workers: int, previous: dict[str, dict[str, Any]] | None):
+        path = f"/users/{self.username}/repos" if self.username else "/user/repos"
+        # Repositories waiting for their languages, in order, so the totals come out the same however the requests finish
+        pending: deque[tuple[Repository, Future | None]] = deque()
+        with ThreadPoolExecutor(max_workers = max_workers) as pool:
+            for page in self.client.paginate(path, {"per_page": 100}):
+                for raw in page:
+                    repo = Repository.from_rest(raw)
+                    self.repos.append(repo)
+                    old = previous.get(repo.full_name) if previous else None
+                    if old is not None and old["pushed_at"] == repo.pushed_at:
+                        # Not pushed to since the last time, so the saved languages are still right
+                        repo.languages = old["languages"]
+                        pending.append((repo, None))
+                    else:
+                        pending.append((repo, pool.submit(self._get_languages, raw["languages_url"])))
+                # The languages of this page are fetched while the next page is downloaded
+                while pending and (pending[0][1] is None or pending[0][1].done()):
+                    self._finish(*pending.popleft(), previous)
+            while pending:
+                self._finish(*pending.popleft(), previous)
+    
+    def _finish(self, repo: Repository, future: Future | None, previous: dict[str, dict[str, Any]] | None):
+        if future is not None:
+            result = future.result()
+            if isinstance(result, Exception):
+                self.errors[repo.full_name] = result
+                # The last known languages are better than nothing
+                if previous and repo.full_name in previous:
+                    repo.languages = previous[repo.full_name]["languages"]
+            else:
+                repo.languages = result
+                self.refreshed.append(repo.full_name)
+        if previous is None and repo.languages is not None:
+            self._add_languages(repo.languages)
+    
+    def _get_languages(self, languages_url: str) -> dict[str, int] | Exception:
+        try:
+            return self.client.get(languages_url)
+        except (GitHubError, OSError, ValueError) as e:
+            return e
+    
+    def _fetch_graphql(self, add_totals: bool):
+        after = None
+        while True:
+            if self.username:
+                page = self.client.graphql(USER_REPOSITORIES_QUERY, {"login": self.username, "after": after})["user"]["repositories"]
+            else:
+                page = self.client.graphql(REPOSITORIES_QUERY, {"after": after})["viewer"]["repositories"]
+            for node in page["nodes"]:
+                repo = Repository.from_graphql(node)
+                self.repos.append(repo)
+                self.refreshed.append(repo.full_name)
+                if add_totals:
+                    self._add_languages(repo.languages)
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+    
+    def _patch_totals(self, previous: dict[str, Any]):
+        # Start from the last totals, then take out the repositories that are gone or changed and add their new languages
+        self.total_languages = dict(previous["total_languages"])
+        self.total_bytes: int = previous["total_bytes"]
+        old: dict[str, dict[str, Any]] = previous["repos"]
+        repo_languages = self.repo_languages
+        
+        for name, repo in old.items():
+            if repo_languages.get(name) is not repo["languages"]:
+                for k, v in repo["languages"].items():
+                    self.total_languages[k] -= v
+                    self.total_bytes -= v
+        
+        for name, languages in repo_languages.items():
+            if name not in old or languages is not old[name]["languages"]:
+                for k, v in languages.items():
+                    self.total_languages[k] = self.total_languages.get(k, 0) + v
+                    self.total_bytes += v
+        
+        self.total_languages = {k: v for k, v in self.total_languages.items() if v > 0}
+    
+    @staticmethod
+    def _load_state(path: str) -> dict[str, Any] | None:
+        try:
+            with open(path, 'r', encoding = 'utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Anything saved by another version is fetched again from scratch
+        if state.get("version") != STATE_VERSION:
+            return None
+        return state
+    
+    def _save_state(self, path: str, old: dict[str, dict[str, Any]]):
+        # Save the push time that goes with the saved languages. If the request of a changed repository failed, its old
+        # push time is kept so it is fetched again next time
+        repos = {}
         for repo in self.repos:
-            for k, v in repo.get_languages().items():
-                self.total_languages[k] = self.total_languages.get(k, 0) + v
-                self.total_bytes += v
-
+            if repo.languages is not None:
+                repos[repo.full_name] = {
+                    "pushed_at": old[repo.full_name]["pushed_at"] if repo.full_name in self.errors else repo.pushed_at,
+                    "languages": repo.languages
+                }
+        state = {
+            "version": STATE_VERSION,
+            "total_languages": self.total_languages,
+            "total_bytes": self.total_bytes,
+            "repos": repos
+        }
+        write_if_changed(path, lambda: [json.dumps(state, separators = (',', ':'))])
 
 if __name__ == "__main__":
     with open("./.privatekey", 'r') as f:
         auth_token = f.read()
     user = GitUser(auth_token)
-    for repo in user.repos:
-        print(f"Repo: {repo.name}")
-        for k, v in repo.get_languages().items():
-            print(f"\t{k}: {v}")
\ No newline at end of file
+    for name, languages in user.repo_languages.items():
+        print(f"Repo: {name}")
+        for k, v in languages.items():
+            print(f"\t{k}: {v}")
+    for name, error in user.errors.items():
+        print(f"Failed to get the languages of {name}: {error}", file = sys.stderr)
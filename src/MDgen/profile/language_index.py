@@ -0,0 +1,108 @@
+## This module contains the reverse index from file names, extensions and interpreters to the github-supported languages
+## The index is stored in language_index.json, auto generated by ./Generate git colors/make_colors.py ##
+## Every lookup returns a tuple of language names since keys can be ambiguous. The preferred language comes first
+
+from __future__ import annotations
+import os
+import re
+import json
+import threading
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "language_index.json")
+
+_VERSION_SUFFIX = re.compile(r"[\d.]+$")
+
+class LanguageIndex:
+    """Lookup tables from extensions, exact file names, shebang interpreters and aliases to language names.
+    The data file is only read the first time the index is used"""
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._types: dict[str, str | None] = {}
+        self._extensions: dict[str, tuple[str, ...]] = {}
+        self._filenames: dict[str, tuple[str, ...]] = {}
+        self._interpreters: dict[str, tuple[str, ...]] = {}
+        self._aliases: dict[str, tuple[str, ...]] = {}
+    
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with open(self._path, 'r', encoding = 'utf-8') as f:
+                data = json.load(f)
+            # Languages show up in many lists, so share one string object per language name
+            names = {name: name for name in data["types"]}
+            def tuples(index: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+                return {k: tuple(names.get(n, n) for n in v) for k, v in index.items()}
+            self._types = data["types"]
+            self._extensions = tuples(data["extensions"])
+            self._filenames = tuples(data["filenames"])
+            self._interpreters = tuples(data["interpreters"])
+            self._aliases = tuples(data["aliases"])
+            self._loaded = True
+    
+    def language_type(self, language: str) -> str | None:
+        """Returns the linguist type of the language (programming, markup, data or prose), or None if it is unknown"""
+        self._load()
+        return self._types.get(language)
+    
+    def by_extension(self, extension: str) -> tuple[str, ...]:
+        """Returns the languages using the extension (like '.py'). The extension is matched case insensitively"""
+        self._load()
+        return self._extensions.get(extension.lower(), ())
+    
+    def by_filename(self, filename: str) -> tuple[str, ...]:
+        """Returns the languages of a file with exactly this name (like 'Makefile'), without looking at the extension"""
+        self._load()
+        return self._filenames.get(filename, ())
+    
+    def by_interpreter(self, interpreter: str) -> tuple[str, ...]:
+        """Returns the languages run by this interpreter (like 'python3'). Version numbers are ignored if the exact
+        interpreter is unknown, so 'python3.11' finds Python"""
+        self._load()
+        languages = self._interpreters.get(interpreter)
+        if languages is None:
+            languages = self._interpreters.get(_VERSION_SUFFIX.sub("", interpreter), ())
+        return languages
+    
+    def by_alias(self, alias: str) -> tuple[str, ...]:
+        """Returns the languages with this alias or name (like 'cpp'), matched case insensitively"""
+        self._load()
+        return self._aliases.get(alias.lower(), ())
+    
+    def by_shebang(self, line: str) -> tuple[str, ...]:
+        """Returns the languages run by a shebang line like '#!/usr/bin/env python3'"""
+        if not line.startswith("#!"):
+            return ()
+        args = line[2:].split()
+        if not args:
+            return ()
+        interpreter = os.path.basename(args[0])
+        # Skip the options of env, like '#!/usr/bin/env -S python3 -u'
+        if interpreter == "env":
+            args = [a for a in args[1:] if not a.startswith("-") and "=" not in a]
+            if not args:
+                return ()
+            interpreter = os.path.basename(args[0])
+        return self.by_interpreter(interpreter)
+    
+    def by_path(self, path: str) -> tuple[str, ...]:
+        """Returns the languages of a file going by its name. Exact file names are tried first, then the extensions from the
+        longest to the shortest, so 'x.cmake.in' tries '.cmake.in' before '.in'"""
+        filename = os.path.basename(path)
+        languages = self.by_filename(filename)
+        if languages:
+            return languages
+        # Skip the leading dot of hidden files like '.bashrc', which is not an extension
+        i = filename.find(".", 1)
+        while i != -1:
+            languages = self.by_extension(filename[i:])
+            if languages:
+                return languages
+            i = filename.find(".", i + 1)
+        return ()
+
+INDEX = LanguageIndex(DATA_PATH)
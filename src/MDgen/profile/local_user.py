@@ -0,0 +1,107 @@
+### This module counts the languages of repositories that are checked out locally, as an offline alternative to GitUser
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from MDgen.profile.language_index import INDEX
+from MDgen.util import process_context
+
+# Directories that only contain vendored, generated or tooling files. These are skipped without looking inside
+IGNORED_DIRECTORIES = frozenset({
+    "node_modules", "bower_components", "jspm_packages", "vendor", "vendors", "third_party", "thirdparty", "3rdparty",
+    "external", "deps", "Pods", "Carthage", "dist", "build", "out", "target", "bin", "obj", "site-packages",
+    "__pycache__", "venv", "env", "coverage", "htmlcov",
+})
+
+# Generated files that should not count towards the languages of a repository
+IGNORED_SUFFIXES = (".min.js", ".min.css", ".js.map", ".css.map", "_pb2.py", ".pb.go", ".pb.cc", ".pb.h", "-lock.json", ".lock")
+
+# Github only counts these types of languages in the language statistics
+COUNTED_TYPES = ("programming", "markup")
+
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Hidden files and directories (like .git) are skipped, and symlinks are never followed
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks = False):
+                    if entry.name not in IGNORED_DIRECTORIES:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks = False) and not entry.name.endswith(IGNORED_SUFFIXES):
+                    yield entry
+
+def _read_shebang(path: str) -> str:
+    try:
+        with open(path, 'rb') as f:
+            return f.readline(256).decode('utf-8', errors = 'ignore').strip()
+    except OSError:
+        return ""
+
+def classify(path: str) -> str | None:
+    """Returns the most likely language of a file, going by its name and, for files without an extension, its shebang line"""
+    languages = INDEX.by_path(path)
+    if not languages and "." not in os.path.basename(path):
+        languages = INDEX.by_shebang(_read_shebang(path))
+    return languages[0] if languages else None
+
+def scan_repository(path: str) -> dict[str, int]:
+    """Returns the number of bytes of each language in the repository at path"""
+    languages: dict[str, int] = {}
+    for entry in _iter_files(path):
+        language = classify(entry.path)
+        if language is None or INDEX.language_type(language) not in COUNTED_TYPES:
+            continue
+        try:
+            size = entry.stat(follow_symlinks = False).st_size
+        except OSError:
+            continue
+        languages[language] = languages.get(language, 0) + size
+    return languages
+
+class LocalUser:
+    def __init__(self, *paths: str, processes: int | None = None):
+        """Counts the languages of repositories that are checked out on this machine, without any network access.
+        paths are the roots of the repositories. Each repository is scanned in its own process, use processes to limit the
+        number of processes (processes = 1 scans everything in this process). Like run_batch, a script using more than one
+        process needs an 'if __name__ == "__main__"' guard. The result has the same total_languages and
+        total_bytes as GitUser, so it can be used to make a GitPieChart"""
+        self.repos = [os.path.abspath(p) for p in paths]
+        
+        if processes == 1 or len(self.repos) <= 1:
+            results = [scan_repository(p) for p in self.repos]
+        else:
+            # This can be called from a thread (like the fetch stage of run_batch), so the processes are not forked
+            with ProcessPoolExecutor(max_workers = processes, mp_context = process_context()) as pool:
+                results = list(pool.map(scan_repository, self.repos))
+        
+        # Languages per repository path
+        self.repo_languages: dict[str, dict[str, int]] = dict(zip(self.repos, results))
+        
+        # Create the language information here
+        self.total_languages: dict[str, int] = {}
+        self.total_bytes = 0
+        for languages in results:
+            for k, v in languages.items():
+                self.total_languages[k] = self.total_languages.get(k, 0) + v
+                self.total_bytes += v
+    
+    @classmethod
+    def from_directory(cls, directory: str, processes: int | None = None) -> LocalUser:
+        """Scans every repository (every subdirectory containing a .git folder) directly inside directory"""
+        with os.scandir(directory) as it:
+            paths = sorted(e.path for e in it if e.is_dir() and os.path.exists(os.path.join(e.path, ".git")))
+        return cls(*paths, processes = processes)
+
+if __name__ == "__main__":
+    import sys
+    user = LocalUser(*(sys.argv[1:] or ["."]))
+    for k, v in sorted(user.total_languages.items(), key = lambda x: x[1], reverse = True):
+        print(f"{k}: {v}")
@@ -0,0 +1,155 @@
+### This module keeps track of the GitHub API rate limits of one or more auth tokens
+### Every response tells how many requests are left (X-RateLimit-Remaining) and when the budget is reset (X-RateLimit-Reset).
+### The scheduler hands out the tokens in turns, skips the ones that ran out until they are reset, and backs off with some
+### random jitter when GitHub answers with a secondary rate limit
+from __future__ import annotations
+import time
+import random
+import hashlib
+import threading
+from typing import Iterable
+
+# Used as the budget of a token before any of its responses have been seen
+DEFAULT_LIMIT = 5000
+
+class TokenBudget:
+    __slots__ = ("remaining", "limit", "reset_at", "blocked_until", "strikes")
+    def __init__(self):
+        self.remaining: int | None = None
+        self.limit = DEFAULT_LIMIT
+        self.reset_at = 0.
+        self.blocked_until = 0.
+        # Number of secondary rate limits in a row, for the exponential backoff
+        self.strikes = 0
+    
+    def ready_at(self, reserve: int) -> float:
+        """Returns the time from which the token can be used again"""
+        t = self.blocked_until
+        if self.remaining is not None and self.remaining <= reserve:
+            t = max(t, self.reset_at)
+        return t
+
+class RateLimitScheduler:
+    def __init__(self, tokens: str | None | Iterable[str | None], reserve: int = 0, max_retries: int = 5, base_backoff: float = 1., max_backoff: float = 120.):
+        """Hands out the auth tokens in turns while keeping each one within its rate limit. Tokens in a pool should be able to see
+        the same repositories, since any of them can be used for a request. A single token (or None for no authentication) works too
+        reserve is the number of requests left untouched on every token. Requests that hit a rate limit are retried up to max_retries times
+        Secondary rate limits without a Retry-After header are waited out for base_backoff seconds, doubling every time up to max_backoff"""
+        if tokens is None or isinstance(tokens, str):
+            tokens = [tokens]
+        # An empty token means the requests are not authenticated
+        self.tokens: list[str] = [t.strip() if t else "" for t in tokens]
+        if not self.tokens:
+            raise ValueError("The scheduler needs at least one token")
+        self.reserve = reserve
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._budgets: dict[tuple[int, str], TokenBudget] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def identity(self) -> str:
+        """A string that is the same for schedulers with the same tokens, without containing the tokens"""
+        return hashlib.sha256("\n".join(sorted(self.tokens)).encode('utf-8')).hexdigest()
+    
+    def _budget(self, i: int, resource: str) -> TokenBudget:
+        budget = self._budgets.get((i, resource))
+        if budget is None:
+            budget = self._budgets[(i, resource)] = TokenBudget()
+        return budget
+    
+    def try_acquire(self, resource: str = "core") -> tuple[str | None, float]:
+        """Picks the next token with budget left for the resource ('core' for REST, 'graphql' for GraphQL) without waiting.
+        Returns (token, 0) on success, or (None, seconds to wait) if every token has to wait. The token is empty for no authentication"""
+        with self._lock:
+            now = time.time()
+            n = len(self.tokens)
+            soonest = float("inf")
+            for k in range(n):
+                i = (self._next + k) % n
+                budget = self._budget(i, resource)
+                if budget.reset_at and budget.reset_at <= now:
+                    # The budget has been reset since we last heard of it
+                    budget.remaining = None
+                    budget.reset_at = 0.
+                ready_at = budget.ready_at(self.reserve)
+                if ready_at <= now:
+                    self._next = (i + 1) % n
+                    if budget.remaining is not None:
+                        budget.remaining -= 1
+                    return self.tokens[i], 0.
+                soonest = min(soonest, ready_at)
+            return None, soonest - now
+    
+    def acquire(self, resource: str = "core") -> str:
+        """Picks the next token with budget left for the resource, sleeping until one is available. The token is empty if the
+        requests should not be authenticated"""
+        while True:
+            token, wait = self.try_acquire(resource)
+            if token is not None:
+                return token
+            time.sleep(wait)
+    
+    def update(self, token: str, status: int, headers: dict[str, str], message: str = "", resource: str = "core") -> bool:
+        """Reads the rate limit headers of a response made with token. Returns True if the request hit a rate limit and should
+        be retried, in which case the token is held back until the limit is over
+        The header names have to be in lowercase, as given by github_api.lower_headers"""
+        i = self.tokens.index(token)
+        resource = headers.get("x-ratelimit-resource", resource)
+        with self._lock:
+            budget = self._budget(i, resource)
+            if "x-ratelimit-remaining" in headers:
+                budget.remaining = int(headers["x-ratelimit-remaining"])
+                budget.limit = int(headers.get("x-ratelimit-limit", budget.limit))
+                budget.reset_at = float(headers.get("x-ratelimit-reset", budget.reset_at))
+            
+            if status not in (403, 429):
+                budget.strikes = 0
+                return False
+            
+            now = time.time()
+            if "retry-after" in headers:
+                budget.blocked_until = now + float(headers["retry-after"])
+            elif budget.remaining == 0:
+                # The primary rate limit, wait for the reset
+                budget.blocked_until = max(budget.reset_at, now + 1)
+            elif status == 429 or "rate limit" in message.lower():
+                # A secondary rate limit without any hint of how long to wait
+                delay = min(self.max_backoff, self.base_backoff * 2 ** budget.strikes)
+                budget.blocked_until = now + delay / 2 + random.uniform(0, delay / 2)
+                budget.strikes += 1
+            else:
+                # Some other 403, like a missing permission
+                return False
+            return True
+    
+    def remaining(self, resource: str = "core") -> int:
+        """Returns the number of requests left on all the tokens together. Tokens without any responses yet count with the default limit"""
+        with self._lock:
+            now = time.time()
+            total = 0
+            for i in range(len(self.tokens)):
+                budget = self._budget(i, resource)
+                if budget.remaining is None or (budget.reset_at and budget.reset_at <= now):
+                    total += budget.limit
+                else:
+                    total += max(budget.remaining - self.reserve, 0)
+            return total
+    
+    def wait_time(self, resource: str = "core") -> float:
+        """Returns the number of seconds until a request for the resource can be made, 0 if it can be made right now"""
+        with self._lock:
+            now = time.time()
+            soonest = min(self._budget(i, resource).ready_at(self.reserve) for i in range(len(self.tokens)))
+            return max(soonest - now, 0.)
+
+def scheduler_for(auth_token: str | None, scheduler: RateLimitScheduler | None) -> RateLimitScheduler:
+    """The scheduler a client should use: the one given, or a new one for auth_token. A client takes one or the other,
+    since the token would not be used if both are given"""
+    if scheduler is None:
+        return RateLimitScheduler(auth_token)
+    if auth_token:
+        raise ValueError("Pass either an auth token or a scheduler, the scheduler uses its own tokens")
+    return scheduler
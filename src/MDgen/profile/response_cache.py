@@ -0,0 +1,141 @@
+### This module contains a disk backed cache for GitHub API responses
+### Cached responses are served without any request while they are younger than the ttl. After that they are revalidated
+### with a conditional request (If-None-Match / If-Modified-Since), and a 304 Not Modified answer reuses the cached body.
+### GitHub does not count 304 answers to authorized conditional requests against the rate limit
+from __future__ import annotations
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from MDgen.util import rm
+
+class CacheEntry:
+    __slots__ = ("body", "headers", "stored_at")
+    def __init__(self, body: Any, headers: dict[str, str], stored_at: float):
+        self.body = body
+        # The header names are in lowercase, as given by github_api.lower_headers
+        self.headers = headers
+        self.stored_at = stored_at
+    
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+    
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+class CacheStats:
+    """Counters of a ResponseCache. hits are served without any request, not_modified are revalidated with a 304 answer,
+    and misses need the full response"""
+    __slots__ = ("hits", "not_modified", "misses", "evictions")
+    def __init__(self):
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.not_modified + self.misses
+        return (self.hits + self.not_modified) / total if total else 0.
+    
+    def __repr__(self):
+        return f"CacheStats(hits={self.hits}, not_modified={self.not_modified}, misses={self.misses}, evictions={self.evictions})"
+
+class ResponseCache:
+    def __init__(self, directory: str, ttl: float = 60, max_bytes: int = 64 * 1024 * 1024):
+        """Caches API responses as files in directory. Responses younger than ttl seconds are used without asking GitHub.
+        When the files take more than max_bytes, the least recently used ones are deleted"""
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        
+        # File name -> size, from the least to the most recently used. The file modification times keep the order between runs
+        os.makedirs(directory, exist_ok = True)
+        with os.scandir(directory) as it:
+            files = [(e.stat().st_mtime, e.name, e.stat().st_size) for e in it if e.name.endswith(".json") and e.is_file()]
+        self._sizes: OrderedDict[str, int] = OrderedDict((name, size) for _, name, size in sorted(files))
+        self._total = sum(self._sizes.values())
+        self._evict()
+    
+    @staticmethod
+    def key(url: str, vary: str = "") -> str:
+        """Makes the cache key of an endpoint. vary should stand for the authorization (like RateLimitScheduler.identity),
+        since the same url can give different answers to different users"""
+        return hashlib.sha256(f"{vary}\n{url}".encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+    
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns the cached response, fresh or not, or None if nothing is cached for the key"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding = 'utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            if key + ".json" in self._sizes:
+                self._sizes.move_to_end(key + ".json")
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return CacheEntry(data["body"], data["headers"], data["stored_at"])
+    
+    def record(self, event: str):
+        """Counts a hit, not_modified or miss in the stats"""
+        with self._lock:
+            setattr(self.stats, event, getattr(self.stats, event) + 1)
+    
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+    
+    def put(self, key: str, body: Any, headers: dict[str, str]):
+        """Stores a response. Only responses with an ETag or Last-Modified header are useful after the ttl, but everything is stored"""
+        name = key + ".json"
+        data = json.dumps({"stored_at": time.time(), "headers": headers, "body": body}, separators = (',', ':')).encode('utf-8')
+        fd, tmp = tempfile.mkstemp(dir = self.directory, prefix = ".", suffix = ".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            rm(tmp)
+            raise
+        with self._lock:
+            self._total += len(data) - self._sizes.pop(name, 0)
+            self._sizes[name] = len(data)
+            self._evict()
+    
+    def _evict(self):
+        while self._total > self.max_bytes and len(self._sizes) > 1:
+            name, size = self._sizes.popitem(last = False)
+            self._total -= size
+            self.stats.evictions += 1
+            rm(os.path.join(self.directory, name))
+    
+    def invalidate(self, key: str | None = None):
+        """Deletes the cached response of the key, or everything if no key is given"""
+        with self._lock:
+            names = [key + ".json"] if key is not None else list(self._sizes)
+            for name in names:
+                self._total -= self._sizes.pop(name, 0)
+                rm(os.path.join(self.directory, name))
+    
+    @property
+    def size(self) -> int:
+        """Total size of the cached responses in bytes"""
+        return self._total
+    
+    def __len__(self) -> int:
+        return len(self._sizes)
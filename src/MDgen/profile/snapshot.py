@@ -0,0 +1,65 @@
+### This module saves what was fetched for a user to a file, so the charts can be made again later without the network
+from __future__ import annotations
+import json
+from typing import TYPE_CHECKING, Any
+
+from MDgen.profile.gituser import Repository, sum_languages
+from MDgen.util import write_if_changed
+
+if TYPE_CHECKING:
+    from MDgen.profile.gituser import GitUser
+    from MDgen.profile.async_gituser import AsyncGitUser
+    from MDgen.profile.local_user import LocalUser
+
+SNAPSHOT_VERSION = 1
+
+class GitSnapshot:
+    def __init__(self, repos: list[Repository], username: str | None = None, total_languages: dict[str, int] | None = None, total_bytes: int | None = None):
+        """The repositories of a user and their languages, without any connection to github
+        It has the same total_languages, total_bytes, repos and repo_languages as a GitUser, so it can be given to GitPieChart
+        instead of one. The totals are added up from the repos if they are not given"""
+        self.username = username
+        self.repos = repos
+        if total_languages is None or total_bytes is None:
+            total_languages, total_bytes = sum_languages(self.repo_languages.values())
+        self.total_languages = total_languages
+        self.total_bytes = total_bytes
+
+    @classmethod
+    def from_user(cls, user: GitUser | AsyncGitUser | LocalUser) -> GitSnapshot:
+        """Takes the data of a user that was already fetched"""
+        repos = user.repos
+        if not all(isinstance(repo, Repository) for repo in repos):
+            # LocalUser only knows the paths of its repositories
+            repos = [Repository(name, name, None, languages = languages) for name, languages in user.repo_languages.items()]
+        return cls(list(repos), getattr(user, "username", None), dict(user.total_languages), user.total_bytes)
+
+    @property
+    def repo_languages(self) -> dict[str, dict[str, int]]:
+        return {repo.full_name: repo.languages for repo in self.repos if repo.languages is not None}
+
+    def save(self, path: str) -> bool:
+        """Writes the snapshot to path as JSON. The file is left alone if it already holds the same data
+        Returns true if the file was written"""
+        data: dict[str, Any] = {
+            "version": SNAPSHOT_VERSION,
+            "username": self.username,
+            "total_languages": self.total_languages,
+            "total_bytes": self.total_bytes,
+            # One list per repository instead of objects, so the field names are not repeated
+            "repos": [[r.name, r.full_name, r.pushed_at, r.fork, r.archived, r.languages] for r in self.repos]
+        }
+        return write_if_changed(path, lambda: [json.dumps(data, separators = (',', ':'))])
+
+    @classmethod
+    def load(cls, path: str) -> GitSnapshot:
+        """Reads a snapshot written by save. Raises a ValueError if the file is not a snapshot of this version"""
+        with open(path, 'r', encoding = 'utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} snapshot")
+        repos = [Repository(*fields) for fields in data["repos"]]
+        return cls(repos, data["username"], data["total_languages"], data["total_bytes"])
+
+    def __repr__(self):
+        return f"GitSnapshot({self.username!r}, {len(self.repos)} repos, {self.total_bytes} bytes)"
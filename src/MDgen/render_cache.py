@@ -0,0 +1,129 @@
+## This file contains the render cache shared by all the read me nodes of the process
+## Nodes that are made from the same inputs (the same image, the same link, the same chart...) render to the same text,
+## so the text is kept here under a key made from those inputs and reused by every other node with the same key,
+## even if it lives in another document
+## The keys are digests of those inputs, so they stay small and values that compare equal but render differently
+## (like 1, 1.0 and True) get different keys
+
+from __future__ import annotations
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+def make_key(fields: Any) -> bytes:
+    """Digest of the inputs of a node (usually a tuple of them). Every value is hashed along with its type"""
+    h = hashlib.blake2b(digest_size = 16)
+    _feed(h, fields)
+    return h.digest()
+
+def _feed(h: Any, value: Any):
+    # Everything is prefixed with a tag and a length so that different inputs can not run into each other
+    if isinstance(value, tuple | list):
+        h.update(b"(%d:" % len(value))
+        for v in value:
+            _feed(h, v)
+        return
+    if isinstance(value, str):
+        tag, data = b"s", value.encode("utf-8", "surrogatepass")
+    elif isinstance(value, bytes):
+        tag, data = b"b", value
+    elif isinstance(value, type):
+        tag, data = b"t", f"{value.__module__}.{value.__qualname__}".encode()
+    else:
+        t = type(value)
+        tag, data = b"r", f"{t.__module__}.{t.__qualname__}:{value!r}".encode("utf-8", "surrogatepass")
+    h.update(b"%s%d:" % (tag, len(data)))
+    h.update(data)
+
+class RenderCacheStats:
+    """Counters of a RenderCache. hits are lookups that found the text, misses are lookups that did not,
+    and evictions are texts dropped to stay under the size limit"""
+    __slots__ = ("hits", "misses", "evictions")
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+    def __repr__(self):
+        return f"RenderCacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+class RenderCache:
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, max_entry_bytes: int | None = None):
+        """Least recently used cache of rendered text. When the texts take more than max_bytes of memory, the least
+        recently used ones are dropped (their keys are counted too). Texts bigger than max_entry_bytes (an eighth of max_bytes by default) are not kept,
+        so a single big document can not push out everything else. Setting max_bytes to 0 turns the cache off"""
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 8 if max_entry_bytes is None else max_entry_bytes
+        self.stats = RenderCacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._total = 0
+
+    @staticmethod
+    def sizeof(text: str) -> int:
+        return sys.getsizeof(text)
+    
+    def _entry_size(self, key: Hashable, text: str) -> int:
+        return sys.getsizeof(key) + self.sizeof(text)
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return text
+
+    def put(self, key: Hashable, text: str) -> bool:
+        """Keeps the text under key. Returns false if it is too big to be kept"""
+        size = self._entry_size(key, text)
+        if size > self.max_entry_bytes or size > self.max_bytes:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= self._entry_size(key, old)
+            self._entries[key] = text
+            self._total += size
+            while self._total > self.max_bytes:
+                dropped_key, dropped = self._entries.popitem(last = False)
+                self._total -= self._entry_size(dropped_key, dropped)
+                self.stats.evictions += 1
+        return True
+
+    def invalidate(self, key: Hashable | None = None):
+        """Drops the text under key, or everything if no key is given. The counters are kept"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._total = 0
+            else:
+                text = self._entries.pop(key, None)
+                if text is not None:
+                    self._total -= self._entry_size(key, text)
+
+    @property
+    def size(self) -> int:
+        """Bytes taken by the cached texts and their keys"""
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self):
+        return f"RenderCache({len(self)} texts, {self._total} bytes, {self.stats})"
+
+# The cache used by all the nodes. Replace its limits or call RENDER_CACHE.invalidate() to empty it
+RENDER_CACHE = RenderCache()
@@ -1,12 +1,78 @@
 import os
-import numpy as np
-from typing import TypeVar
+import sys
+import stat
+import hashlib
+import importlib
+from typing import Any, Callable, Iterable, TypeVar
 
 # Remove a file if it exists
 def rm(filename: str):
     if os.path.exists(filename):
         os.remove(filename)    
 
+def _hash_chunks(chunks: Iterable[str], encoding: str) -> tuple[int, bytes]:
+    h = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode(encoding)
+        h.update(data)
+        size += len(data)
+    return size, h.digest()
+
+def _hash_file(filename: str) -> bytes:
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        while block := f.read(1 << 16):
+            h.update(block)
+    return h.digest()
+
+def _create_temp(filename: str) -> tuple[int, str]:
+    # Made next to the file so it can be moved in place. Unlike mkstemp (which makes it 0o600), it is opened with
+    # 0o666 and the kernel takes the umask off, like for any other new file
+    directory, name = os.path.split(os.path.abspath(filename))
+    while True:
+        tmp = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666), tmp
+        except FileExistsError:
+            continue
+
+def write_if_changed(filename: str, chunks: Callable[[], Iterable[str]], encoding: str = "utf-8") -> bool:
+    """Writes the text chunks into the file, but only if the file content would change. chunks is called to get a fresh
+    iterable of chunks, once to hash the new content and once more to write it if it differs from the file on disk.
+    The file is written to a temporary file first and then moved in place, so the file is never missing or half written.
+    Returns True if the file is written and False if it is left untouched"""
+    size, digest = _hash_chunks(chunks(), encoding)
+    
+    # Compare the sizes first so we only read the old file when it could possibly be the same
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        st = None
+    if st is not None and st.st_size == size and _hash_file(filename) == digest:
+        return False
+    
+    fd, tmp = _create_temp(filename)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks():
+                f.write(chunk.encode(encoding))
+        # A new file gets the usual permissions from the umask when it is created, a replaced one keeps its own
+        if st is not None:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.replace(tmp, filename)
+    except BaseException:
+        rm(tmp)
+        raise
+    return True
+
+def process_context() -> Any:
+    """The multiprocessing context for the process pools. Processes are started fresh with forkserver (or spawn where there
+    is no forkserver) instead of being forked, since forking a process that runs threads can leave locks held in the child
+    Scripts that make a pool this way need an 'if __name__ == "__main__"' guard"""
+    import multiprocessing
+    return multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
 _copyable = TypeVar("_copyable")
 def copy(obj: _copyable) -> _copyable:
     """Makes a deep copy via the dunder copy method in a class. If the parameter is a list, returns the recursive deep copy"""
@@ -22,10 +88,31 @@ def copy(obj: _copyable) -> _copyable:
     if isinstance(obj, dict):
         return {copy(k): copy(v) for k, v in obj.items()} #type: ignore
     
-    if isinstance(obj, np.ndarray):
+    # Numpy is only looked up if it is already imported, since nothing can be an array otherwise
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, np.ndarray):
         return np.array(obj, dtype = obj.dtype)
     
     if "__copy__" in dir(obj):
         return obj.__copy__() #type: ignore
     
     raise TypeError(f"Object of type {type(obj).__name__} is not copyable!")
+
+def lazy_attributes(module_name: str, attributes: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Makes the module level __getattr__ and __dir__ for a package whose attributes are only imported on first use
+    attributes maps each attribute name to the module that defines it. Usage:
+    __getattr__, __dir__ = lazy_attributes(__name__, {"ReadMe": "MDgen.base"})"""
+    module = sys.modules[module_name]
+    
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(attributes[name]), name)
+        # Cache it on the module so __getattr__ is not called for this name again
+        setattr(module, name, value)
+        return value
+    
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(attributes))
+    
+    return __getattr__, __dir__
@@ -0,0 +1,139 @@
+## A stand-in GitHub API server for the tests, serving the repositories in fixtures/ on localhost
+## It answers the few endpoints GitUser uses: the paginated repository list, the languages of a repository and GraphQL
+## The answers can be bent to test the client: smaller pages, lowercase header names, or repositories whose requests fail
+
+import os
+import json
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixture(name: str):
+    with open(os.path.join(FIXTURES, name), 'r', encoding = 'utf-8') as f:
+        return json.load(f)
+
+class FakeGitHub:
+    def __init__(self, per_page: int = 3, lowercase_headers: bool = False, failing: set[str] | None = None):
+        """Serves fixtures/repos.json over REST and fixtures/graphql_repositories.json over GraphQL
+        per_page caps the size of the repository pages so the list takes a few pages. With lowercase_headers the header
+        names are sent in lowercase, like some proxies and HTTP/2 servers do. The languages of the repositories in failing
+        (by full name) answer with a 500 error"""
+        fixture = load_fixture("repos.json")
+        self.login = fixture["login"]
+        self.repos = fixture["repos"]
+        self.graphql_pages = load_fixture("graphql_repositories.json")["pages"]
+        self.per_page = per_page
+        self.lowercase_headers = lowercase_headers
+        self.failing = failing or set()
+        # Method and path of every request, in the order they came
+        self.requests: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target = self._server.serve_forever, daemon = True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def count(self, path_prefix: str) -> int:
+        """Number of requests made to paths starting with path_prefix"""
+        with self._lock:
+            return sum(path.startswith(path_prefix) for _, path in self.requests)
+
+    def start(self) -> "FakeGitHub":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def expected_languages(self, skip: set[str] = frozenset()) -> tuple[dict[str, int], int]:
+        """The totals GitUser should come up with, leaving out the repositories in skip"""
+        total: dict[str, int] = {}
+        for repo in self.repos:
+            if repo["full_name"] not in skip:
+                for k, v in repo["languages"].items():
+                    total[k] = total.get(k, 0) + v
+        return total, sum(total.values())
+
+    def _repos_page(self, query: dict[str, list[str]]) -> tuple[list, dict[str, str]]:
+        per_page = min(int(query.get("per_page", ["30"])[0]), self.per_page)
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * per_page
+        items = [
+            dict({k: v for k, v in repo.items() if k != "languages"}, languages_url = f"{self.base_url}/repos/{repo['full_name']}/languages")
+            for repo in self.repos[start:start + per_page]
+        ]
+        headers = {}
+        last = max((len(self.repos) + per_page - 1) // per_page, 1)
+        if page < last:
+            url = f"{self.base_url}/user/repos?per_page={per_page}"
+            headers["Link"] = f'<{url}&page={page + 1}>; rel="next", <{url}&page={last}>; rel="last"'
+        return items, headers
+
+    def _graphql_page(self, variables: dict) -> dict:
+        after = variables.get("after")
+        if after is None:
+            return self.graphql_pages[0]
+        for i, page in enumerate(self.graphql_pages[:-1]):
+            if page["data"]["viewer"]["repositories"]["pageInfo"]["endCursor"] == after:
+                return self.graphql_pages[i + 1]
+        return {"data": None, "errors": [{"message": f"Unknown cursor {after}"}]}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def reply(self, status: int, body, headers: dict[str, str] | None = None):
+                data = json.dumps(body).encode('utf-8')
+                etag = '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+                headers = {"ETag": etag, "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "0", **(headers or {})}
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    status, data = 304, b""
+                self.send_response(status)
+                if status != 304:
+                    headers["Content-Type"] = "application/json"
+                    headers["Content-Length"] = str(len(data))
+                for k, v in headers.items():
+                    self.send_header(k.lower() if fake.lowercase_headers else k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                with fake._lock:
+                    fake.requests.append(("GET", url.path))
+                if url.path == "/user/repos":
+                    self.reply(200, *fake._repos_page(parse_qs(url.query)))
+                    return
+                parts = url.path.strip("/").split("/")
+                if len(parts) == 4 and parts[0] == "repos" and parts[3] == "languages":
+                    full_name = f"{parts[1]}/{parts[2]}"
+                    repo = next((r for r in fake.repos if r["full_name"] == full_name), None)
+                    if full_name in fake.failing:
+                        self.reply(500, {"message": "Server Error"})
+                    elif repo is None:
+                        self.reply(404, {"message": "Not Found"})
+                    else:
+                        self.reply(200, repo["languages"])
+                    return
+                self.reply(404, {"message": "Not Found"})
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                with fake._lock:
+                    fake.requests.append(("POST", url.path))
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                if url.path != "/graphql":
+                    self.reply(404, {"message": "Not Found"})
+                    return
+                self.reply(200, fake._graphql_page(body.get("variables") or {}))
+
+        return Handler
@@ -0,0 +1,69 @@
+import os
+import stat
+
+import pytest
+
+from MDgen.base import ReadMe, Point
+from MDgen.render_cache import RENDER_CACHE
+
+def test_extend_with_failing_generator():
+    doc = ReadMe("# T\n")
+    assert doc.content == "# T\n"
+    def points():
+        yield Point("a")
+        raise RuntimeError("broken generator")
+    with pytest.raises(RuntimeError):
+        doc.extend(points())
+    assert doc.content == "# T\n- a"
+
+def test_child_in_two_parents():
+    point = Point("x")
+    first = ReadMe("a\n").add(point)
+    second = ReadMe("b\n").add(point)
+    assert (first.content, second.content) == ("a\n- x", "b\n- x")
+    point._content = "y"
+    assert (first.content, second.content) == ("a\n- y", "b\n- y")
+
+class CountingSection(ReadMe):
+    renders = 0
+
+    def render_chunks(self):
+        CountingSection.renders += 1
+        yield from super().render_chunks()
+
+@pytest.fixture
+def no_render_cache():
+    # Only the caches of the nodes themselves are left
+    max_bytes, max_entry_bytes = RENDER_CACHE.max_bytes, RENDER_CACHE.max_entry_bytes
+    RENDER_CACHE.max_bytes = RENDER_CACHE.max_entry_bytes = 0
+    RENDER_CACHE.invalidate()
+    yield
+    RENDER_CACHE.max_bytes, RENDER_CACHE.max_entry_bytes = max_bytes, max_entry_bytes
+
+@pytest.mark.parametrize("render", [lambda doc: doc.content, lambda doc: "".join(doc.iter_chunks())])
+def test_only_the_changed_section_is_rendered_again(no_render_cache, render):
+    sections = [CountingSection(f"## {s}\n").extend((Point(f"{s}.{i}") for i in range(20)), newline = True) for s in range(10)]
+    doc = ReadMe("# T\n").extend(sections)
+    CountingSection.renders = 0
+    first = render(doc)
+    assert CountingSection.renders == 10
+    sections[3].add(Point("new"))
+    second = render(doc)
+    assert CountingSection.renders == 11
+    assert second == first.replace("- 3.19\n", "- 3.19\n- new")
+
+def test_export_permissions(tmp_path):
+    path = tmp_path / "README.md"
+    umask = os.umask(0o022)
+    try:
+        assert ReadMe("a").export(str(path))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+        path.chmod(0o600)
+        assert ReadMe("b").export(str(path))
+        # A replaced file keeps its permissions
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert not ReadMe("b").export(str(path))
+    finally:
+        os.umask(umask)
+    assert path.read_text() == "b"
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
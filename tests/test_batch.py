@@ -0,0 +1,39 @@
+import pytest
+
+from MDgen.profile.batch import ProfileJob, run_batch
+from MDgen.profile.git_piechart import GitPieChart
+from MDgen.profile.gituser import GitUser
+from MDgen.profile.rate_limit import RateLimitScheduler
+
+def test_batch_writes_every_profile(fake_github, tmp_path):
+    jobs = [ProfileJob(str(tmp_path / f"u{i}" / "README.md"), auth_token = f"t{i}") for i in range(5)]
+    result = run_batch(jobs, base_url = fake_github.base_url, fetch_workers = 2, render_processes = 1, queue_size = 1)
+    assert result.errors == {}
+    assert sorted(result.written) == sorted(job.output_path for job in jobs)
+    expected = GitPieChart(GitUser("t0", 4, fake_github.base_url), 150, False).content
+    assert (tmp_path / "u0" / "README.md").read_text() == expected
+
+def test_failed_export_does_not_stop_the_batch(fake_github, tmp_path):
+    # More jobs than fit in the queues, with one that can not be written
+    jobs = [ProfileJob(str(tmp_path / f"u{i}.md"), auth_token = f"t{i}") for i in range(12)]
+    jobs[3] = ProfileJob(123, auth_token = "t3") # type: ignore
+    result = run_batch(jobs, base_url = fake_github.base_url, fetch_workers = 2, render_processes = 1, queue_size = 1)
+    assert list(result.errors) == [123]
+    assert isinstance(result.errors[123], TypeError)
+    assert len(result.written) == 11
+
+def test_failing_jobs_are_raised_after_the_rest(fake_github, tmp_path):
+    def jobs():
+        for i in range(3):
+            yield ProfileJob(str(tmp_path / f"u{i}.md"), auth_token = f"t{i}")
+        raise KeyError("broken job list")
+    with pytest.raises(KeyError):
+        run_batch(jobs(), base_url = fake_github.base_url, fetch_workers = 2, render_processes = 1, queue_size = 1)
+    # The jobs read before the failure are still made
+    assert all((tmp_path / f"u{i}.md").exists() for i in range(3))
+
+def test_token_jobs_do_not_use_the_shared_scheduler(fake_github, tmp_path):
+    jobs = [ProfileJob(str(tmp_path / "u.md"), auth_token = "own")]
+    result = run_batch(jobs, base_url = fake_github.base_url, scheduler = RateLimitScheduler(["pool"]), render_processes = 1)
+    assert result.errors == {}
+    assert result.written == [jobs[0].output_path]
@@ -0,0 +1,27 @@
+import pytest
+
+from MDgen.chart.chart_table import ChartTable
+from MDgen.chart.chartinfo import ChartInfo
+from MDgen.chart.colorinfo import ColorInfo
+from MDgen.chart.piechart import PieChart
+
+def entries(*amounts):
+    return [ChartInfo(a, ColorInfo("#123456", f"E{i}")) for i, a in enumerate(amounts)]
+
+def test_others_counts_against_max_slices():
+    chart = PieChart(100, entries(5, 1, 3, 3, 2), max_slices = 2, min_ratio = 0.2, ignore_key = lambda c, f: c.color.name == "E0")
+    assert chart.table.names == ["E2", "Others"]
+    assert chart.table.amounts.tolist() == [3., 11.]
+
+@pytest.mark.parametrize("kwargs", [{"max_slices": 0}, {"max_slices": -1}, {"min_ratio": -0.1}, {"min_ratio": 1.5}])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        PieChart(100, entries(5, 1, 3), **kwargs)
+
+def test_generator_with_ignore_key():
+    chart = PieChart(100, (e for e in entries(5, 1, 3)), ignore_key = lambda c, f: f < 0.2)
+    assert chart.table.names == ["E0", "E2", "Others"]
+
+def test_invalid_color_in_table():
+    with pytest.raises(ValueError):
+        ChartTable([1, 2], ["#123456", "red"], ["a", "b"])
@@ -0,0 +1,77 @@
+import pytest
+
+from fake_github import FakeGitHub
+from MDgen.profile.github_api import GitHubError
+from MDgen.profile.gituser import GitUser, Repository
+from MDgen.profile.rate_limit import RateLimitScheduler
+from MDgen.profile.response_cache import ResponseCache
+
+def test_rest_follows_every_page(fake_github):
+    user = GitUser("token", 4, fake_github.base_url)
+    assert [r.full_name for r in user.repos] == [r["full_name"] for r in fake_github.repos]
+    # 7 repositories, 3 per page
+    assert fake_github.count("/user/repos") == 3
+    assert (user.total_languages, user.total_bytes) == fake_github.expected_languages()
+    assert user.errors == {}
+
+def test_lowercase_headers():
+    server = FakeGitHub(lowercase_headers = True).start()
+    try:
+        user = GitUser("token", 4, server.base_url)
+        assert len(user.repos) == len(server.repos)
+        assert (user.total_languages, user.total_bytes) == server.expected_languages()
+    finally:
+        server.stop()
+
+def test_failed_repository_is_left_out():
+    failing = "octo-dev/raytracer"
+    server = FakeGitHub(failing = {failing}).start()
+    try:
+        user = GitUser("token", 4, server.base_url)
+    finally:
+        server.stop()
+    assert list(user.errors) == [failing]
+    assert isinstance(user.errors[failing], GitHubError) and user.errors[failing].status == 500
+    # The repository is still listed, only its languages are missing
+    assert len(user.repos) == len(server.repos)
+    assert failing not in user.repo_languages
+    assert (user.total_languages, user.total_bytes) == server.expected_languages(skip = {failing})
+
+def test_graphql_matches_rest(fake_github):
+    rest = GitUser("token", 4, fake_github.base_url)
+    graphql = GitUser("token", base_url = fake_github.base_url, use_graphql = True)
+    # Both pages of the recorded answers, and nothing else
+    assert fake_github.count("/graphql") == 2
+    assert fake_github.count("/repos/") == len(fake_github.repos)
+    assert graphql.total_languages == rest.total_languages
+    assert graphql.total_bytes == rest.total_bytes
+    assert graphql.repo_languages == rest.repo_languages
+    assert [(r.name, r.pushed_at, r.fork, r.archived) for r in graphql.repos] == [(r.name, r.pushed_at, r.fork, r.archived) for r in rest.repos]
+
+def test_cache_revalidates_with_lowercase_etag(tmp_path):
+    server = FakeGitHub(lowercase_headers = True).start()
+    try:
+        cache = ResponseCache(str(tmp_path), ttl = 0)
+        first = GitUser("token", 4, server.base_url, cache = cache)
+        second = GitUser("token", 4, server.base_url, cache = cache)
+    finally:
+        server.stop()
+    assert second.total_languages == first.total_languages
+    # Every request of the second user got a 304 answer
+    assert cache.stats.not_modified == cache.stats.misses
+
+def test_token_and_scheduler_are_exclusive(fake_github):
+    with pytest.raises(ValueError):
+        GitUser("token", base_url = fake_github.base_url, scheduler = RateLimitScheduler(["a", "b"]))
+    user = GitUser(None, base_url = fake_github.base_url, scheduler = RateLimitScheduler(["a", "b"]))
+    assert len(user.repos) == len(fake_github.repos)
+
+def test_pygithub_compatibility(fake_github):
+    user = GitUser("token", 4, fake_github.base_url)
+    repo = user.repos[0]
+    assert isinstance(repo, Repository)
+    assert repo.get_languages() == fake_github.repos[0]["languages"]
+    github = pytest.importorskip("github")
+    # Only made when asked for, and never used here so nothing is sent to GitHub
+    assert isinstance(user.g, github.Github)
+    assert user.g is user.g
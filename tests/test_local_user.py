@@ -0,0 +1,19 @@
+from MDgen.profile.local_user import LocalUser
+
+def make_repository(root, files):
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text(text)
+    return str(root)
+
+def test_processes_give_the_same_totals(tmp_path):
+    repos = [
+        make_repository(tmp_path / "a", {"main.py": "print(1)\n" * 10, "lib/util.c": "int x;\n" * 5}),
+        make_repository(tmp_path / "b", {"app.js": "let a = 1\n" * 7, "node_modules/dep/index.js": "x\n" * 100}),
+    ]
+    serial = LocalUser(*repos, processes = 1)
+    parallel = LocalUser(*repos, processes = 2)
+    assert parallel.total_languages == serial.total_languages
+    assert parallel.total_bytes == serial.total_bytes
+    assert serial.total_languages == {"Python": 90, "C": 35, "JavaScript": 70}
@@ -0,0 +1,67 @@
+import pytest
+
+from MDgen import base
+from MDgen.base import Hyperlink, Image, Point, ReadMe, Tagged
+from MDgen.render_cache import RENDER_CACHE, RenderCache, make_key
+
+@pytest.fixture
+def render_cache():
+    RENDER_CACHE.invalidate()
+    yield RENDER_CACHE
+    RENDER_CACHE.invalidate()
+
+def test_identical_nodes_share_their_output(render_cache):
+    assert Hyperlink("MDgen", "https://github.com").content == "[MDgen](https://github.com)"
+    hits = render_cache.stats.hits
+    assert Hyperlink("MDgen", "https://github.com").content == "[MDgen](https://github.com)"
+    assert render_cache.stats.hits == hits + 1
+
+def test_values_of_other_types_do_not_collide(render_cache):
+    assert [Hyperlink(text, "u").content for text in (1, 1.0, True, "1")] == ["[1](u)", "[1.0](u)", "[True](u)", "[1](u)"]
+    assert len({make_key((1,)), make_key((1.0,)), make_key((True,)), make_key(("1",))}) == 4
+
+def test_only_shared_nodes_are_kept(render_cache):
+    doc = ReadMe("# T\n").extend((Point(f"item {i}") for i in range(100)), newline = True)
+    doc.add(Image("https://github.com", "icon.svg"))
+    doc.content
+    # Just the image, the bullets and the document only cache their output for themselves
+    assert len(render_cache) == 1
+
+def test_keys_are_made_once(render_cache, monkeypatch):
+    calls = 0
+    def counting_make_key(fields):
+        nonlocal calls
+        calls += 1
+        return make_key(fields)
+    monkeypatch.setattr(base, "make_key", counting_make_key)
+    inner = Tagged("", "b", "").extend(Point(f"{i}") for i in range(10))
+    outer = Tagged("", "details", "").add(inner)
+    outer.content
+    # outer, inner and its 10 points, each hashed once
+    assert calls == 12
+    outer.content
+    inner.invalidate()
+    outer.content
+    # Only inner and outer changed
+    assert calls == 14
+
+def test_least_recently_used_texts_are_evicted():
+    text = "x" * 100
+    cache = RenderCache(max_bytes = 10_000, max_entry_bytes = 10_000)
+    keys = [make_key(i) for i in range(3)]
+    cache.put(keys[0], text)
+    per_entry = cache.size
+    # The key is counted along with the text
+    assert per_entry > RenderCache.sizeof(text)
+    cache.max_bytes = 2 * per_entry
+    cache.put(keys[1], text)
+    cache.get(keys[0])
+    cache.put(keys[2], text)
+    assert keys[0] in cache and keys[2] in cache and keys[1] not in cache
+    assert cache.stats.evictions == 1
+    assert cache.size == 2 * per_entry
+
+def test_big_texts_are_not_kept():
+    cache = RenderCache(max_bytes = 1000)
+    assert not cache.put(make_key("big"), "x" * 500)
+    assert len(cache) == 0 and cache.size == 0